@@ -1,5 +1,6 @@
 from django.contrib import admin
 from core.models import AuditLog
+from core.utilities.audit_export import stream_audit_export
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
@@ -18,7 +19,7 @@ class AuditLogAdmin(admin.ModelAdmin):
     )
     search_fields = (
         'entity_name', 'description', 'business_process', 'transaction_id',
-        'session_id', 'created_by__username', 'created_by__email'
+        'context__session_id', 'created_by__username', 'created_by__email'
     )
     readonly_fields = (
         'id', 'created_at', 'updated_at', 'created_by', 'updated_by',
@@ -103,9 +104,7 @@ class AuditLogAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         """Optimize queryset with select_related for better performance."""
-        return super().get_queryset(request).select_related(
-            'created_by', 'updated_by', 'tenant'
-        )
+        return super().get_queryset(request).select_related('tenant', 'context')
     
     def has_add_permission(self, request):
         """Audit logs should not be manually created."""
@@ -161,30 +160,8 @@ class AuditLogAdmin(admin.ModelAdmin):
     actions = ['export_audit_logs', 'mark_high_risk_reviewed']
     
     def export_audit_logs(self, request, queryset):
-        """Export selected audit logs to CSV."""
-        import csv
-        from django.http import HttpResponse
-        from django.utils import timezone
-        
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="audit_logs_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'ID', 'Entity Type', 'Entity Name', 'Activity Type', 'Description',
-            'Created By', 'Created At', 'Risk Level', 'Compliance Category',
-            'IP Address', 'Session ID', 'Transaction ID'
-        ])
-        
-        for log in queryset.select_related('created_by'):
-            writer.writerow([
-                log.id, log.entity_type, log.entity_name, log.activity_type,
-                log.description, log.created_by.username if log.created_by else '',
-                log.created_at, log.risk_level, log.compliance_category,
-                log.ip_address, log.session_id, log.transaction_id
-            ])
-        
-        return response
+        """Stream the selected audit logs as CSV."""
+        return stream_audit_export(queryset)
     export_audit_logs.short_description = "Export selected audit logs to CSV"
     
     def mark_high_risk_reviewed(self, request, queryset):
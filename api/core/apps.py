@@ -0,0 +1,22 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_migrate, post_save
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+
+    def ready(self):
+        from core.utilities.audit_search import restore_audit_search_index
+        from core.utilities.caching import invalidate_cached_regions
+        from core.utilities.option_cache import invalidate_cached_options
+        from core.utilities.response_cache import invalidate_cached_responses
+
+        post_save.connect(invalidate_cached_responses, dispatch_uid="response_cache_save")
+        post_delete.connect(invalidate_cached_responses, dispatch_uid="response_cache_delete")
+        post_save.connect(invalidate_cached_options, dispatch_uid="option_cache_save")
+        post_delete.connect(invalidate_cached_options, dispatch_uid="option_cache_delete")
+        post_save.connect(invalidate_cached_regions, dispatch_uid="cache_regions_save")
+        post_delete.connect(invalidate_cached_regions, dispatch_uid="cache_regions_delete")
+        # Migrations that rebuild core_auditlog on SQLite drop the search triggers
+        post_migrate.connect(restore_audit_search_index, sender=self, dispatch_uid="audit_search_restore")
@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from core.utilities.audit_archive import archive_audit_logs
+
+
+class Command(BaseCommand):
+    help = 'Move audit logs older than the retention window into compressed monthly archives'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months',
+            type=int,
+            default=getattr(settings, 'AUDIT_LOG_ARCHIVE_AFTER_MONTHS', 12),
+            help='Archive whole months that ended more than this many months ago',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.localtime()
+        cutoff = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        for _ in range(options['months']):
+            cutoff = (cutoff - timedelta(days=1)).replace(day=1)
+
+        archives = archive_audit_logs(cutoff)
+        row_count = sum(archive.row_count for archive in archives)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully archived {row_count} audit logs before {cutoff:%Y-%m-%d} into {len(archives)} files'
+            )
+        )
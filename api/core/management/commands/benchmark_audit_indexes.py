@@ -0,0 +1,186 @@
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+from django.utils import timezone
+from core.models import AuditLog, Tenant
+
+# AuditLog.Meta.indexes before the rationalization, kept for comparison
+LEGACY_INDEXES = [
+    ['tenant'],
+    ['entity_type', 'entity_id'],
+    ['activity_type'],
+    ['created_by'],
+    ['created_at'],
+    ['context'],  # Was session_id, now interned in RequestContext
+    ['transaction_id'],
+    ['compliance_category'],
+    ['risk_level'],
+    ['tenant', 'entity_type'],
+    ['tenant', 'entity_type', 'entity_id'],
+    ['tenant', 'activity_type'],
+    ['tenant', 'created_by'],
+    ['entity_type', 'activity_type'],
+]
+
+ENTITY_TYPES = ['ticket', 'case', 'job', 'person', 'organization', 'relation']
+ACTIVITY_TYPES = ['created', 'updated', 'status_changed', 'deleted']
+WORK_ITEM_TYPES = ['workitem', 'ticket', 'case', 'job']
+# One session for every row, so inserts reuse a single interned request context
+SESSION_ID = 'benchmark'
+
+# Tenant scoped access paths of the audit viewsets, as (name, fields matched
+# exactly, fields matched against a list, whether created_at is bounded).
+# Every pattern reads newest first.
+QUERY_PATTERNS = [
+    ('work item audit list', [], ['entity_type'], False),
+    ('entity history', ['entity_type', 'entity_id'], [], False),
+    ('activity filter', ['activity_type'], ['entity_type'], False),
+    ('period filter', [], [], True),
+    ('user filter', ['created_by'], [], False),
+    ('transaction trace', ['transaction_id'], [], False),
+]
+
+
+def derive_indexes(patterns=QUERY_PATTERNS):
+    """
+    The index field lists serving patterns: tenant, the exact matches, the
+    list matches, then created_at for the range and the ordering. Lists that
+    are a prefix of another are left out, as the longer index serves both.
+    """
+    proposed = []
+    for _, exact, listed, _ in patterns:
+        fields = ['tenant', *exact, *listed, 'created_at']
+        if fields not in proposed:
+            proposed.append(fields)
+    return [
+        fields for fields in proposed
+        if not any(other != fields and other[:len(fields)] == fields for other in proposed)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare insert throughput and audit viewset query latency for the legacy '
+        'and current AuditLog index sets, and for the set derived from the query '
+        'patterns. Runs in a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Audit logs inserted per index set')
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per query pattern')
+
+    def handle(self, *args, **options):
+        index_sets = {
+            'legacy': [
+                models.Index(fields=fields, name=f'benchmark_audit_{position}_idx')
+                for position, fields in enumerate(LEGACY_INDEXES)
+            ],
+            'current': list(AuditLog._meta.indexes),
+            'proposed': [
+                models.Index(fields=fields, name=f'benchmark_proposed_{position}_idx')
+                for position, fields in enumerate(derive_indexes())
+            ],
+        }
+        results = {}
+
+        with transaction.atomic():
+            tenant = Tenant.objects.create()
+            self.entity_ids = [uuid.uuid4() for _ in range(50)]
+            self.user_ids = [uuid.uuid4() for _ in range(10)]
+            self.transaction_ids = [str(uuid.uuid4()) for _ in range(100)]
+            installed = index_sets['current']
+
+            for label, indexes in index_sets.items():
+                self.swap_indexes(installed, indexes)
+                installed = indexes
+                results[label] = self.run_benchmark(tenant, options['rows'], options['repeat'])
+                AuditLog.objects.filter(tenant=tenant).delete()
+
+            transaction.set_rollback(True)
+
+        self.report(results, index_sets)
+
+    def swap_indexes(self, installed, wanted):
+        """Replace the installed AuditLog indexes with the wanted ones."""
+        # Only used to render SQL, so the editor is never entered; entering it
+        # is not allowed inside the benchmark transaction on SQLite
+        editor = connection.schema_editor()
+        editor.deferred_sql = []
+        with connection.cursor() as cursor:
+            for index in installed:
+                cursor.execute(str(index.remove_sql(AuditLog, editor)))
+            for index in wanted:
+                cursor.execute(str(index.create_sql(AuditLog, editor)))
+
+    def build_log(self, tenant, position):
+        return AuditLog(
+            tenant=tenant,
+            entity_type=ENTITY_TYPES[position % len(ENTITY_TYPES)],
+            entity_id=self.entity_ids[position % len(self.entity_ids)],
+            entity_name=f'Entity {position}',
+            activity_type=ACTIVITY_TYPES[position % len(ACTIVITY_TYPES)],
+            description='Benchmark audit log entry',
+            session_id=SESSION_ID,
+            ip_address='127.0.0.1',
+            user_agent='benchmark',
+            business_process='Benchmark',
+            transaction_id=self.transaction_ids[position % len(self.transaction_ids)],
+            compliance_category='operational',
+            created_by=self.user_ids[position % len(self.user_ids)],
+        )
+
+    def run_benchmark(self, tenant, rows, repeat):
+        started = time.perf_counter()
+        # One INSERT per row, like log_activity on the request path
+        for position in range(rows):
+            self.build_log(tenant, position).save(force_insert=True)
+        insert_seconds = time.perf_counter() - started
+
+        now = timezone.now()
+        samples = {
+            'entity_type': 'ticket',
+            'entity_id': self.entity_ids[0],
+            'activity_type': 'deleted',
+            'created_by': self.user_ids[0],
+            'transaction_id': self.transaction_ids[0],
+        }
+        patterns = {}
+        for name, exact, listed, bounded in QUERY_PATTERNS:
+            queryset = AuditLog.objects.for_tenant(tenant).filter(
+                **{field: samples[field] for field in exact},
+                **{f'{field}__in': WORK_ITEM_TYPES for field in listed},
+            )
+            if bounded:
+                queryset = queryset.for_period(now - timedelta(days=1), now)
+            patterns[name] = queryset.order_by('-created_at')[:50]
+
+        latencies = {}
+        for name, query in patterns.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(query.all())
+                timings.append((time.perf_counter() - started) * 1000)
+            latencies[name] = statistics.median(timings)
+
+        return {'inserts_per_second': rows / insert_seconds, 'latencies': latencies}
+
+    def report(self, results, index_sets):
+        labels = list(results)
+        self.stdout.write(f'{"":<28}' + ''.join(f'{label:>12}' for label in labels))
+        self.stdout.write(f'{"indexes":<28}' + ''.join(f'{len(index_sets[label]):>12}' for label in labels))
+        self.stdout.write(
+            f'{"inserts/s":<28}' + ''.join(f'{results[label]["inserts_per_second"]:>12.0f}' for label in labels)
+        )
+        for name in results[labels[0]]['latencies']:
+            self.stdout.write(
+                f'{name + " (ms)":<28}' + ''.join(f'{results[label]["latencies"][name]:>12.2f}' for label in labels)
+            )
+        self.stdout.write('Proposed indexes:')
+        for index in index_sets['proposed']:
+            self.stdout.write(f'  {", ".join(index.fields)}')
+        self.stdout.write(self.style.SUCCESS('Successfully benchmarked audit log indexes'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from core.utilities.audit_search import get_audit_search_backend
+
+
+class Command(BaseCommand):
+    help = (
+        'Reinstall the audit log full text index and reindex every audit log.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias to reindex')
+
+    def handle(self, *args, **options):
+        backend = get_audit_search_backend(options['database'])
+        if backend is None:
+            raise CommandError('The database backend has no audit log search index')
+
+        # install() reindexes every audit log once the index is in place
+        with connections[options['database']].cursor() as cursor:
+            backend.install(cursor)
+        self.stdout.write(self.style.SUCCESS('Successfully rebuilt the audit log search index'))
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+from core.utilities.audit_writer import relay_audit_outbox
+
+
+class Command(BaseCommand):
+    help = 'Move audit records from the outbox into the audit log'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Records moved per transaction')
+        parser.add_argument('--interval', type=float, help='Keep running, polling every INTERVAL seconds')
+
+    def handle(self, *args, **options):
+        while True:
+            relayed_count = 0
+            while True:
+                relayed = relay_audit_outbox(options['batch_size'])
+                relayed_count += relayed
+                if relayed < options['batch_size']:
+                    break
+
+            if relayed_count or options['interval'] is None:
+                self.stdout.write(self.style.SUCCESS(f'Successfully relayed {relayed_count} audit records'))
+            if options['interval'] is None:
+                return
+            time.sleep(options['interval'])
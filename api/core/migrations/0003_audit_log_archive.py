@@ -0,0 +1,29 @@
+# Generated by Django 5.1.5 on 2026-10-17 15:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_audit_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLogArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField()),
+                ('path', models.CharField(max_length=500)),
+                ('row_count', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('tenant', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_log_archives', to='core.tenant')),
+            ],
+            options={
+                'ordering': ['period', 'id'],
+                'indexes': [models.Index(fields=['tenant', 'period'], name='core_auditl_tenant__60f04d_idx')],
+            },
+        ),
+    ]
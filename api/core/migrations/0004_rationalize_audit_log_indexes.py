@@ -0,0 +1,73 @@
+# Generated by Django 5.1.5 on 2026-10-17 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_audit_log_archive'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_tenant__acfac5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_entity__244637_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_activit_ecf482_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_created_3fd614_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_created_dc23ea_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_session_7d1a57_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_complia_238351_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_risk_le_d7a24f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_tenant__b19d69_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_tenant__3e24c4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_tenant__987c21_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_entity__57cc7c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['tenant', 'entity_type', 'created_at'], name='core_auditl_tenant__b140df_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['tenant', 'activity_type', 'created_at'], name='core_auditl_tenant__52743f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['tenant', 'created_at'], name='core_auditl_tenant__5f83c4_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+from django.db import migrations
+
+# The DDL is copied from core.utilities.audit_search as of this migration,
+# so later changes to the search backends do not change its effect
+
+SQLITE_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS core_auditlog_fts_insert AFTER INSERT ON core_auditlog BEGIN "
+    "INSERT INTO core_auditlog_fts(audit_id, description, entity_name, business_process) "
+    "VALUES (new.id, new.description, new.entity_name, new.business_process); END",
+    "CREATE TRIGGER IF NOT EXISTS core_auditlog_fts_delete AFTER DELETE ON core_auditlog BEGIN "
+    "DELETE FROM core_auditlog_fts WHERE rowid IN (SELECT rowid FROM core_auditlog_fts "
+    "WHERE core_auditlog_fts MATCH 'audit_id:\"' || old.id || '\"'); END",
+    "CREATE TRIGGER IF NOT EXISTS core_auditlog_fts_update "
+    "AFTER UPDATE OF description, entity_name, business_process ON core_auditlog BEGIN "
+    "DELETE FROM core_auditlog_fts WHERE rowid IN (SELECT rowid FROM core_auditlog_fts "
+    "WHERE core_auditlog_fts MATCH 'audit_id:\"' || old.id || '\"'); "
+    "INSERT INTO core_auditlog_fts(audit_id, description, entity_name, business_process) "
+    "VALUES (new.id, new.description, new.entity_name, new.business_process); END",
+]
+
+INSTALL_SQL = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS core_auditlog_fts "
+        "USING fts5(audit_id, description, entity_name, business_process)",
+        *SQLITE_TRIGGERS,
+        "INSERT INTO core_auditlog_fts(audit_id, description, entity_name, business_process) "
+        "SELECT id, description, entity_name, business_process FROM core_auditlog",
+    ],
+    'postgresql': [
+        "ALTER TABLE core_auditlog ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(description, '') || ' ' || "
+        "coalesce(entity_name, '') || ' ' || coalesce(business_process, ''))) STORED",
+        "CREATE INDEX IF NOT EXISTS core_auditlog_search_idx ON core_auditlog USING GIN (search_vector)",
+    ],
+}
+
+UNINSTALL_SQL = {
+    'sqlite': [
+        'DROP TRIGGER IF EXISTS core_auditlog_fts_insert',
+        'DROP TRIGGER IF EXISTS core_auditlog_fts_delete',
+        'DROP TRIGGER IF EXISTS core_auditlog_fts_update',
+        'DROP TABLE IF EXISTS core_auditlog_fts',
+    ],
+    'postgresql': [
+        'DROP INDEX IF EXISTS core_auditlog_search_idx',
+        'ALTER TABLE core_auditlog DROP COLUMN IF EXISTS search_vector',
+    ],
+}
+
+
+def run_sql(statements, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            cursor.execute(sql)
+
+
+def install_search_index(apps, schema_editor):
+    run_sql(INSTALL_SQL, schema_editor)
+
+
+def uninstall_search_index(apps, schema_editor):
+    run_sql(UNINSTALL_SQL, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_rationalize_audit_log_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
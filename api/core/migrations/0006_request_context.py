@@ -0,0 +1,109 @@
+# Generated by Django 5.1.5 on 2026-10-17 15:20
+
+import hashlib
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CONTEXT_FIELDS = ('session_id', 'ip_address', 'user_agent')
+CHUNK_SIZE = 2000
+
+
+def get_digest(values):
+    return hashlib.sha256(json.dumps(list(values)).encode()).hexdigest()
+
+
+def iterate_chunks(queryset):
+    """Walk queryset in pk order, CHUNK_SIZE rows at a time."""
+    last_pk = None
+    while True:
+        chunk = queryset.order_by('pk')
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        chunk = list(chunk[:CHUNK_SIZE])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1].pk
+
+
+def intern_contexts(apps, schema_editor):
+    AuditLog = apps.get_model('core', 'AuditLog')
+    RequestContext = apps.get_model('core', 'RequestContext')
+
+    # digest -> context id, filled one chunk of logs at a time
+    context_ids = {}
+    logs = AuditLog.objects.only('pk', *CONTEXT_FIELDS)
+    for chunk in iterate_chunks(logs):
+        digests = {}
+        for log in chunk:
+            values = tuple(getattr(log, field) for field in CONTEXT_FIELDS)
+            log.digest = get_digest(values)
+            digests.setdefault(log.digest, values)
+
+        missing = [digest for digest in digests if digest not in context_ids]
+        if missing:
+            RequestContext.objects.bulk_create([
+                RequestContext(digest=digest, **dict(zip(CONTEXT_FIELDS, digests[digest])))
+                for digest in missing
+            ])
+            context_ids.update(RequestContext.objects.filter(digest__in=missing).values_list('digest', 'id'))
+
+        for log in chunk:
+            log.context_id = context_ids[log.digest]
+        AuditLog.objects.bulk_update(chunk, ['context'])
+
+
+def restore_contexts(apps, schema_editor):
+    AuditLog = apps.get_model('core', 'AuditLog')
+
+    logs = AuditLog.objects.filter(context__isnull=False).select_related('context').only(
+        'pk', *CONTEXT_FIELDS, *[f'context__{field}' for field in CONTEXT_FIELDS]
+    )
+    for chunk in iterate_chunks(logs):
+        for log in chunk:
+            for field in CONTEXT_FIELDS:
+                setattr(log, field, getattr(log.context, field))
+        AuditLog.objects.bulk_update(chunk, CONTEXT_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_audit_log_search_index'),
+    ]
+
+    # Removing the columns rebuilds core_auditlog on SQLite, dropping the
+    # search index triggers; CoreConfig reinstalls them after migrate
+    operations = [
+        migrations.CreateModel(
+            name='RequestContext',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('session_id', models.CharField(blank=True, db_index=True, max_length=100, null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='context',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.requestcontext'),
+        ),
+        migrations.RunPython(intern_contexts, restore_contexts),
+        migrations.RemoveField(
+            model_name='auditlog',
+            name='ip_address',
+        ),
+        migrations.RemoveField(
+            model_name='auditlog',
+            name='session_id',
+        ),
+        migrations.RemoveField(
+            model_name='auditlog',
+            name='user_agent',
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.5 on 2026-10-17 16:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_request_context'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_transac_dfdcd0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_tenant__239cb3_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_tenant__52743f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['tenant', 'entity_type', 'entity_id', 'created_at'], name='core_auditl_tenant__583a50_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['tenant', 'activity_type', 'entity_type', 'created_at'], name='core_auditl_tenant__5eff79_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['tenant', 'created_by', 'created_at'], name='core_auditl_tenant__af006f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['tenant', 'transaction_id', 'created_at'], name='core_auditl_tenant__00cf48_idx'),
+        ),
+    ]
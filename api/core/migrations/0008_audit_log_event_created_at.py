@@ -0,0 +1,25 @@
+# Generated by Django 5.1.5 on 2026-10-17 17:46
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_audit_log_derived_indexes'),
+    ]
+
+    # The default is applied in Python, so the column itself is unchanged;
+    # altering it on SQLite would needlessly rebuild core_auditlog.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='auditlog',
+                    name='created_at',
+                    field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+                ),
+            ],
+        ),
+    ]
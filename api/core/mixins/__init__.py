@@ -1,5 +1,9 @@
 from .admin_mixins import AdminAuditMixin
+from .cached_list_mixins import CachedListMixin
+from .conditional_get_mixins import ConditionalGetMixin
 
 __all__ = [
     'AdminAuditMixin',
-]
\ No newline at end of file
+    'CachedListMixin',
+    'ConditionalGetMixin',
+]
@@ -1,7 +1,11 @@
 from django.contrib import admin
 from core.models import AuditLog
+from core.utilities.audit_writer import write_audit_logs
+import logging
 import uuid
 
+logger = logging.getLogger(__name__)
+
 
 class AdminAuditMixin:
     """
@@ -16,65 +20,65 @@ class AdminAuditMixin:
     
     def save_model(self, request, obj, form, change):
         """Override to add audit logging for admin operations."""
+        if hasattr(obj, 'updated_by'):
+            obj.updated_by = request.user.id
         super().save_model(request, obj, form, change)
         
         # Create audit log
         activity_type = 'created' if not change else 'updated'
-        description = self.get_audit_description(obj, activity_type)
-        
-        # Handle special cases for tenant field
-        tenant = self.get_audit_tenant(obj, request)
+        write_audit_logs([self.build_audit_log(request, obj, activity_type)], sync=True)
+    
+    def delete_model(self, request, obj):
+        """Override to add audit logging for deletion."""
+        # Create audit log before deletion
+        try:
+            write_audit_logs([self.build_audit_log(request, obj, 'deleted')], sync=True)
+        except Exception:
+            # Log the error but don't prevent deletion
+            logger.exception('Error creating audit log for deletion')
         
-        AuditLog.objects.create(
-            tenant=tenant,
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        """Override to log bulk deletions with one insert."""
+        try:
+            self.log_activity_bulk(request, queryset, 'deleted')
+        except Exception:
+            # Log the error but don't prevent deletion
+            logger.exception('Error creating audit logs for bulk deletion')
+
+        super().delete_queryset(request, queryset)
+
+    def log_activity_bulk(self, request, objs, activity_type):
+        """
+        Log the same activity on many objects with a single bulk insert.
+        All records share one transaction_id.
+        """
+        transaction_id = str(uuid.uuid4())
+        logs = [self.build_audit_log(request, obj, activity_type, transaction_id) for obj in objs]
+        write_audit_logs(logs, sync=True)
+        return logs
+
+    def build_audit_log(self, request, obj, activity_type, transaction_id=None):
+        """Build an unsaved AuditLog for an admin activity on obj."""
+        return AuditLog(
+            # Handle special cases for tenant field
+            tenant=self.get_audit_tenant(obj, request),
             entity_type=self.get_entity_type(obj),
             entity_id=obj.id,
             entity_name=self.get_entity_name(obj),
-            created_by=request.user,
+            created_by=request.user.id,
             activity_type=activity_type,
-            description=description,
+            description=self.get_audit_description(obj, activity_type),
             risk_level=self.get_risk_level(obj, activity_type),
             compliance_category=self.get_compliance_category(obj, activity_type),
             business_process=self.get_business_process(obj),
-            transaction_id=str(uuid.uuid4()),
+            transaction_id=transaction_id or str(uuid.uuid4()),
             session_id=getattr(request.session, 'session_key', None),
             ip_address=self.get_client_ip(request),
             user_agent=request.META.get('HTTP_USER_AGENT', ''),
         )
     
-    def delete_model(self, request, obj):
-        """Override to add audit logging for deletion."""
-        # Create audit log before deletion
-        # Handle special cases for tenant field
-        tenant = self.get_audit_tenant(obj, request)
-        
-        # Store entity info before deletion
-        entity_id = obj.id
-        entity_name = self.get_entity_name(obj)
-        
-        try:
-            AuditLog.objects.create(
-                tenant=tenant,
-                entity_type=self.get_entity_type(obj),
-                entity_id=entity_id,
-                entity_name=entity_name,
-                created_by=request.user,
-                activity_type='deleted',
-                description=self.get_audit_description(obj, 'deleted'),
-                risk_level=self.get_risk_level(obj, 'deleted'),
-                compliance_category=self.get_compliance_category(obj, 'deleted'),
-                business_process=self.get_business_process(obj),
-                transaction_id=str(uuid.uuid4()),
-                session_id=getattr(request.session, 'session_key', None),
-                ip_address=self.get_client_ip(request),
-                user_agent=request.META.get('HTTP_USER_AGENT', ''),
-            )
-        except Exception as e:
-            # Log the error but don't prevent deletion
-            print(f"Error creating audit log for deletion: {e}")
-        
-        super().delete_model(request, obj)
-    
     def get_entity_type(self, obj):
         """Get the entity type for audit logging. Override in subclasses if needed."""
         model_name = obj._meta.model_name.lower()
@@ -0,0 +1,35 @@
+from rest_framework.response import Response
+
+from core.utilities.caching import get_cache_region
+
+
+class CachedListMixin:
+    """
+    Serve list responses from a cache region declared in CACHE_REGIONS.
+
+    The serialized data is cached per tenant and request path with its
+    query string, and invalidated through the region's model tags.
+    """
+
+    cache_region = None
+
+    def get_cache_region(self):
+        return get_cache_region(self.cache_region)
+
+    def get_list_data(self, request, *args, **kwargs):
+        data = super().list(request, *args, **kwargs).data
+        # Plain containers, the Return* wrappers hold the serializer
+        return dict(data) if isinstance(data, dict) else list(data)
+
+    def list(self, request, *args, **kwargs):
+        tenant_id = request.user.tenant_id
+        if not tenant_id:
+            return super().list(request, *args, **kwargs)
+
+        data = self.get_cache_region().get_or_set(
+            lambda: self.get_list_data(request, *args, **kwargs),
+            tenant_id,
+            request.path,
+            sorted(request.GET.lists()),
+        )
+        return Response(data)
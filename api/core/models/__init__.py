@@ -1,12 +1,18 @@
 from .audit_model import AuditModel
+from .request_context import RequestContext
 from .audit_log import AuditLog
+from .audit_outbox import AuditOutbox
+from .audit_log_archive import AuditLogArchive
 from .tenant import Tenant
 from .role import Role
 from .base_option import BaseOption
 
 __all__ = [
     'AuditModel',
+    'RequestContext',
     'AuditLog',
+    'AuditOutbox',
+    'AuditLogArchive',
     'Tenant',
     'Role',
     'BaseOption',
@@ -1,6 +1,26 @@
 from django.db import models
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+from core.querysets import AuditLogQuerySet
 from .audit_model import AuditModel
+from .request_context import REQUEST_CONTEXT_FIELDS, RequestContext
+
+
+def _context_property(name):
+    """Expose a RequestContext field as if it were a column of the audit log."""
+
+    def getter(self):
+        pending = self.__dict__.get('_pending_context')
+        if pending is not None:
+            return pending[name]
+        return getattr(self.context, name) if self.context_id else None
+
+    def setter(self, value):
+        if self.__dict__.get('_pending_context') is None:
+            self._pending_context = {field: getattr(self, field) for field in REQUEST_CONTEXT_FIELDS}
+        self._pending_context[name] = value
+
+    return property(getter, setter)
 
 
 class AuditLog(AuditModel):
@@ -9,6 +29,8 @@ class AuditLog(AuditModel):
     Immutable, tamper-proof audit records that survive data deletion.
     """
     tenant = models.ForeignKey("Tenant", on_delete=models.SET_NULL, related_name="audit_logs", null=True, blank=True)
+    # Set when the record is built, not when a buffered or outbox write inserts it
+    created_at = models.DateTimeField(default=timezone.now, editable=False, db_index=True)
     
     # Entity identification (survives deletion)
     entity_type = models.CharField(max_length=50, choices=[
@@ -53,10 +75,13 @@ class AuditLog(AuditModel):
     old_values = models.JSONField(null=True, blank=True)  # Previous state
     new_values = models.JSONField(null=True, blank=True)  # New state
     
-    # Forensic tracking
-    session_id = models.CharField(max_length=100, null=True, blank=True)
-    ip_address = models.GenericIPAddressField(null=True, blank=True)
-    user_agent = models.TextField(null=True, blank=True)
+    # Forensic tracking; session, IP and user agent are interned in RequestContext
+    context = models.ForeignKey(
+        RequestContext, on_delete=models.PROTECT, related_name="+", null=True, blank=True
+    )
+    session_id = _context_property('session_id')
+    ip_address = _context_property('ip_address')
+    user_agent = _context_property('user_agent')
     business_process = models.CharField(max_length=100, null=True, blank=True)
     transaction_id = models.CharField(max_length=100, null=True, blank=True)
     
@@ -77,6 +102,11 @@ class AuditLog(AuditModel):
     
     # Immutability protection
     is_immutable = models.BooleanField(default=True)  # Prevent tampering
+
+    objects = AuditLogQuerySet.as_manager()
+
+    # Append only, so loading rows never needs a change tracking snapshot
+    track_changes = False
     
     class Meta:
         ordering = ['-created_at']
@@ -90,22 +120,16 @@ class AuditLog(AuditModel):
                 name='valid_entity_type'
             )
         ]
+        # One index per tenant scoped access path, as derived from the query
+        # patterns of the benchmark_audit_indexes command. created_by and
+        # created_at alone are already indexed by AuditModel.
         indexes = [
-            models.Index(fields=['tenant']),
-            models.Index(fields=['entity_type', 'entity_id']),
-            models.Index(fields=['activity_type']),
-            models.Index(fields=['created_by']),
-            models.Index(fields=['created_at']),
-            models.Index(fields=['session_id']),
-            models.Index(fields=['transaction_id']),
-            models.Index(fields=['compliance_category']),
-            models.Index(fields=['risk_level']),
-            # Composite indexes for performance
-            models.Index(fields=['tenant', 'entity_type']),
-            models.Index(fields=['tenant', 'entity_type', 'entity_id']),
-            models.Index(fields=['tenant', 'activity_type']),
-            models.Index(fields=['tenant', 'created_by']),
-            models.Index(fields=['entity_type', 'activity_type']),
+            models.Index(fields=['tenant', 'entity_type', 'created_at']),
+            models.Index(fields=['tenant', 'entity_type', 'entity_id', 'created_at']),
+            models.Index(fields=['tenant', 'activity_type', 'entity_type', 'created_at']),
+            models.Index(fields=['tenant', 'created_at']),
+            models.Index(fields=['tenant', 'created_by', 'created_at']),
+            models.Index(fields=['tenant', 'transaction_id', 'created_at']),
         ]
 
     def __str__(self):
@@ -117,4 +141,17 @@ class AuditLog(AuditModel):
         if self.pk and not kwargs.get('force_insert', False) and self.is_immutable:
             # Prevent updates to existing audit logs
             raise ValidationError("Audit logs are immutable and cannot be modified.")
-        super().save(*args, **kwargs) 
\ No newline at end of file
+        self.resolve_contexts([self])
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def resolve_contexts(logs):
+        """Point logs with forensic values set to their interned RequestContext; call before bulk_create."""
+        pending = [log for log in logs if log.__dict__.get('_pending_context') is not None]
+        if not pending:
+            return
+        values = [tuple(log._pending_context[field] for field in REQUEST_CONTEXT_FIELDS) for log in pending]
+        ids = RequestContext.intern_many(values)
+        for log, context in zip(pending, values):
+            log.context_id = ids[context]
+            del log._pending_context 
\ No newline at end of file
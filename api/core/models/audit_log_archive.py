@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class AuditLogArchive(models.Model):
+    """
+    One gzip-compressed JSON lines file of archived audit logs.
+
+    Each file holds audit logs of one tenant and one month that were moved
+    out of AuditLog. Archiving the same month again adds another file.
+    """
+
+    tenant = models.ForeignKey(
+        "Tenant", on_delete=models.SET_NULL, related_name="audit_log_archives", null=True, blank=True
+    )
+    period = models.DateField()  # First day of the archived month
+    path = models.CharField(max_length=500)
+    row_count = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["period", "id"]
+        indexes = [
+            models.Index(fields=["tenant", "period"]),
+        ]
+
+    def __str__(self):
+        return f"Audit log archive {self.period:%Y-%m} ({self.row_count} rows)"
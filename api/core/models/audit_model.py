@@ -1,13 +1,88 @@
+import copy
 import uuid
 from django.db import models
 
+# Bookkeeping fields left out of change tracking
+UNTRACKED_AUDIT_FIELDS = ('id', 'created_by', 'updated_by', 'created_at', 'updated_at')
+
 
 class AuditModel(models.Model):
+    """
+    Base model with audit metadata and change tracking.
+
+    The tracked fields are snapshotted when an instance is loaded and
+    compared on save; tracked_changes then maps each changed field name to
+    its (old, new) value, with foreign keys as ids. Fields listed in
+    untracked_fields, and fields deferred when loading, are not tracked;
+    models that are never updated set track_changes = False.
+    """
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, unique=True, db_index=True)
     created_by = models.UUIDField(null=True, blank=True, db_index=True)
     updated_by = models.UUIDField(null=True, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
+    track_changes = True
+    untracked_fields = ()
+
     class Meta:
-        abstract = True 
\ No newline at end of file
+        abstract = True
+
+    @classmethod
+    def get_tracked_fields(cls):
+        if not cls.track_changes:
+            return []
+        untracked = set(UNTRACKED_AUDIT_FIELDS) | set(cls.untracked_fields)
+        return [
+            field for field in cls._meta.concrete_fields
+            if not field.primary_key
+            and field.name not in untracked
+            and not (field.remote_field and field.remote_field.parent_link)
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if cls.track_changes:
+            instance.snapshot_tracked_fields()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        self.snapshot_tracked_fields(fields)
+
+    def _get_loaded_tracked_fields(self, fields=None):
+        for field in self.get_tracked_fields():
+            if fields is not None and field.name not in fields and field.attname not in fields:
+                continue
+            if field.attname in self.__dict__:
+                yield field
+
+    def snapshot_tracked_fields(self, fields=None):
+        """Remember the current value of the loaded tracked fields."""
+        if not hasattr(self, '_tracked_values'):
+            self._tracked_values = {}
+        for field in self._get_loaded_tracked_fields(fields):
+            value = self.__dict__[field.attname]
+            # Only JSON values are mutable in place
+            self._tracked_values[field.attname] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def get_tracked_changes(self, fields=None):
+        """Changes to the tracked fields since the snapshot, as {name: (old, new)}."""
+        snapshot = getattr(self, '_tracked_values', {})
+        changes = {}
+        for field in self._get_loaded_tracked_fields(fields):
+            if field.attname not in snapshot:
+                continue
+            old, new = snapshot[field.attname], self.__dict__[field.attname]
+            if old != new:
+                changes[field.name] = (old, new)
+        return changes
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        changes = {} if self._state.adding else self.get_tracked_changes(update_fields)
+        super().save(*args, **kwargs)
+        self.tracked_changes = changes
+        self.snapshot_tracked_fields(update_fields)
@@ -0,0 +1,22 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class AuditOutbox(models.Model):
+    """
+    Audit records waiting to be relayed into AuditLog.
+
+    Rows are written in the same transaction as the change they describe.
+    audit_log_id is the id the AuditLog row will get, so relaying a row
+    twice cannot create a duplicate.
+    """
+
+    audit_log_id = models.UUIDField(unique=True)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"Outbox entry for audit log {self.audit_log_id}"
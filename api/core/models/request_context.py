@@ -0,0 +1,70 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import models, transaction
+
+REQUEST_CONTEXT_FIELDS = ('session_id', 'ip_address', 'user_agent')
+
+# digest -> id of contexts known to be committed, shared by the process
+_interned_ids = {}
+
+
+def _remember(ids):
+    if len(_interned_ids) + len(ids) > getattr(settings, 'AUDIT_LOG_CONTEXT_CACHE_SIZE', 10000):
+        _interned_ids.clear()
+    _interned_ids.update(ids)
+
+
+class RequestContext(models.Model):
+    """
+    Forensic request context shared by audit logs.
+
+    Each distinct (session_id, ip_address, user_agent) is stored once, keyed
+    by a hash of the values, and audit logs point to it. Rows are never
+    updated or deleted.
+    """
+
+    digest = models.CharField(max_length=64, unique=True)
+    session_id = models.CharField(max_length=100, null=True, blank=True, db_index=True)  # Replaces the audit log session index
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.ip_address or '-'} {self.session_id or '-'}"
+
+    @staticmethod
+    def get_digest(values):
+        return hashlib.sha256(json.dumps(list(values)).encode()).hexdigest()
+
+    @classmethod
+    def intern(cls, values):
+        """The id of the context holding values, a REQUEST_CONTEXT_FIELDS tuple."""
+        return cls.intern_many([values])[tuple(values)]
+
+    @classmethod
+    def intern_many(cls, contexts):
+        """
+        Map each REQUEST_CONTEXT_FIELDS tuple to a context id, creating the
+        missing contexts with one insert. Ids are cached in process once
+        their transaction commits.
+        """
+        digests = {cls.get_digest(values): tuple(values) for values in contexts}
+        ids = {digest: _interned_ids[digest] for digest in digests if digest in _interned_ids}
+
+        missing = [digest for digest in digests if digest not in ids]
+        if missing:
+            found = dict(cls.objects.filter(digest__in=missing).values_list('digest', 'id'))
+            new = [digest for digest in missing if digest not in found]
+            if new:
+                cls.objects.bulk_create(
+                    [cls(digest=digest, **dict(zip(REQUEST_CONTEXT_FIELDS, digests[digest]))) for digest in new],
+                    ignore_conflicts=True,
+                )
+                found.update(cls.objects.filter(digest__in=new).values_list('digest', 'id'))
+            # Ids created in a transaction that rolls back must not be cached
+            transaction.on_commit(lambda: _remember(found))
+            ids.update(found)
+
+        return {digests[digest]: context_id for digest, context_id in ids.items()}
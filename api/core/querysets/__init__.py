@@ -1,5 +1,7 @@
 from .role_querysets import RoleQuerySet
+from .audit_log_querysets import AuditLogQuerySet
 
 __all__ = [
     'RoleQuerySet',
-]
\ No newline at end of file
+    'AuditLogQuerySet',
+]
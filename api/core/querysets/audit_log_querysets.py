@@ -0,0 +1,32 @@
+from django.db import models
+
+
+class AuditLogQuerySet(models.QuerySet):
+    def for_tenant(self, tenant):
+        """Return audit logs of a single tenant."""
+        return self.filter(tenant=tenant)
+
+    def for_period(self, start=None, end=None):
+        """
+        Return audit logs created in [start, end).
+
+        Bounding created_at lets the database skip whole time ranges: the
+        created_at index on a single table, or whole partitions on a backend
+        where AuditLog is partitioned by month.
+        """
+        qs = self
+        if start is not None:
+            qs = qs.filter(created_at__gte=start)
+        if end is not None:
+            qs = qs.filter(created_at__lt=end)
+        return qs
+
+    def search(self, text):
+        """
+        Return audit logs whose description, entity name or business process
+        contain every word of text, using the full text index where the
+        database has one.
+        """
+        from core.utilities.audit_search import search_audit_logs
+
+        return search_audit_logs(self, text)
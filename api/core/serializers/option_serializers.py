@@ -0,0 +1,35 @@
+from rest_framework import serializers
+
+from core.utilities.option_cache import get_options
+
+
+class CachedOptionField(serializers.Field):
+    """
+    Read-only field rendering a BaseOption foreign key with serializer_class,
+    resolving the option from the option cache by id instead of a join.
+    Fields are copied per serializer instance, so the options are looked up
+    once per tenant for a whole list.
+    """
+
+    def __init__(self, serializer_class, **kwargs):
+        self.serializer_class = serializer_class
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+        self._options = {}
+
+    def get_attribute(self, instance):
+        field = instance._meta.get_field(self.source)
+        option_id = getattr(instance, field.attname)
+        if option_id is None:
+            return None
+        return field.related_model, instance.tenant_id, option_id
+
+    def to_representation(self, value):
+        model, tenant_id, option_id = value
+        key = (model, tenant_id)
+        if key not in self._options:
+            self._options[key] = get_options(model, tenant_id)
+        option = self._options[key].get(str(option_id))
+        if option is None:
+            return None
+        return self.serializer_class(option, context=self.context).data
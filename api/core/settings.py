@@ -86,6 +86,44 @@ CACHES = {
     }
 }
 
+# Response cache: API path prefix -> models whose rows the responses
+# contain. A write to any of them invalidates the tenant's cached responses.
+WORK_ITEM_RESPONSE_MODELS = [
+    'engagements.WorkItem',
+    'engagements.WorkItemStatus',
+    'engagements.WorkItemPriority',
+    'engagements.WorkItemCategory',
+    'engagements.Comment',
+    'relations.Relation',
+    'relations.Assignment',
+    'partners.Partner',
+    'users.User',
+]
+PARTNER_RESPONSE_MODELS = ['partners.Partner', 'core.Role', 'users.User']
+RESPONSE_CACHE_RESOURCES = {
+    '/api/tickets/': WORK_ITEM_RESPONSE_MODELS,
+    '/api/cases/': WORK_ITEM_RESPONSE_MODELS,
+    '/api/jobs/': WORK_ITEM_RESPONSE_MODELS,
+    '/api/persons/': PARTNER_RESPONSE_MODELS,
+    '/api/organizations/': PARTNER_RESPONSE_MODELS,
+    '/api/relations/': ['relations.Relation', 'engagements.WorkItem', 'partners.Partner', 'core.Role'],
+    '/api/core/roles/': ['core.Role'],
+}
+RESPONSE_CACHE_TIMEOUT = 300  # seconds
+
+# Cache regions: name -> timeout (seconds), max_entries per tenant and the
+# models the cached values are computed from. Writes to those models
+# invalidate the region (see core.utilities.caching).
+CACHE_REGIONS = {
+    'partner_list': {'timeout': 300, 'max_entries': 500, 'models': PARTNER_RESPONSE_MODELS},
+    'relation_list': {
+        'timeout': 300,
+        'max_entries': 500,
+        'models': ['relations.Relation', 'engagements.WorkItem', 'partners.Partner', 'core.Role'],
+    },
+    'role_list': {'timeout': 900, 'max_entries': 100, 'models': ['core.Role']},
+}
+
 # Use Redis for session storage
 # SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 # SESSION_CACHE_ALIAS = 'session'
@@ -102,7 +140,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     # 'core.utilities.middleware.TenantMiddleware',  # Doesn't exist yet
     'core.utilities.middleware.QueryCountMiddleware',  # Clean query monitoring
-    # 'core.utilities.middleware.CacheMiddleware',  # Temporarily disabled
+    'core.utilities.response_cache.ResponseCacheMiddleware',
 ]
 
 # Django Debug Toolbar for query monitoring
@@ -234,5 +272,24 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Audit log writes: 'buffered' queues low and medium risk records and
+# bulk-inserts them from a background thread, 'outbox' appends them to the
+# AuditOutbox table in the request's transaction for relay_audit_outbox to
+# move, 'sync' writes every record inline. Deployments opt in to the
+# deferred modes
+AUDIT_LOG_WRITE_MODE = 'sync'
+AUDIT_LOG_QUEUE_SIZE = 10000
+AUDIT_LOG_BATCH_SIZE = 500
+AUDIT_LOG_FLUSH_INTERVAL = 1.0  # seconds
+# Interned request context ids kept per process
+AUDIT_LOG_CONTEXT_CACHE_SIZE = 10000
+
+# Audit logs older than this many months are moved to gzip JSON lines files
+AUDIT_LOG_ARCHIVE_AFTER_MONTHS = 12
+AUDIT_LOG_ARCHIVE_DIR = BASE_DIR / 'audit_archive'
+
+# Rows fetched per database round trip by streaming audit log exports
+AUDIT_LOG_EXPORT_CHUNK_SIZE = 2000
+
 # Performance monitoring - clean query monitoring via middleware only
 # (No verbose SQL logging - use QueryCountMiddleware instead)
@@ -0,0 +1,142 @@
+import gzip
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.enums import SystemRole
+from core.models import AuditLog, AuditLogArchive
+from core.tests.factory import TenantFactory, AuditLogFactory, RoleFactory
+from core.utilities import audit_archive
+from core.utilities.audit_archive import archive_audit_logs, read_archived_logs
+from relations.tests.factory import PersonFactory
+from users.tests.factory import UserFactory
+
+
+def at(year, month, day=1):
+    return datetime(year, month, day, 12, tzinfo=dt_timezone.utc)
+
+
+class AuditArchiveTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.archive_dir.cleanup)
+
+    def create_log(self, created_at, tenant=None, **kwargs):
+        log = AuditLogFactory.create(tenant=tenant or self.tenant, **kwargs)
+        AuditLog.objects.filter(pk=log.pk).update(created_at=created_at)
+        return log
+
+    def test_for_period_bounds_created_at(self):
+        self.create_log(at(2024, 1, 10))
+        inside = self.create_log(at(2024, 2, 10))
+
+        logs = AuditLog.objects.for_tenant(self.tenant).for_period(at(2024, 2, 1), at(2024, 3, 1))
+
+        self.assertEqual(list(logs), [inside])
+
+    def test_old_months_move_to_compressed_archives(self):
+        self.create_log(at(2024, 1, 5))
+        self.create_log(at(2024, 1, 20))
+        self.create_log(at(2024, 2, 5), tenant=TenantFactory.create())
+        recent = self.create_log(at(2024, 3, 5))
+
+        archives = archive_audit_logs(at(2024, 3, 1), archive_dir=self.archive_dir.name)
+
+        self.assertEqual(sorted(archive.row_count for archive in archives), [1, 2])
+        self.assertEqual(list(AuditLog.objects.all()), [recent])
+        january = AuditLogArchive.objects.get(tenant=self.tenant)
+        with gzip.open(january.path, 'rt') as archive_file:
+            self.assertEqual(len(archive_file.readlines()), 2)
+
+    def test_archived_logs_are_read_back_with_filters(self):
+        created = self.create_log(at(2024, 1, 5), activity_type='created', entity_type='ticket')
+        self.create_log(at(2024, 1, 6), activity_type='updated', entity_type='ticket')
+        self.create_log(at(2024, 1, 7), activity_type='created', entity_type='relation')
+        archive_audit_logs(at(2024, 3, 1), archive_dir=self.archive_dir.name)
+
+        logs = list(read_archived_logs(
+            self.tenant, at(2024, 1, 1), at(2024, 2, 1),
+            entity_type=['ticket', 'case'], activity_type=['created'],
+        ))
+
+        self.assertEqual([str(log.id) for log in logs], [str(created.id)])
+        self.assertEqual(logs[0].created_at, at(2024, 1, 5))
+        self.assertEqual(logs[0].description, created.description)
+
+    def test_reading_prunes_archives_outside_the_period(self):
+        self.create_log(at(2024, 1, 5))
+        archive_audit_logs(at(2024, 3, 1), archive_dir=self.archive_dir.name)
+        AuditLogArchive.objects.update(path='/missing/file.jsonl.gz')
+
+        self.assertEqual(list(read_archived_logs(self.tenant, at(2024, 2, 1))), [])
+
+    def test_archived_logs_can_be_read_newest_first(self):
+        logs = [self.create_log(at(2024, month, day)) for month, day in ((1, 5), (1, 20), (2, 5))]
+        archive_audit_logs(at(2024, 3, 1), archive_dir=self.archive_dir.name)
+
+        read = read_archived_logs(self.tenant, newest_first=True)
+
+        self.assertEqual([str(log.id) for log in read], [str(log.id) for log in reversed(logs)])
+
+
+class ArchivedAuditViewTestCase(TestCase):
+    url = '/api/audit-logs/'
+
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.user = UserFactory.create(self.tenant, username='auditor', email='auditor@example.com')
+        role = RoleFactory.create(self.tenant, self.user.id, key=SystemRole.TENANT_EMPLOYEE.value, label='Employee')
+        PersonFactory.create(self.tenant, role=role, user=self.user)
+        self.client.cookies['access_token'] = str(AccessToken.for_user(self.user))
+
+        archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(archive_dir.cleanup)
+        for month in (1, 2, 3):
+            for day in (5, 20):
+                entity_name = 'Invoice reminder' if (month, day) == (2, 20) else 'Test Entity'
+                log = AuditLogFactory.create(tenant=self.tenant, entity_type='ticket', entity_name=entity_name)
+                AuditLog.objects.filter(pk=log.pk).update(created_at=at(2024, month, day))
+        archive_audit_logs(at(2024, 4, 1), archive_dir=archive_dir.name)
+        self.period = {'archived': 'true', 'created_after': '2024-01-01T00:00:00Z', 'created_before': '2024-04-01T00:00:00Z'}
+
+    def get(self, **params):
+        response = self.client.get(self.url, {**self.period, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def cursor(self, link):
+        return parse_qs(urlparse(link).query)['cursor'][0]
+
+    def test_archived_pages_only_open_the_months_they_need(self):
+        with mock.patch.object(audit_archive, '_read_archive_rows', wraps=audit_archive._read_archive_rows) as read:
+            first = self.get(page_size=2)
+
+        self.assertEqual([log['created_at'][:10] for log in first['results']], ['2024-03-20', '2024-03-05'])
+        # The extra row that tells there is a next page comes from February
+        self.assertEqual(read.call_count, 2)
+
+    def test_archived_pages_follow_next_and_previous_links(self):
+        first = self.get(page_size=2)
+        second = self.get(page_size=2, cursor=self.cursor(first['next']))
+        back = self.get(page_size=2, cursor=self.cursor(second['previous']))
+
+        self.assertEqual([log['created_at'][:10] for log in second['results']], ['2024-02-20', '2024-02-05'])
+        self.assertEqual(back['results'], first['results'])
+        self.assertIsNone(back['previous'])
+
+    def test_archived_results_are_searched_like_live_ones(self):
+        archived = self.get(search='invoice remind')
+
+        self.assertEqual([log['entity_name'] for log in archived['results']], ['Invoice reminder'])
+        self.assertEqual(archived['results'][0]['created_at'][:10], '2024-02-20')
+        self.assertEqual(self.get(search='reminders')['results'], [])
+
+    def test_archived_period_is_bounded(self):
+        response = self.client.get(self.url, {**self.period, 'created_after': '2020-01-01T00:00:00Z'})
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,87 @@
+import csv
+import gzip
+import io
+import json
+
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.enums import SystemRole
+from core.models import AuditLog
+from core.tests.factory import TenantFactory, AuditLogFactory, RoleFactory
+from core.utilities.audit_export import stream_audit_export
+from relations.tests.factory import PersonFactory
+from users.tests.factory import UserFactory
+
+
+def read_body(response):
+    return b''.join(response.streaming_content)
+
+
+class AuditExportTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.user = UserFactory.create(self.tenant, username='auditor', email='auditor@example.com')
+        self.ticket_log = AuditLogFactory.create(self.tenant, self.user.id, entity_type='ticket')
+        self.partner_log = AuditLogFactory.create(self.tenant, None, entity_type='person', risk_level='high')
+
+    def test_csv_export_streams_rows_with_usernames(self):
+        response = stream_audit_export(AuditLog.objects.filter(entity_type='ticket'))
+
+        rows = list(csv.reader(io.StringIO(read_body(response).decode())))
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(rows[0][0], 'ID')
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][0], str(self.ticket_log.id))
+        self.assertEqual(rows[1][5], 'auditor')
+
+    def test_gzipped_json_lines_export(self):
+        response = stream_audit_export(AuditLog.objects.all(), 'jsonl', compress=True)
+
+        lines = gzip.decompress(read_body(response)).decode().splitlines()
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertIn('.jsonl.gz', response['Content-Disposition'])
+        self.assertEqual(
+            {json.loads(line)['id'] for line in lines},
+            {str(self.ticket_log.id), str(self.partner_log.id)},
+        )
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            stream_audit_export(AuditLog.objects.all(), 'xml')
+
+    def login(self, role_key):
+        role = RoleFactory.create(self.tenant, self.user.id, key=role_key.value, label=role_key.name)
+        PersonFactory.create(self.tenant, role=role, user=self.user)
+        self.client.cookies['access_token'] = str(AccessToken.for_user(self.user))
+
+    def test_api_export_applies_viewset_filters(self):
+        self.login(SystemRole.TENANT_ADMIN)
+
+        response = self.client.get('/api/audit-logs/export/', {'export_format': 'jsonl', 'risk_level': 'low'})
+
+        lines = read_body(response).decode().splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [str(self.ticket_log.id)])
+
+    def test_api_export_is_audited_with_filters_and_format(self):
+        self.login(SystemRole.TENANT_ADMIN)
+
+        read_body(self.client.get('/api/audit-logs/export/', {'export_format': 'csv', 'risk_level': 'low'}))
+
+        log = AuditLog.objects.get(activity_type='exported')
+        self.assertEqual(log.entity_type, 'tenant')
+        self.assertEqual(log.created_by, self.user.id)
+        self.assertEqual(
+            log.new_values,
+            {'export_format': 'csv', 'compress': False, 'filters': {'risk_level': 'low'}},
+        )
+
+    def test_api_export_requires_export_permission(self):
+        self.login(SystemRole.TENANT_EMPLOYEE)
+
+        response = self.client.get('/api/audit-logs/export/')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(AuditLog.objects.filter(activity_type='exported').exists())
+        self.assertEqual(self.client.get('/api/audit-logs/').status_code, 200)
@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from core.management.commands.benchmark_audit_indexes import derive_indexes
+from core.models import AuditLog, Tenant
+
+
+class BenchmarkAuditIndexesTestCase(TestCase):
+    def get_index_names(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, AuditLog._meta.db_table)
+        return {name for name, constraint in constraints.items() if constraint['index']}
+
+    def test_model_indexes_are_the_derived_set(self):
+        self.assertEqual([index.fields for index in AuditLog._meta.indexes], derive_indexes())
+
+    def test_prefixes_of_other_indexes_are_not_proposed(self):
+        patterns = [('list', [], [], False), ('history', ['entity_id'], [], False), ('recent', [], [], True)]
+
+        self.assertEqual(derive_indexes(patterns), [['tenant', 'created_at'], ['tenant', 'entity_id', 'created_at']])
+
+    def test_benchmark_reports_every_index_set_and_leaves_no_trace(self):
+        index_names = self.get_index_names()
+        tenant_count = Tenant.objects.count()
+        out = StringIO()
+
+        call_command('benchmark_audit_indexes', rows=20, repeat=1, stdout=out)
+
+        self.assertIn('inserts/s', out.getvalue())
+        self.assertIn('work item audit list (ms)', out.getvalue())
+        self.assertIn('proposed', out.getvalue())
+        self.assertEqual(self.get_index_names(), index_names)
+        self.assertEqual(Tenant.objects.count(), tenant_count)
+        self.assertFalse(AuditLog.objects.exists())
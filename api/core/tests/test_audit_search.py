@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import AuditLog
+from core.tests.factory import TenantFactory, AuditLogFactory
+from engagements.views.audit_views import WorkItemAuditViewSet
+from users.tests.factory import UserFactory
+
+
+class AuditSearchTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.invoice_log = AuditLogFactory.create(
+            self.tenant, None, description='Invoice approved by finance', entity_name='Invoice 1042',
+        )
+        self.contract_log = AuditLogFactory.create(
+            self.tenant, None, description='Contract renewed', business_process='Procurement',
+        )
+
+    def test_search_matches_every_word_by_prefix(self):
+        self.assertEqual(list(AuditLog.objects.search('invoice approv')), [self.invoice_log])
+        self.assertEqual(list(AuditLog.objects.search('procure')), [self.contract_log])
+        self.assertEqual(list(AuditLog.objects.search('invoice renewed')), [])
+
+    def test_index_follows_deletes(self):
+        self.invoice_log.delete()
+
+        self.assertEqual(list(AuditLog.objects.search('invoice')), [])
+
+    def test_index_does_not_depend_on_rowids(self):
+        # VACUUM may renumber the implicit rowids of the audit log table
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE core_auditlog SET rowid = rowid + 1000')
+
+        self.assertEqual(list(AuditLog.objects.search('invoice')), [self.invoice_log])
+
+    def test_ids_are_not_searched(self):
+        self.assertEqual(list(AuditLog.objects.search(self.invoice_log.id.hex[:8])), [])
+
+    def test_databases_without_an_index_fall_back_to_substring_search(self):
+        with mock.patch('core.utilities.audit_search.get_audit_search_backend', return_value=None):
+            self.assertEqual(list(AuditLog.objects.search('INVOICE finance')), [self.invoice_log])
+            self.assertEqual(list(AuditLog.objects.search('invoice renewed')), [])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual(list(AuditLog.objects.search('"contract) -')), [self.contract_log])
+
+    def test_rebuild_reindexes_existing_rows(self):
+        call_command('rebuild_audit_search_index', stdout=None)
+
+        self.assertEqual(list(AuditLog.objects.search('contract')), [self.contract_log])
+
+    def test_migrate_restores_dropped_triggers(self):
+        # As when a migration rebuilds the audit log table on SQLite
+        with connection.cursor() as cursor:
+            for trigger in ('insert', 'delete', 'update'):
+                cursor.execute(f'DROP TRIGGER core_auditlog_fts_{trigger}')
+        missed_log = AuditLogFactory.create(self.tenant, None, description='Missed while rebuilding')
+
+        call_command('migrate', verbosity=0)
+        added_log = AuditLogFactory.create(self.tenant, None, description='Added after migrating')
+
+        self.assertEqual(list(AuditLog.objects.search('missed')), [missed_log])
+        self.assertEqual(list(AuditLog.objects.search('added')), [added_log])
+
+    def test_viewset_search_uses_the_index(self):
+        user = UserFactory.create(self.tenant, username='auditor', email='auditor@example.com')
+        view = WorkItemAuditViewSet.as_view({'get': 'list'}, permission_classes=[IsAuthenticated])
+        request = APIRequestFactory().get('/audit-logs/', {'search': 'finance'})
+        force_authenticate(request, user=user)
+
+        response = view(request)
+
+        self.assertEqual([log['id'] for log in response.data['results']], [str(self.invoice_log.id)])
@@ -0,0 +1,164 @@
+import uuid
+from unittest import mock
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import AuditLog, AuditOutbox
+from core.tests.factory import TenantFactory
+from core.utilities.audit_writer import (
+    AuditLogWriter,
+    enqueue_audit_log,
+    relay_audit_outbox,
+    write_audit_log,
+)
+
+
+class AuditWriterTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+
+    def build_log(self, risk_level='low'):
+        return AuditLog(
+            tenant=self.tenant,
+            entity_type='ticket',
+            entity_id=uuid.uuid4(),
+            entity_name='Test Entity',
+            activity_type='updated',
+            description='Test audit log entry',
+            change_summary={'title': {'old': 'a', 'new': 'b'}},
+            transaction_id=str(uuid.uuid4()),
+            risk_level=risk_level,
+        )
+
+
+class AuditLogWriterTestCase(AuditWriterTestCase):
+    def setUp(self):
+        super().setUp()
+        # No background thread: flushes are triggered by the tests
+        self.writer = AuditLogWriter(max_queue_size=3, batch_size=2, flush_interval=None)
+
+    def test_records_are_buffered_until_flush(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                self.writer.write(self.build_log())
+
+        self.assertEqual(AuditLog.objects.count(), 0)
+
+        with self.assertNumQueries(2):  # two batches of at most two rows
+            written = self.writer.flush()
+
+        self.assertEqual(written, 3)
+        self.assertEqual(AuditLog.objects.count(), 3)
+
+    def test_sync_records_bypass_the_queue(self):
+        self.writer.write(self.build_log(risk_level='high'), sync=True)
+
+        self.assertEqual(AuditLog.objects.count(), 1)
+        self.assertEqual(self.writer.queue.qsize(), 0)
+
+    def test_full_queue_falls_back_to_synchronous_write(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(4):
+                self.writer.write(self.build_log())
+
+        self.assertEqual(AuditLog.objects.count(), 1)
+        self.assertEqual(self.writer.queue.qsize(), 3)
+
+    def test_records_are_queued_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.writer.write(self.build_log())
+            self.assertEqual(self.writer.queue.qsize(), 0)
+
+        self.assertEqual(self.writer.queue.qsize(), 1)
+
+    def test_rolled_back_records_are_not_queued(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.writer.write(self.build_log())
+                    raise ValueError('rollback')
+            except ValueError:
+                pass
+
+        self.assertEqual(self.writer.queue.qsize(), 0)
+
+    def test_flushed_records_keep_their_event_time(self):
+        log = self.build_log()
+        recorded_at = log.created_at
+        with self.captureOnCommitCallbacks(execute=True):
+            self.writer.write(log)
+
+        with mock.patch('django.utils.timezone.now', return_value=recorded_at + timedelta(minutes=5)):
+            self.writer.flush()
+
+        self.assertEqual(AuditLog.objects.get().created_at, recorded_at)
+
+    def test_failed_batch_is_retried_per_record(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.writer.write(self.build_log())
+            self.writer.write(self.build_log())
+
+        with mock.patch.object(AuditLog.objects, 'bulk_create', side_effect=Exception('boom')):
+            self.writer.flush()
+
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+    @override_settings(AUDIT_LOG_WRITE_MODE='buffered')
+    def test_buffered_mode_keeps_high_risk_records_synchronous(self):
+        with mock.patch('core.utilities.audit_writer.audit_writer', self.writer), \
+                self.captureOnCommitCallbacks(execute=True):
+            write_audit_log(self.build_log())
+            write_audit_log(self.build_log(risk_level='high'), sync=True)
+
+        self.assertEqual(AuditLog.objects.count(), 1)
+        self.assertEqual(self.writer.queue.qsize(), 1)
+
+
+class AuditOutboxTestCase(AuditWriterTestCase):
+    def test_relay_moves_entries_with_their_event_time(self):
+        log = self.build_log()
+        enqueue_audit_log(log)
+        recorded_at = timezone.now() - timedelta(minutes=5)
+        AuditOutbox.objects.update(created_at=recorded_at)
+
+        self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertEqual(relay_audit_outbox(), 1)
+
+        relayed = AuditLog.objects.get()
+        self.assertEqual(relayed.id, log.id)
+        self.assertEqual(relayed.created_at, recorded_at)
+        self.assertEqual(relayed.change_summary, {'title': {'old': 'a', 'new': 'b'}})
+        self.assertEqual(relayed.tenant, self.tenant)
+        self.assertFalse(AuditOutbox.objects.exists())
+
+    def test_relaying_an_entry_twice_does_not_duplicate_it(self):
+        log = self.build_log()
+        enqueue_audit_log(log)
+        relay_audit_outbox()
+        enqueue_audit_log(log)
+
+        relay_audit_outbox()
+
+        self.assertEqual(AuditLog.objects.filter(id=log.id).count(), 1)
+        self.assertFalse(AuditOutbox.objects.exists())
+
+    def test_relay_works_in_batches(self):
+        for _ in range(5):
+            enqueue_audit_log(self.build_log())
+
+        self.assertEqual(relay_audit_outbox(batch_size=2), 2)
+        self.assertEqual(AuditOutbox.objects.count(), 3)
+
+    @override_settings(AUDIT_LOG_WRITE_MODE='outbox')
+    def test_outbox_entry_rolls_back_with_the_change(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                write_audit_log(self.build_log(risk_level='high'), sync=True)
+                raise RuntimeError
+
+        self.assertFalse(AuditOutbox.objects.exists())
+        self.assertFalse(AuditLog.objects.exists())
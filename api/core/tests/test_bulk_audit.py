@@ -0,0 +1,57 @@
+from django.contrib.admin.sites import AdminSite
+from django.test import RequestFactory, TestCase
+from rest_framework.request import Request
+
+from core.admin import RoleAdmin
+from core.models import AuditLog, Role
+from core.tests.factory import TenantFactory, RoleFactory
+from core.views.base_views import BaseView
+from users.tests.factory import UserFactory
+
+
+class BulkAuditTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.user = UserFactory.create(self.tenant, username='admin', email='admin@example.com')
+        self.roles = [RoleFactory.create(self.tenant, key=f'role-{position}') for position in range(5)]
+
+    def create_request(self):
+        request = RequestFactory().get('/roles/', HTTP_USER_AGENT='Firefox')
+        request.user = self.user
+        request.session = {}
+        return request
+
+    def test_view_logs_many_objects_with_one_insert(self):
+        view = BaseView()
+        view.request = Request(self.create_request())
+        view.request.user = self.user
+
+        # Context lookup, context insert and re-read, then one audit log insert
+        with self.assertNumQueries(4):
+            view.log_activity_bulk(self.roles, 'archived', 'archived')
+
+        logs = AuditLog.objects.filter(activity_type='archived')
+        self.assertEqual(logs.count(), 5)
+        self.assertEqual(len(set(logs.values_list('transaction_id', flat=True))), 1)
+        self.assertEqual(set(logs.values_list('entity_id', flat=True)), {role.id for role in self.roles})
+
+    def test_view_bulk_logs_accept_a_transaction_id(self):
+        view = BaseView()
+        view.request = Request(self.create_request())
+        view.request.user = self.user
+
+        view.log_activity_bulk(self.roles, 'archived', 'archived', transaction_id='import-42')
+
+        logs = AuditLog.objects.filter(activity_type='archived')
+        self.assertEqual(set(logs.values_list('transaction_id', flat=True)), {'import-42'})
+
+    def test_admin_bulk_delete_is_logged_in_one_batch(self):
+        admin = RoleAdmin(Role, AdminSite())
+
+        admin.delete_queryset(self.create_request(), Role.objects.filter(tenant=self.tenant))
+
+        logs = AuditLog.objects.filter(activity_type='deleted', entity_type='role')
+        self.assertFalse(Role.objects.filter(tenant=self.tenant).exists())
+        self.assertEqual(logs.count(), 5)
+        self.assertEqual(len(set(logs.values_list('transaction_id', flat=True))), 1)
+        self.assertEqual(set(logs.values_list('created_by', flat=True)), {self.user.id})
@@ -0,0 +1,131 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.enums import SystemRole
+from core.models import Role
+from core.tests.factory import RoleFactory, TenantFactory
+from core.utilities.caching import MISSING, CacheRegion, invalidate_tenant, object_tag
+from core.views.role_views import RoleListCreateView
+from users.tests.factory import UserFactory
+
+
+class CacheRegionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tenant = TenantFactory.create()
+        self.region = CacheRegion('test', models=['core.Role'])
+        self.compute = mock.Mock(return_value=['reviewer'])
+
+    def test_get_or_set_computes_once(self):
+        self.assertIs(self.region.get(self.tenant.id, 'roles'), MISSING)
+
+        self.region.get_or_set(self.compute, self.tenant.id, 'roles')
+        value = self.region.get_or_set(self.compute, self.tenant.id, 'roles')
+
+        self.assertEqual(value, ['reviewer'])
+        self.compute.assert_called_once()
+
+    def test_none_is_cached(self):
+        self.compute.return_value = None
+
+        self.region.get_or_set(self.compute, self.tenant.id, 'roles')
+        value = self.region.get_or_set(self.compute, self.tenant.id, 'roles')
+
+        self.assertIsNone(value)
+        self.assertIsNone(self.region.get(self.tenant.id, 'roles'))
+        self.compute.assert_called_once()
+
+    def test_model_write_invalidates_tenant_entries(self):
+        other_tenant = TenantFactory.create()
+        self.region.set(['cached'], self.tenant.id, 'roles')
+        self.region.set(['cached'], other_tenant.id, 'roles')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RoleFactory.create(self.tenant, key='approver', label='Approver')
+
+        self.assertIs(self.region.get(self.tenant.id, 'roles'), MISSING)
+        self.assertEqual(self.region.get(other_tenant.id, 'roles'), ['cached'])
+
+    def test_tenantless_write_invalidates_every_tenant(self):
+        self.region.set(['cached'], self.tenant.id, 'roles')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RoleFactory.create(None, key=SystemRole.TENANT_EMPLOYEE.value, label='Employee', is_system=True)
+
+        self.assertIs(self.region.get(self.tenant.id, 'roles'), MISSING)
+
+    def test_object_tag_is_invalidated_by_its_row_only(self):
+        role = RoleFactory.create(self.tenant, key='reviewer', label='Reviewer')
+        region = CacheRegion('objects')
+        region.set('cached', self.tenant.id, 'role', tags=[object_tag(role)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            role.label = 'Senior reviewer'
+            role.save()
+
+        self.assertIs(region.get(self.tenant.id, 'role', tags=[object_tag(role)]), MISSING)
+
+    def test_invalidate_tenant(self):
+        self.region.set(['cached'], self.tenant.id, 'roles')
+
+        invalidate_tenant(self.tenant.id)
+
+        self.assertIs(self.region.get(self.tenant.id, 'roles'), MISSING)
+
+    def test_region_is_flushed_past_max_entries(self):
+        region = CacheRegion('bounded', max_entries=2)
+        for page in range(3):
+            region.set([page], self.tenant.id, page)
+
+        self.assertIs(region.get(self.tenant.id, 0), MISSING)
+
+    def test_cached_decorator_keys_on_qualified_name_and_instances(self):
+        role = RoleFactory.create(self.tenant, key='reviewer', label='Reviewer')
+
+        class First:
+            @staticmethod
+            @self.region.cached
+            def lookup(tenant, role):
+                return ('first', role.key)
+
+        class Second:
+            @staticmethod
+            @self.region.cached
+            def lookup(tenant, role):
+                return ('second', role.key)
+
+        self.assertEqual(First.lookup(self.tenant, role), ('first', 'reviewer'))
+        self.assertEqual(Second.lookup(self.tenant, role), ('second', 'reviewer'))
+
+
+class CachedRoleListTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tenant = TenantFactory.create()
+        self.user = UserFactory.create(self.tenant, username='owner', email='owner@example.com')
+        RoleFactory.create(self.tenant, key='reviewer', label='Reviewer')
+        self.view = RoleListCreateView.as_view()
+
+    def get_roles(self):
+        request = APIRequestFactory().get('/api/core/roles/')
+        force_authenticate(request, user=self.user)
+        return self.view(request)
+
+    def test_list_is_served_from_region(self):
+        first = self.get_roles()
+
+        with self.assertNumQueries(0):
+            second = self.get_roles()
+
+        self.assertEqual(second.data, first.data)
+
+    def test_role_write_refreshes_list(self):
+        self.get_roles()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Role.objects.create(tenant=self.tenant, key='approver', label='Approver')
+
+        self.assertEqual({role['key'] for role in self.get_roles().data}, {'reviewer', 'approver'})
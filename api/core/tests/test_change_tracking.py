@@ -0,0 +1,58 @@
+from django.test import TestCase
+
+from core.models import Role
+from core.tests.factory import TenantFactory, RoleFactory
+from core.views.base_views import BaseView
+
+
+class ChangeTrackingTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.other_tenant = TenantFactory.create()
+        RoleFactory.create(self.tenant, key='reviewer', label='Reviewer')
+
+    def test_save_records_only_changed_fields(self):
+        role = Role.objects.get(key='reviewer')
+        role.label = 'Senior Reviewer'
+        role.tenant = self.other_tenant
+        role.save()
+
+        self.assertEqual(role.tracked_changes, {
+            'label': ('Reviewer', 'Senior Reviewer'),
+            'tenant': (self.tenant.id, self.other_tenant.id),
+        })
+
+    def test_snapshot_resets_after_save(self):
+        role = Role.objects.get(key='reviewer')
+        role.label = 'Senior Reviewer'
+        role.save()
+        role.save()
+
+        self.assertEqual(role.tracked_changes, {})
+
+    def test_update_fields_limit_the_recorded_changes(self):
+        role = Role.objects.get(key='reviewer')
+        role.label = 'Senior Reviewer'
+        role.key = 'senior-reviewer'
+        role.save(update_fields=['label'])
+
+        self.assertEqual(list(role.tracked_changes), ['label'])
+        self.assertEqual(role.get_tracked_changes(), {'key': ('reviewer', 'senior-reviewer')})
+
+    def test_deferred_fields_are_not_tracked(self):
+        role = Role.objects.only('id', 'key').get(key='reviewer')
+        role.label = 'Senior Reviewer'
+        role.save()
+
+        self.assertEqual(role.tracked_changes, {})
+
+    def test_change_data_holds_primitive_values(self):
+        role = Role.objects.get(key='reviewer')
+        role.tenant = self.other_tenant
+        role.save()
+
+        change_summary, old_values, new_values = BaseView().get_change_data(role)
+
+        self.assertEqual(old_values, {'tenant': str(self.tenant.id)})
+        self.assertEqual(new_values, {'tenant': str(self.other_tenant.id)})
+        self.assertEqual(change_summary, {'tenant': {'old': str(self.tenant.id), 'new': str(self.other_tenant.id)}})
@@ -0,0 +1,78 @@
+import base64
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.models import AuditLog
+from core.tests.factory import TenantFactory, AuditLogFactory
+from core.utilities.pagination import CursorPagination
+
+
+class CursorPaginationTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.factory = APIRequestFactory()
+        base = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+        # Pairs of logs share a timestamp so the id tie-breaker is exercised
+        for position in range(7):
+            log = AuditLogFactory.create(tenant=self.tenant)
+            AuditLog.objects.filter(pk=log.pk).update(created_at=base + timedelta(minutes=position // 2))
+        self.expected = list(AuditLog.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def paginate(self, url, queryset=None):
+        paginator = CursorPagination()
+        request = Request(self.factory.get(url))
+        page = paginator.paginate_queryset(
+            AuditLog.objects.all() if queryset is None else queryset, request
+        )
+        return [log.id for log in page], paginator
+
+    def cursor(self, link):
+        return parse_qs(urlparse(link).query)['cursor'][0]
+
+    def test_walks_every_row_once_in_order(self):
+        seen, paginator = self.paginate('/audit/?page_size=3')
+        while paginator.get_next_link():
+            page, paginator = self.paginate(f'/audit/?page_size=3&cursor={self.cursor(paginator.get_next_link())}')
+            seen += page
+
+        self.assertEqual(seen, self.expected)
+
+    def test_previous_link_returns_the_preceding_page(self):
+        first, paginator = self.paginate('/audit/?page_size=3')
+        self.assertIsNone(paginator.get_previous_link())
+
+        second, paginator = self.paginate(f'/audit/?page_size=3&cursor={self.cursor(paginator.get_next_link())}')
+        back, paginator = self.paginate(f'/audit/?page_size=3&cursor={self.cursor(paginator.get_previous_link())}')
+
+        self.assertEqual(second, self.expected[3:6])
+        self.assertEqual(back, first)
+        self.assertIsNone(paginator.get_previous_link())
+
+    def test_lists_are_paginated_like_querysets(self):
+        logs = list(AuditLog.objects.all())
+        first, paginator = self.paginate('/audit/?page_size=4', logs)
+        second, _ = self.paginate(f'/audit/?page_size=4&cursor={self.cursor(paginator.get_next_link())}', logs)
+
+        self.assertEqual(first + second, self.expected)
+
+    def test_invalid_cursor_is_rejected(self):
+        with self.assertRaises(NotFound):
+            self.paginate('/audit/?cursor=not-a-cursor')
+
+    def test_cursor_with_invalid_id_is_rejected(self):
+        position = {'c': '2024-01-01T00:00:00+00:00', 'i': 'not-a-uuid', 'd': 'next'}
+        cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+        with self.assertRaises(NotFound):
+            self.paginate(f'/audit/?cursor={cursor}')
+
+    def test_page_size_is_capped(self):
+        request = Request(self.factory.get('/audit/?page_size=100000'))
+
+        self.assertEqual(CursorPagination().get_page_size(request), CursorPagination.max_page_size)
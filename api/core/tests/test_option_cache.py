@@ -0,0 +1,108 @@
+import threading
+import uuid
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import serializers
+
+from core.serializers.option_serializers import CachedOptionField
+from core.tests.factory import TenantFactory
+from core.utilities import option_cache
+from core.utilities.option_cache import get_option, get_options
+from engagements.models import Ticket, WorkItemStatus
+from engagements.serializers.work_item_status_serializers import WorkItemStatusListSerializer
+from engagements.tests.factory import TicketFactory, WorkItemStatusFactory
+
+
+class TicketStatusSerializer(serializers.ModelSerializer):
+    status = CachedOptionField(WorkItemStatusListSerializer)
+
+    class Meta:
+        model = Ticket
+        fields = ['id', 'status']
+
+
+class OptionCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        option_cache._local_options.clear()
+        self.tenant = TenantFactory.create()
+        self.status = WorkItemStatusFactory.create(self.tenant, None, label='Open')
+
+    def test_repeated_lookups_are_served_in_process(self):
+        get_options(WorkItemStatus, self.tenant.id)
+
+        with self.assertNumQueries(0):
+            option = get_option(WorkItemStatus, self.tenant.id, self.status.id)
+
+        self.assertEqual(option.label, 'Open')
+
+    def test_other_processes_are_served_from_shared_cache(self):
+        get_options(WorkItemStatus, self.tenant.id)
+        option_cache._local_options.clear()
+
+        with self.assertNumQueries(0):
+            option = get_option(WorkItemStatus, self.tenant.id, self.status.id)
+
+        self.assertEqual(option.label, 'Open')
+
+    def test_write_bumps_version(self):
+        get_options(WorkItemStatus, self.tenant.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.status.label = 'Reopened'
+            self.status.save()
+
+        self.assertEqual(get_option(WorkItemStatus, self.tenant.id, self.status.id).label, 'Reopened')
+
+    def test_tenants_are_isolated(self):
+        other_tenant = TenantFactory.create()
+
+        self.assertIsNone(get_option(WorkItemStatus, other_tenant.id, self.status.id))
+
+    def test_local_tier_is_bounded(self):
+        other_tenant = TenantFactory.create()
+
+        with mock.patch.object(option_cache, 'OPTION_CACHE_LOCAL_SIZE', 1):
+            get_options(WorkItemStatus, self.tenant.id)
+            get_options(WorkItemStatus, other_tenant.id)
+
+        self.assertEqual(list(option_cache._local_options), [('engagements.WorkItemStatus', str(other_tenant.id))])
+
+    def test_concurrent_lookups_and_evictions(self):
+        tenant_ids = [uuid.uuid4() for _ in range(8)]
+        errors = []
+
+        def look_up(offset):
+            try:
+                for position in range(200):
+                    tenant_id = tenant_ids[(offset + position) % len(tenant_ids)]
+                    get_options(WorkItemStatus, tenant_id)
+                    if position % 7 == 0:
+                        option_cache.invalidate_option_cache(WorkItemStatus, tenant_id)
+            except Exception as error:
+                errors.append(error)
+
+        with mock.patch.object(option_cache, 'OPTION_CACHE_LOCAL_SIZE', 2), \
+                mock.patch.object(option_cache, '_load_options', return_value=[]):
+            threads = [threading.Thread(target=look_up, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(option_cache._local_options), 2)
+
+    def test_field_renders_options_without_joins(self):
+        for _ in range(3):
+            TicketFactory.create(self.tenant, None, status=self.status)
+        tickets = list(Ticket.objects.filter(tenant=self.tenant))
+        get_options(WorkItemStatus, self.tenant.id)
+
+        with self.assertNumQueries(0):
+            data = TicketStatusSerializer(tickets, many=True).data
+
+        self.assertEqual([row['status']['label'] for row in data], ['Open'] * 3)
+        self.assertEqual(data[0]['status'], WorkItemStatusListSerializer(self.status).data)
@@ -0,0 +1,53 @@
+from django.test import TestCase
+
+from core.models import AuditLog, RequestContext
+from core.serializers.audit_serializers import AuditLogSerializer
+from core.tests.factory import TenantFactory, AuditLogFactory
+from core.utilities.audit_writer import AuditLogWriter
+
+
+class RequestContextTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+
+    def test_matching_context_is_stored_once(self):
+        first = AuditLogFactory.create(self.tenant, session_id='abc', ip_address='10.0.0.1', user_agent='Firefox')
+        second = AuditLogFactory.create(self.tenant, session_id='abc', ip_address='10.0.0.1', user_agent='Firefox')
+        other = AuditLogFactory.create(self.tenant, session_id='abc', ip_address='10.0.0.2', user_agent='Firefox')
+
+        self.assertEqual(first.context_id, second.context_id)
+        self.assertNotEqual(first.context_id, other.context_id)
+        self.assertEqual(RequestContext.objects.count(), 2)
+
+    def test_forensic_values_read_through_the_context(self):
+        log = AuditLogFactory.create(self.tenant, session_id='abc', ip_address='10.0.0.1', user_agent='Firefox')
+
+        stored = AuditLog.objects.select_related('context').get(pk=log.pk)
+
+        self.assertEqual((stored.session_id, stored.ip_address, stored.user_agent), ('abc', '10.0.0.1', 'Firefox'))
+
+    def test_serializer_output_keeps_the_forensic_fields(self):
+        log = AuditLogFactory.create(self.tenant, session_id='abc', ip_address='10.0.0.1', user_agent='Firefox')
+
+        data = AuditLogSerializer(AuditLog.objects.select_related('context').get(pk=log.pk)).data
+
+        self.assertEqual(data['session_id'], 'abc')
+        self.assertEqual(data['ip_address'], '10.0.0.1')
+        self.assertEqual(data['user_agent'], 'Firefox')
+
+    def test_bulk_writes_intern_contexts(self):
+        writer = AuditLogWriter(flush_interval=None)
+        with self.captureOnCommitCallbacks(execute=True):
+            for position in range(3):
+                writer.write(AuditLog(
+                    tenant=self.tenant, entity_type='ticket', entity_id='12345678-1234-1234-1234-123456789012',
+                    entity_name=f'Ticket {position}', activity_type='created', description='Created',
+                    session_id='abc', ip_address='10.0.0.1', user_agent='Firefox',
+                ))
+
+        # Context lookup, context insert and re-read, then one audit log insert
+        with self.assertNumQueries(4):
+            writer.flush()
+
+        self.assertEqual(RequestContext.objects.count(), 1)
+        self.assertEqual(AuditLog.objects.filter(context__session_id='abc').count(), 3)
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import resolve
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.tests.factory import TenantFactory, RoleFactory
+from users.tests.factory import UserFactory
+
+
+class ResponseCacheTestCase(TestCase):
+    url = '/api/core/roles/'
+
+    def setUp(self):
+        cache.clear()
+        self.tenant = TenantFactory.create()
+        self.user = UserFactory.create(self.tenant, username='owner', email='owner@example.com')
+        RoleFactory.create(self.tenant, key='reviewer', label='Reviewer')
+
+    def login(self, user):
+        self.client.cookies['access_token'] = str(AccessToken.for_user(user))
+
+    def test_repeated_get_is_served_from_cache(self):
+        self.login(self.user)
+        first = self.client.get(self.url)
+        second = self.client.get(self.url)
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['Content-Type'], first['Content-Type'])
+
+    def test_write_makes_cached_response_unreachable(self):
+        self.login(self.user)
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RoleFactory.create(self.tenant, key='approver', label='Approver')
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual({role['key'] for role in response.json()}, {'reviewer', 'approver'})
+
+    def test_other_tenants_do_not_share_entries(self):
+        self.login(self.user)
+        self.client.get(self.url)
+
+        other_tenant = TenantFactory.create()
+        self.login(UserFactory.create(other_tenant, username='other', email='other@example.com'))
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json(), [])
+
+    def test_anonymous_requests_are_not_cached(self):
+        response = self.client.get(self.url)
+
+        self.assertNotIn('X-Cache', response)
+
+
+class ResponseCacheResourcesTestCase(SimpleTestCase):
+    def test_every_configured_prefix_resolves(self):
+        for prefix in settings.RESPONSE_CACHE_RESOURCES:
+            with self.subTest(prefix=prefix):
+                resolve(prefix)
@@ -0,0 +1,64 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from core.utilities.caching import MISSING
+from core.utilities.single_flight import single_flight
+
+
+class SingleFlightTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.compute = mock.Mock(return_value='computed')
+
+    def test_concurrent_callers_share_one_computation(self):
+        def slow_compute():
+            time.sleep(0.2)
+            return self.compute()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight('key', slow_compute)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['computed'] * 5)
+        self.compute.assert_called_once()
+
+    def test_stale_value_is_served_while_another_process_computes(self):
+        cache.add('key:lock', True)
+
+        self.assertEqual(single_flight('key', self.compute, stale='stale'), 'stale')
+        self.compute.assert_not_called()
+
+    def test_waits_for_result_of_another_process(self):
+        cache.add('key:lock', True)
+        threading.Timer(0.1, lambda: cache.set('key', 'stored')).start()
+
+        value = single_flight('key', self.compute, lookup=lambda: cache.get('key', MISSING))
+
+        self.assertEqual(value, 'stored')
+        self.compute.assert_not_called()
+
+    def test_computes_when_other_process_stores_nothing(self):
+        cache.add('key:lock', True)
+        threading.Timer(0.1, lambda: cache.delete('key:lock')).start()
+
+        value = single_flight('key', self.compute, lookup=lambda: cache.get('key', MISSING))
+
+        self.assertEqual(value, 'computed')
+
+    def test_lock_is_released_when_compute_fails(self):
+        self.compute.side_effect = RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            single_flight('key', self.compute)
+
+        self.assertIsNone(cache.get('key:lock'))
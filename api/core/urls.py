@@ -15,6 +15,7 @@ urlpatterns = [
     path(f"{API_PREFIX}", include("users.urls")),
     path(f"{API_PREFIX}", include("engagements.urls")),
     path(f"{API_PREFIX}", include("relations.urls")),
+    path(f"{API_PREFIX}", include("partners.urls")),
     path(f"{API_PREFIX}core/", include("core.urls_app")),
 ]
 
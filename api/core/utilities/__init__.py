@@ -8,8 +8,22 @@ from .authentication import (
 )
 from .pagination import OptimizedPageNumberPagination, CursorPagination, PerformancePaginator
 from .performance import QueryTimer, performance_monitor, DatabaseStats, CacheStats, log_performance_metrics
-from .middleware import QueryCountMiddleware, CacheMiddleware, PrefetchTenantMiddleware
+from .middleware import QueryCountMiddleware, PrefetchTenantMiddleware
+from .response_cache import ResponseCacheMiddleware
 from .validators import hex_color_validator
+from .cache_versions import get_cache_version, get_cache_versions, bump_cache_version
+from .option_cache import get_options, get_option, invalidate_option_cache
+from .caching import (
+    CacheRegion, get_cache_region, MISSING, tenant_tag, model_tag, object_tag, invalidate_tags, invalidate_tenant,
+)
+from .single_flight import single_flight
+from .audit_writer import (
+    AuditLogWriter, audit_writer, write_audit_log, write_audit_logs, enqueue_audit_log, enqueue_audit_logs,
+    relay_audit_outbox,
+)
+from .audit_archive import archive_audit_logs, archive_period, read_archived_logs
+from .audit_export import stream_audit_export
+from .audit_search import AuditSearchFilter, get_audit_search_backend, search_audit_logs
 # Import exceptions lazily to avoid circular imports
 # from .exceptions import custom_exception_handler
 
@@ -36,11 +50,44 @@ __all__ = [
     
     # Middleware utilities
     'QueryCountMiddleware',
-    'CacheMiddleware',
+    'ResponseCacheMiddleware',
     'PrefetchTenantMiddleware',
 
     # Validator utilities
     'hex_color_validator',
+
+    # Cache utilities
+    'get_cache_version',
+    'get_cache_versions',
+    'bump_cache_version',
+    'get_options',
+    'get_option',
+    'invalidate_option_cache',
+    'CacheRegion',
+    'get_cache_region',
+    'MISSING',
+    'tenant_tag',
+    'model_tag',
+    'object_tag',
+    'invalidate_tags',
+    'invalidate_tenant',
+    'single_flight',
+
+    # Audit utilities
+    'AuditLogWriter',
+    'audit_writer',
+    'write_audit_log',
+    'write_audit_logs',
+    'enqueue_audit_log',
+    'enqueue_audit_logs',
+    'relay_audit_outbox',
+    'archive_audit_logs',
+    'archive_period',
+    'read_archived_logs',
+    'stream_audit_export',
+    'AuditSearchFilter',
+    'get_audit_search_backend',
+    'search_audit_logs',
     
     # Exception utilities
     # 'custom_exception_handler',  # Imported lazily to avoid circular imports
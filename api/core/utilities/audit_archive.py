@@ -0,0 +1,175 @@
+import gzip
+import json
+import uuid
+from datetime import timedelta
+from itertools import groupby
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import TruncMonth
+from django.utils.dateparse import parse_datetime
+
+ARCHIVE_DELETE_CHUNK_SIZE = 500
+
+
+def get_archive_dir():
+    return Path(getattr(settings, 'AUDIT_LOG_ARCHIVE_DIR', Path(settings.BASE_DIR) / 'audit_archive'))
+
+
+def _get_archive_fields():
+    from core.models import AuditLog
+
+    return [field.attname for field in AuditLog._meta.concrete_fields if field.name != 'context']
+
+
+def _get_archive_context():
+    from core.models.request_context import REQUEST_CONTEXT_FIELDS
+
+    # Archives hold the forensic values themselves, not context ids
+    return {field: F(f'context__{field}') for field in REQUEST_CONTEXT_FIELDS}
+
+
+def _month_start(value):
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(value):
+    return _month_start(_month_start(value) + timedelta(days=32))
+
+
+def archive_audit_logs(before, archive_dir=None):
+    """
+    Move audit logs created before `before` into per-tenant monthly archives.
+
+    Returns the AuditLogArchive records written.
+    """
+    from core.models import AuditLog
+
+    periods = (
+        AuditLog.objects.filter(created_at__lt=before)
+        .annotate(period=TruncMonth('created_at'))
+        .values_list('tenant_id', 'period')
+        .distinct()
+        .order_by('period')
+    )
+    archives = []
+    for tenant_id, period in periods:
+        archive = archive_period(tenant_id, period, before, archive_dir)
+        if archive is not None:
+            archives.append(archive)
+    return archives
+
+
+def archive_period(tenant_id, period, before=None, archive_dir=None):
+    """
+    Write one tenant's audit logs of one month to a gzip JSON lines file,
+    then delete exactly those rows.
+
+    The file is complete before the rows are deleted, and the archive record
+    is created in the same transaction as the delete, so a crash leaves
+    either the rows in place or a recorded archive, never neither.
+    """
+    from core.models import AuditLog, AuditLogArchive
+
+    start = _month_start(period)
+    end = _next_month(period)
+    if before is not None:
+        end = min(end, before)
+
+    archive_dir = Path(archive_dir or get_archive_dir()) / str(tenant_id or 'system')
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f'{start:%Y-%m}-{uuid.uuid4().hex[:8]}.jsonl.gz'
+
+    rows = (
+        AuditLog.objects.filter(tenant_id=tenant_id)
+        .for_period(start, end)
+        .order_by('created_at', 'id')
+        .values(*_get_archive_fields(), **_get_archive_context())
+        .iterator(chunk_size=2000)
+    )
+    archived_ids = []
+    with gzip.open(path, 'wt', encoding='utf-8') as archive_file:
+        for row in rows:
+            archive_file.write(json.dumps(row, cls=DjangoJSONEncoder) + '\n')
+            archived_ids.append(row['id'])
+
+    if not archived_ids:
+        path.unlink()
+        return None
+
+    with transaction.atomic():
+        archive = AuditLogArchive.objects.create(
+            tenant_id=tenant_id,
+            period=start.date(),
+            path=str(path),
+            row_count=len(archived_ids),
+        )
+        for offset in range(0, len(archived_ids), ARCHIVE_DELETE_CHUNK_SIZE):
+            AuditLog.objects.filter(id__in=archived_ids[offset:offset + ARCHIVE_DELETE_CHUNK_SIZE]).delete()
+    return archive
+
+
+def _matches(row, filters):
+    for field, allowed in filters.items():
+        if allowed is not None and str(row.get(field)) not in allowed:
+            return False
+    return True
+
+
+def _read_archive_rows(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as archive_file:
+        for line in archive_file:
+            row = json.loads(line)
+            row['created_at'] = parse_datetime(row['created_at'])
+            row['updated_at'] = parse_datetime(row['updated_at'])
+            yield row
+
+
+def _archive_sort_key(row):
+    return row['created_at'], str(row['id'])
+
+
+def read_archived_logs(tenant, start=None, end=None, newest_first=False, search=None, **filters):
+    """
+    Yield archived audit logs of a tenant created in [start, end) as unsaved
+    AuditLog instances, ordered on (created_at, id), oldest first unless
+    newest_first.
+
+    Only the archive files of months overlapping the range are opened, one
+    month at a time, so a reader that stops early never touches the other
+    months. filters maps a field to the allowed values, compared as
+    strings, for example entity_type=['ticket', 'case']. search keeps the
+    logs containing every word of it, as ?search= does on the live table.
+    """
+    from core.models import AuditLog, AuditLogArchive
+    from core.utilities.audit_search import matches_audit_search
+
+    filters = {
+        field: {str(value) for value in values} if values is not None else None
+        for field, values in filters.items()
+    }
+    archives = AuditLogArchive.objects.filter(tenant=tenant)
+    if start is not None:
+        archives = archives.filter(period__gte=_month_start(start).date())
+    if end is not None:
+        archives = archives.filter(period__lt=end.date() if hasattr(end, 'date') else end)
+
+    order = '-' if newest_first else ''
+    months = groupby(archives.order_by(f'{order}period', 'id'), key=lambda archive: archive.period)
+    for _, month_archives in months:
+        rows = (
+            row
+            for archive in month_archives
+            for row in _read_archive_rows(archive.path)
+            if (start is None or row['created_at'] >= start)
+            and (end is None or row['created_at'] < end)
+            and _matches(row, filters)
+            and (not search or matches_audit_search(row, search))
+        )
+        # Files are written oldest first, but a month may have several
+        rows = sorted(rows, key=_archive_sort_key, reverse=newest_first)
+        for row in rows:
+            yield AuditLog(**row)
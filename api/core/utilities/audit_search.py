@@ -0,0 +1,230 @@
+import operator
+import re
+from abc import ABC, abstractmethod
+from functools import reduce
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+
+AUDIT_SEARCH_FIELDS = ['description', 'entity_name', 'business_process']
+
+
+def _get_terms(text):
+    return re.findall(r'\w+', text)
+
+
+class AuditSearchBackend(ABC):
+    """
+    Full text index over the AuditLog search fields.
+
+    install() creates the index and whatever keeps it in sync with inserts
+    inside the database, so every write path (bulk_create, outbox relay,
+    archive deletes) is covered. restore() puts back what a migration that
+    rebuilt the table dropped. filter() narrows a queryset to the logs
+    matching every word of the query, by word prefix.
+    """
+
+    vendor = None
+
+    def __init__(self, table):
+        self.table = table
+
+    @abstractmethod
+    def install(self, cursor):
+        """Create the index and keep it in sync with the table, then fill it."""
+
+    @abstractmethod
+    def uninstall(self, cursor):
+        """Drop the index and everything keeping it in sync."""
+
+    @abstractmethod
+    def rebuild(self, cursor):
+        """Reindex every row of the table."""
+
+    def restore(self, cursor):
+        """Reinstall what keeps an installed index in sync if a table rebuild dropped it."""
+
+    @abstractmethod
+    def get_match_sql(self):
+        """SQL selecting the ids of the logs matching a %s query."""
+
+    @abstractmethod
+    def get_query(self, terms):
+        """The query matching every term by word prefix."""
+
+    def filter(self, queryset, text):
+        terms = _get_terms(text)
+        if not terms:
+            return queryset
+        return queryset.filter(id__in=RawSQL(self.get_match_sql(), [self.get_query(terms)]))
+
+
+class SQLiteFTSBackend(AuditSearchBackend):
+    """
+    FTS5 table holding the search fields with the audit log id.
+
+    Rows are found by the id column rather than by rowid, which VACUUM may
+    renumber on a table without an integer primary key.
+    """
+
+    vendor = 'sqlite'
+    id_column = 'audit_id'
+
+    @property
+    def index_table(self):
+        return f'{self.table}_fts'
+
+    def get_delete_sql(self):
+        return (
+            f"DELETE FROM {self.index_table} WHERE rowid IN (SELECT rowid FROM {self.index_table} "
+            f"WHERE {self.index_table} MATCH '{self.id_column}:\"' || old.id || '\"')"
+        )
+
+    @property
+    def trigger_names(self):
+        return [f'{self.index_table}_{trigger}' for trigger in ('insert', 'delete', 'update')]
+
+    def install(self, cursor):
+        fields = ', '.join(AUDIT_SEARCH_FIELDS)
+        new_values = ', '.join(f'new.{field}' for field in AUDIT_SEARCH_FIELDS)
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.index_table} USING fts5({self.id_column}, {fields})"
+        )
+        # Triggers are dropped when a migration rebuilds the table; restore()
+        # reinstalls them after migrate
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {self.index_table}_insert AFTER INSERT ON {self.table} BEGIN "
+            f"INSERT INTO {self.index_table}({self.id_column}, {fields}) VALUES (new.id, {new_values}); END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {self.index_table}_delete AFTER DELETE ON {self.table} BEGIN "
+            f"{self.get_delete_sql()}; END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {self.index_table}_update AFTER UPDATE OF {fields} ON {self.table} BEGIN "
+            f"{self.get_delete_sql()}; "
+            f"INSERT INTO {self.index_table}({self.id_column}, {fields}) VALUES (new.id, {new_values}); END"
+        )
+        self.rebuild(cursor)
+
+    def restore(self, cursor):
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name = %s OR (type = 'trigger' AND tbl_name = %s)",
+            [self.index_table, self.table],
+        )
+        names = {name for name, in cursor.fetchall()}
+        if self.index_table not in names or names.issuperset(self.trigger_names):
+            return
+        # Rows written while the triggers were missing are not indexed, so
+        # install() also reindexes the table
+        self.install(cursor)
+
+    def uninstall(self, cursor):
+        for trigger in self.trigger_names:
+            cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        cursor.execute(f'DROP TABLE IF EXISTS {self.index_table}')
+
+    def rebuild(self, cursor):
+        fields = ', '.join(AUDIT_SEARCH_FIELDS)
+        cursor.execute(f'DELETE FROM {self.index_table}')
+        cursor.execute(
+            f'INSERT INTO {self.index_table}({self.id_column}, {fields}) SELECT id, {fields} FROM {self.table}'
+        )
+
+    def get_match_sql(self):
+        return f'SELECT {self.id_column} FROM {self.index_table} WHERE {self.index_table} MATCH %s'
+
+    def get_query(self, terms):
+        # Only the search fields, so a term never matches an id
+        words = ' '.join(f'"{term}"*' for term in terms)
+        return f"{{{' '.join(AUDIT_SEARCH_FIELDS)}}} : ({words})"
+
+
+class PostgresSearchBackend(AuditSearchBackend):
+    """Stored tsvector column generated from the search fields, with a GIN index."""
+
+    vendor = 'postgresql'
+    column = 'search_vector'
+
+    def install(self, cursor):
+        document = " || ' ' || ".join(f"coalesce({field}, '')" for field in AUDIT_SEARCH_FIELDS)
+        cursor.execute(
+            f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS {self.column} tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('simple', {document})) STORED"
+        )
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS {self.table}_search_idx ON {self.table} USING GIN ({self.column})'
+        )
+
+    def uninstall(self, cursor):
+        cursor.execute(f'DROP INDEX IF EXISTS {self.table}_search_idx')
+        cursor.execute(f'ALTER TABLE {self.table} DROP COLUMN IF EXISTS {self.column}')
+
+    def rebuild(self, cursor):
+        # A generated column is always current
+        pass
+
+    def get_match_sql(self):
+        return f"SELECT id FROM {self.table} WHERE {self.column} @@ to_tsquery('simple', %s)"
+
+    def get_query(self, terms):
+        return ' & '.join(f'{term}:*' for term in terms)
+
+
+SEARCH_BACKENDS = {backend.vendor: backend for backend in (SQLiteFTSBackend, PostgresSearchBackend)}
+
+
+def get_audit_search_backend(using='default'):
+    """The search backend for the database vendor, or None if it has none."""
+    from core.models import AuditLog
+
+    backend = SEARCH_BACKENDS.get(connections[using].vendor)
+    return backend(AuditLog._meta.db_table) if backend else None
+
+
+def restore_audit_search_index(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """post_migrate receiver restoring the search index triggers after a table rebuild."""
+    backend = get_audit_search_backend(using)
+    if backend is None:
+        return
+    with connections[using].cursor() as cursor:
+        backend.restore(cursor)
+
+
+def search_audit_logs(queryset, text):
+    """
+    Narrow an AuditLog queryset to the logs containing every word of text
+    in a search field. Uses the full text index where the database has one,
+    by word prefix, and falls back to case insensitive substring matches.
+    """
+    backend = get_audit_search_backend(queryset.db)
+    if backend is not None:
+        return backend.filter(queryset, text)
+    for term in _get_terms(text):
+        queryset = queryset.filter(
+            reduce(operator.or_, (Q(**{f'{field}__icontains': term}) for field in AUDIT_SEARCH_FIELDS))
+        )
+    return queryset
+
+
+def matches_audit_search(row, text):
+    """
+    Whether a row (a dict of the search fields) contains every word of text
+    by word prefix, as the full text index matches. Used for logs that are
+    no longer in the table, such as archived ones.
+    """
+    words = [
+        word.lower()
+        for field in AUDIT_SEARCH_FIELDS
+        for word in _get_terms(row.get(field) or '')
+    ]
+    return all(any(word.startswith(term.lower()) for word in words) for term in _get_terms(text))
+
+
+class AuditSearchFilter(SearchFilter):
+    """SearchFilter answering ?search= with search_audit_logs."""
+
+    def filter_queryset(self, request, queryset, view):
+        return search_audit_logs(queryset, ' '.join(self.get_search_terms(request)))
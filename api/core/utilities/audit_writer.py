@@ -0,0 +1,209 @@
+import atexit
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogWriter:
+    """
+    Buffered writer that moves AuditLog INSERTs off the request path.
+
+    Records are queued in memory and inserted with bulk_create by a
+    background thread, at most batch_size at a time and at least every
+    flush_interval seconds. The queue is bounded: when it is full the record
+    is written synchronously instead of being dropped. Records passed with
+    sync=True (high risk events) always bypass the queue, and the queue is
+    drained when the process exits.
+
+    Buffered records are queued only once the caller's transaction commits,
+    so a rolled back request leaves no audit rows. created_at is set when
+    the record is built, so buffered rows sort with synchronous ones by the
+    time of the event rather than of the flush.
+    """
+
+    def __init__(self, max_queue_size=10000, batch_size=500, flush_interval=1.0):
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def write(self, log, sync=False):
+        if sync:
+            log.save(force_insert=True)
+            return
+        transaction.on_commit(lambda: self._enqueue(log))
+
+    def _enqueue(self, log):
+        try:
+            self.queue.put_nowait(log)
+        except queue.Full:
+            logger.warning("Audit log queue is full, writing synchronously")
+            log.save(force_insert=True)
+            return
+        self._ensure_thread()
+        if self.queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def flush(self):
+        """Write everything queued so far; returns the number of records written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = self._take(self.batch_size)
+                if not batch:
+                    return written
+                self._write_batch(batch)
+                written += len(batch)
+
+    def _take(self, limit):
+        batch = []
+        try:
+            while len(batch) < limit:
+                batch.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write_batch(self, batch):
+        from core.models import AuditLog
+
+        try:
+            AuditLog.resolve_contexts(batch)
+            AuditLog.objects.bulk_create(batch, batch_size=self.batch_size)
+        except Exception:
+            # One bad record must not take the rest of the batch with it
+            logger.exception("Bulk audit log write failed, retrying records one by one")
+            for log in batch:
+                try:
+                    log.save(force_insert=True)
+                except Exception:
+                    logger.exception("Could not write audit log %s", log.id)
+
+    def _ensure_thread(self):
+        if self.flush_interval is None or (self._thread and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            close_old_connections()
+            self.flush()
+
+
+audit_writer = AuditLogWriter(
+    max_queue_size=getattr(settings, 'AUDIT_LOG_QUEUE_SIZE', 10000),
+    batch_size=getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 500),
+    flush_interval=getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 1.0),
+)
+
+
+@atexit.register
+def _flush_on_shutdown():
+    audit_writer.flush()
+    connections.close_all()
+
+
+def _get_outbox_payload(log):
+    return {
+        field.attname: field.value_from_object(log)
+        for field in log._meta.concrete_fields
+        if field.attname not in ('id', 'created_at', 'updated_at')
+    }
+
+
+def enqueue_audit_log(log):
+    """Append an unsaved AuditLog to the outbox, inside the caller's transaction."""
+    from core.models import AuditLog, AuditOutbox
+
+    AuditLog.resolve_contexts([log])
+    AuditOutbox.objects.create(audit_log_id=log.id, payload=_get_outbox_payload(log))
+
+
+def enqueue_audit_logs(logs):
+    """Append many unsaved AuditLogs to the outbox with one insert."""
+    from core.models import AuditLog, AuditOutbox
+
+    AuditLog.resolve_contexts(logs)
+    AuditOutbox.objects.bulk_create(
+        [AuditOutbox(audit_log_id=log.id, payload=_get_outbox_payload(log)) for log in logs]
+    )
+
+
+def relay_audit_outbox(batch_size=1000):
+    """
+    Move the oldest outbox entries into AuditLog; returns how many were moved.
+
+    Insert and outbox cleanup commit together, and AuditLog rows keep the
+    id assigned when the event was recorded, so every event lands exactly
+    once even if a relay crashes or two relays run at the same time.
+    """
+    from core.models import AuditLog, AuditOutbox
+
+    with transaction.atomic():
+        entries = list(AuditOutbox.objects.select_for_update(skip_locked=True).order_by('id')[:batch_size])
+        if not entries:
+            return 0
+
+        # created_at is the time the event was recorded, not the relay time
+        logs = [
+            AuditLog(id=entry.audit_log_id, created_at=entry.created_at, **entry.payload)
+            for entry in entries
+        ]
+        # Entries queued before contexts were interned carry the raw values
+        AuditLog.resolve_contexts(logs)
+        AuditLog.objects.bulk_create(logs, batch_size=batch_size, ignore_conflicts=True)
+        AuditOutbox.objects.filter(id__in=[entry.id for entry in entries]).delete()
+    return len(entries)
+
+
+def write_audit_log(log, sync=False):
+    """
+    Persist an unsaved AuditLog according to AUDIT_LOG_WRITE_MODE.
+
+    'buffered' queues the record on commit unless sync is set, 'outbox' appends it to
+    the outbox in the current transaction and 'sync' writes it inline.
+    """
+    mode = getattr(settings, 'AUDIT_LOG_WRITE_MODE', 'sync')
+    if mode == 'outbox':
+        enqueue_audit_log(log)
+        return
+    if mode != 'buffered':
+        sync = True
+    audit_writer.write(log, sync=sync)
+
+
+def write_audit_logs(logs, sync=False):
+    """
+    Persist many unsaved AuditLogs according to AUDIT_LOG_WRITE_MODE.
+
+    Synchronous writes and the outbox use a single bulk insert; buffered
+    mode queues the records for the writer's next batch.
+    """
+    from core.models import AuditLog
+
+    if not logs:
+        return
+    mode = getattr(settings, 'AUDIT_LOG_WRITE_MODE', 'sync')
+    if mode == 'outbox':
+        enqueue_audit_logs(logs)
+        return
+    if mode == 'buffered' and not sync:
+        for log in logs:
+            audit_writer.write(log)
+        return
+    AuditLog.resolve_contexts(logs)
+    AuditLog.objects.bulk_create(logs)
@@ -0,0 +1,43 @@
+import time
+from django.core.cache import cache
+
+
+def _version_key(parts):
+    return 'version:' + ':'.join(str(part) for part in parts)
+
+
+def _new_version():
+    # Time based so a counter that was evicted never restarts at an old value
+    return int(time.time() * 1000)
+
+
+def get_cache_version(*parts):
+    """Current version counter for a namespace such as ('statistics', tenant_id)."""
+    key = _version_key(parts)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_cache_versions(namespaces):
+    """Current versions of several namespaces with one cache round trip."""
+    keys = [_version_key(parts) for parts in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_cache_version(*parts):
+    """Invalidate everything keyed on this version counter without scanning keys."""
+    key = _version_key(parts)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _new_version()
+        cache.set(key, version, timeout=None)
+        return version
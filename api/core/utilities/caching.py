@@ -0,0 +1,208 @@
+import functools
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models, transaction
+
+from core.utilities.cache_versions import bump_cache_version, get_cache_versions
+
+DEFAULT_REGION_TIMEOUT = 300
+# Tag scope of rows without a tenant, such as system roles
+SHARED_SCOPE = 'shared'
+
+
+class _Sentinel:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f'<{self.name}>'
+
+    def __reduce__(self):
+        # Pickled by name, so the cache hands back this same object
+        return self.name
+
+
+# Returned by CacheRegion.get when nothing is cached
+MISSING = _Sentinel('MISSING')
+# Stored in place of None, so a computed None is a hit rather than a miss
+CACHED_MISS = _Sentinel('CACHED_MISS')
+
+
+def tenant_tag(tenant_id):
+    return ('tenant', str(tenant_id))
+
+
+def model_tag(model, tenant_id=None):
+    label = model if isinstance(model, str) else model._meta.label
+    return ('model', label, str(tenant_id) if tenant_id else SHARED_SCOPE)
+
+
+def object_tag(instance):
+    return ('object', instance._meta.label, str(instance.pk))
+
+
+def invalidate_tags(*tags):
+    for tag in tags:
+        bump_cache_version('cache-tag', *tag)
+
+
+def invalidate_tenant(tenant_id):
+    """Invalidate every region entry of a tenant."""
+    invalidate_tags(tenant_tag(tenant_id))
+
+
+def _get_tenant_id(value):
+    if isinstance(value, models.Model):
+        return value.pk if value._meta.label == 'core.Tenant' else value.tenant_id
+    return value
+
+
+def _key_part(value):
+    """Stable representation of a key argument; model instances become label and pk."""
+    if isinstance(value, models.Model):
+        return ('model', value._meta.label, str(value.pk))
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _key_part(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_key_part(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_key_part(item)) for item in value))
+    return repr(value)
+
+
+class CacheRegion:
+    """
+    A named group of cache entries sharing a timeout, a size limit and the
+    models they are computed from.
+
+    Entries are scoped to a tenant and keyed on the versions of their tags:
+    the tenant, the region itself, every model in models (for the tenant
+    and for tenantless rows) and any extra tags passed in. Bumping a tag
+    makes every entry carrying it unreachable, and model writes bump their
+    tags through signals. Once a tenant has more than max_entries entries
+    in the region, the region is flushed for that tenant.
+    """
+
+    def __init__(self, name, timeout=DEFAULT_REGION_TIMEOUT, max_entries=None, models=()):
+        self.name = name
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self.models = list(models)
+
+    def __repr__(self):
+        return f'<CacheRegion {self.name}>'
+
+    def region_tag(self, tenant_id):
+        return ('region', self.name, str(tenant_id))
+
+    def get_tags(self, tenant_id, tags=()):
+        return [
+            tenant_tag(tenant_id),
+            self.region_tag(tenant_id),
+            *[model_tag(label, tenant_id) for label in self.models],
+            *[model_tag(label) for label in self.models],
+            *tags,
+        ]
+
+    def get_key(self, tenant_id, parts, tags=()):
+        tags = self.get_tags(tenant_id, tags)
+        versions = get_cache_versions([('cache-tag', *tag) for tag in tags])
+        key_data = repr((_key_part(parts), list(zip(tags, versions))))
+        return f'region:{self.name}:{tenant_id}:{hashlib.md5(key_data.encode()).hexdigest()}'
+
+    def get(self, tenant_id, *parts, tags=()):
+        """The cached value, None for a cached miss, or MISSING."""
+        value = cache.get(self.get_key(tenant_id, parts, tags), MISSING)
+        return None if value is CACHED_MISS else value
+
+    def set(self, value, tenant_id, *parts, tags=()):
+        self._store(self.get_key(tenant_id, parts, tags), value, tenant_id)
+
+    def _store(self, key, value, tenant_id):
+        value = CACHED_MISS if value is None else value
+        cache.set(key, value, self.timeout)
+        if self.max_entries:
+            self._count_entry(tenant_id)
+        return value
+
+    def get_or_set(self, compute, tenant_id, *parts, tags=()):
+        """The cached value, computing it once across workers on a miss."""
+        from core.utilities.single_flight import single_flight
+
+        key = self.get_key(tenant_id, parts, tags)
+        value = cache.get(key, MISSING)
+        if value is MISSING:
+            value = single_flight(
+                key,
+                lambda: self._store(key, compute(), tenant_id),
+                lookup=lambda: cache.get(key, MISSING),
+            )
+        return None if value is CACHED_MISS else value
+
+    def invalidate(self, tenant_id):
+        invalidate_tags(self.region_tag(tenant_id))
+
+    def _count_entry(self, tenant_id):
+        [version] = get_cache_versions([('cache-tag', *self.region_tag(tenant_id))])
+        counter = f'region-size:{self.name}:{tenant_id}:{version}'
+        cache.add(counter, 0, self.timeout)
+        try:
+            size = cache.incr(counter)
+        except ValueError:
+            return
+        if size > self.max_entries:
+            self.invalidate(tenant_id)
+
+    def cached(self, func):
+        """
+        Decorator caching func in the region. The first argument is the
+        tenant (an id, a Tenant or a tenant-owned instance); the key covers
+        the function's qualified name and all arguments.
+        """
+        @functools.wraps(func)
+        def wrapper(tenant, *args, **kwargs):
+            return self.get_or_set(
+                lambda: func(tenant, *args, **kwargs),
+                _get_tenant_id(tenant),
+                func.__module__, func.__qualname__, _key_part(tenant), args, kwargs,
+            )
+        return wrapper
+
+
+_regions = {}
+
+
+def get_cache_region(name):
+    """The region declared under name in the CACHE_REGIONS setting."""
+    if name not in _regions:
+        declared = getattr(settings, 'CACHE_REGIONS', {})
+        if name not in declared:
+            raise ImproperlyConfigured(f'Cache region "{name}" is not declared in CACHE_REGIONS')
+        _regions[name] = CacheRegion(name, **declared[name])
+    return _regions[name]
+
+
+def get_region_models():
+    return {
+        label
+        for region in getattr(settings, 'CACHE_REGIONS', {}).values()
+        for label in region.get('models', ())
+    }
+
+
+def invalidate_cached_regions(sender, instance, **kwargs):
+    """post_save/post_delete receiver bumping the model and object tags of the written row."""
+    tracked = get_region_models()
+    labels = [
+        model._meta.label for model in [sender, *sender._meta.get_parent_list()]
+        if model._meta.label in tracked
+    ]
+    if not labels:
+        return
+    tenant_id = getattr(instance, 'tenant_id', None)
+    tags = [model_tag(label, tenant_id) for label in labels]
+    tags += [('object', label, str(instance.pk)) for label in labels]
+    transaction.on_commit(lambda: invalidate_tags(*tags))
@@ -1,10 +1,5 @@
-from django.utils.cache import get_cache_key, learn_cache_key
 from django.utils.deprecation import MiddlewareMixin
-from django.core.cache import cache
-from django.conf import settings
 from django.db import connection
-import hashlib
-import json
 import time
 from datetime import datetime
 
@@ -85,82 +80,6 @@ class QueryCountMiddleware(MiddlewareMixin):
         return response
 
 
-class CacheMiddleware(MiddlewareMixin):
-    """
-    Custom cache middleware for performance optimization.
-    Caches GET requests for specific endpoints.
-    """
-    
-    def process_request(self, request):
-        # Only cache GET requests
-        if request.method != 'GET':
-            return None
-            
-        # Only cache specific endpoints
-        cacheable_paths = [
-            '/api/relations/persons/',
-            '/api/relations/organizations/',
-            '/api/relations/roles/',
-            '/api/relations/relations/',
-            '/api/engagements/tickets/',
-            '/api/engagements/cases/',
-            '/api/engagements/jobs/',
-        ]
-        
-        if not any(request.path.startswith(path) for path in cacheable_paths):
-            return None
-            
-        # Create cache key based on path and query parameters
-        cache_key = self._get_cache_key(request)
-        
-        # Try to get cached response
-        cached_response = cache.get(cache_key)
-        if cached_response:
-            return cached_response
-            
-        return None
-    
-    def process_response(self, request, response):
-        # Only cache successful GET responses
-        if (request.method != 'GET' or 
-            response.status_code != 200 or
-            not any(request.path.startswith(path) for path in self._get_cacheable_paths())):
-            return response
-            
-        # Cache the response
-        cache_key = self._get_cache_key(request)
-        cache.set(cache_key, response, timeout=300)  # 5 minutes
-        
-        return response
-    
-    def _get_cache_key(self, request):
-        """Generate a unique cache key for the request."""
-        # Include tenant in cache key for multi-tenant isolation
-        tenant_id = getattr(request.user, 'tenant_id', 'anonymous')
-        
-        # Create key from path, query params, and tenant
-        key_data = {
-            'path': request.path,
-            'query': dict(request.GET.items()),
-            'tenant': tenant_id,
-        }
-        
-        key_string = json.dumps(key_data, sort_keys=True)
-        return f"api_cache:{hashlib.md5(key_string.encode()).hexdigest()}"
-    
-    def _get_cacheable_paths(self):
-        """Get list of cacheable API paths."""
-        return [
-            '/api/relations/persons/',
-            '/api/relations/organizations/',
-            '/api/relations/roles/',
-            '/api/relations/relations/',
-            '/api/engagements/tickets/',
-            '/api/engagements/cases/',
-            '/api/engagements/jobs/',
-        ]
-
-
 class PrefetchTenantMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -177,4 +96,4 @@ class PrefetchTenantMiddleware:
             )
             if user_with_tenant:
                 request.user = user_with_tenant
-        return self.get_response(request) 
\ No newline at end of file
+        return self.get_response(request)
@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.utilities.cache_versions import bump_cache_version, get_cache_version
+
+OPTION_CACHE_TIMEOUT = getattr(settings, 'OPTION_CACHE_TIMEOUT', 3600)
+OPTION_CACHE_LOCAL_SIZE = getattr(settings, 'OPTION_CACHE_LOCAL_SIZE', 256)
+
+# (model label, tenant id) -> (version, {option id: option}), least recently used first
+_local_options = OrderedDict()
+_local_options_lock = threading.Lock()
+
+
+def _get_key(model, tenant_id):
+    return model._meta.label, str(tenant_id)
+
+
+def _load_options(model, tenant_id):
+    rows = model.objects.filter(tenant_id=tenant_id).order_by().values(
+        *[field.attname for field in model._meta.concrete_fields]
+    )
+    return list(rows)
+
+
+def get_options(model, tenant_id):
+    """
+    All options of a BaseOption model for a tenant, as {id: unsaved instance}.
+
+    Looked up in the process LRU first, then in the shared cache, then in
+    the database. Both tiers are keyed on a version bumped by every option
+    write, so one cache round trip tells whether the local copy is current.
+    """
+    key = _get_key(model, tenant_id)
+    version = get_cache_version('options', *key)
+
+    with _local_options_lock:
+        local = _local_options.get(key)
+        if local is not None and local[0] == version:
+            _local_options.move_to_end(key)
+            return local[1]
+
+    shared_key = f'options:{key[0]}:{key[1]}:{version}'
+    rows = cache.get(shared_key)
+    if rows is None:
+        rows = _load_options(model, tenant_id)
+        cache.set(shared_key, rows, OPTION_CACHE_TIMEOUT)
+
+    options = {str(row['id']): model(**row) for row in rows}
+    with _local_options_lock:
+        _local_options[key] = (version, options)
+        _local_options.move_to_end(key)
+        while len(_local_options) > OPTION_CACHE_LOCAL_SIZE:
+            _local_options.popitem(last=False)
+    return options
+
+
+def get_option(model, tenant_id, option_id):
+    """A single cached option, or None if the tenant has no such option."""
+    if option_id is None:
+        return None
+    return get_options(model, tenant_id).get(str(option_id))
+
+
+def invalidate_option_cache(model, tenant_id):
+    key = _get_key(model, tenant_id)
+    bump_cache_version('options', *key)
+    with _local_options_lock:
+        _local_options.pop(key, None)
+
+
+def invalidate_cached_options(sender, instance, **kwargs):
+    """post_save/post_delete receiver bumping the option version of the tenant."""
+    from core.models import BaseOption
+
+    if not issubclass(sender, BaseOption):
+        return
+    tenant_id = instance.tenant_id
+    transaction.on_commit(lambda: invalidate_option_cache(sender, tenant_id))
@@ -1,7 +1,15 @@
+import base64
+import json
+import uuid
+from itertools import islice
+
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import QuerySet
-from rest_framework.pagination import PageNumberPagination
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class OptimizedPageNumberPagination(PageNumberPagination):
@@ -42,65 +50,124 @@ class OptimizedPageNumberPagination(PageNumberPagination):
         return response
 
 
-class CursorPagination(PageNumberPagination):
-    """Cursor-based pagination for better performance with large datasets."""
-    
-    page_size = 100
+class CursorPagination(BasePagination):
+    """
+    Cursor pagination keyed on (created_at, id), newest first.
+
+    Each page is fetched with a WHERE on the last seen (created_at, id) pair
+    instead of an OFFSET, so deep pages cost the same as the first one.
+    Cursors are opaque base64 tokens. Lists built in Python are paginated
+    the same way; other iterables (archived rows) must already be ordered
+    newest first, or oldest first from the cursor when paging backwards,
+    and are read only up to the end of the page.
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
     cursor_query_param = 'cursor'
-    ordering = '-created_at'
-    
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def encode_cursor(self, item, direction):
+        position = {'c': item.created_at.isoformat(), 'i': str(item.id), 'd': direction}
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            created_at = parse_datetime(position['c'])
+            item_id = str(uuid.UUID(position['i']))
+            direction = position['d']
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None or direction not in ('next', 'previous'):
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, item_id, direction
+
+    def _slice_queryset(self, queryset, cursor, limit):
+        if cursor is None:
+            return list(queryset.order_by('-created_at', '-id')[:limit])
+        created_at, item_id, direction = cursor
+        if direction == 'next':
+            after = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=item_id)
+            return list(queryset.filter(after).order_by('-created_at', '-id')[:limit])
+        before = Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=item_id)
+        return list(queryset.filter(before).order_by('created_at', 'id')[:limit])[::-1]
+
+    def _slice_list(self, items, cursor, limit):
+        key = lambda item: (item.created_at, str(item.id))
+        items = sorted(items, key=key, reverse=True)
+        if cursor is None:
+            return items[:limit]
+        created_at, item_id, direction = cursor
+        if direction == 'next':
+            return [item for item in items if key(item) < (created_at, item_id)][:limit]
+        return [item for item in items if key(item) > (created_at, item_id)][-limit:]
+
+    def _slice_iterable(self, items, cursor, limit):
+        key = lambda item: (item.created_at, str(item.id))
+        if cursor is None:
+            return list(islice(items, limit))
+        created_at, item_id, direction = cursor
+        if direction == 'next':
+            items = (item for item in items if key(item) < (created_at, item_id))
+            return list(islice(items, limit))
+        items = (item for item in items if key(item) > (created_at, item_id))
+        return list(islice(items, limit))[::-1]
+
     def paginate_queryset(self, queryset, request, view=None):
-        """Cursor-based pagination implementation."""
-        cursor = request.query_params.get(self.cursor_query_param)
+        self.request = request
         page_size = self.get_page_size(request)
-        
-        if cursor:
-            # Decode cursor and filter queryset
-            try:
-                cursor_value = self.decode_cursor(cursor)
-                queryset = queryset.filter(created_at__lt=cursor_value)
-            except:
-                pass
-        
-        # Limit to page size + 1 to check if there's a next page
-        queryset = queryset[:page_size + 1]
-        
-        has_next = len(queryset) > page_size
-        if has_next:
-            queryset = queryset[:-1]
-        
-        self.page = queryset
-        self.has_next = has_next
-        
-        return queryset
-    
+        cursor = self.decode_cursor(request)
+
+        # One extra row tells whether there is another page in that direction
+        if isinstance(queryset, QuerySet):
+            rows = self._slice_queryset(queryset, cursor, page_size + 1)
+        elif isinstance(queryset, (list, tuple)):
+            rows = self._slice_list(queryset, cursor, page_size + 1)
+        else:
+            rows = self._slice_iterable(queryset, cursor, page_size + 1)
+
+        backwards = cursor is not None and cursor[2] == 'previous'
+        has_more = len(rows) > page_size
+        if has_more:
+            rows = rows[1:] if backwards else rows[:-1]
+
+        self.page = rows
+        self.has_next = has_more if not backwards else True
+        self.has_previous = cursor is not None and (has_more if backwards else True)
+        return rows
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1], 'next'))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        url = self.request.build_absolute_uri()
+        if not self.page:
+            return remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[0], 'previous'))
+
     def get_paginated_response(self, data):
-        """Return response with cursor pagination info."""
-        response_data = {
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
             'results': data,
-            'has_next': self.has_next,
-        }
-        
-        if self.has_next and self.page:
-            # Create next cursor
-            last_item = self.page[-1] if self.page else None
-            if last_item:
-                next_cursor = self.encode_cursor(last_item.created_at)
-                response_data['next_cursor'] = next_cursor
-        
-        return Response(response_data)
-    
-    def encode_cursor(self, value):
-        """Encode cursor value."""
-        import base64
-        return base64.b64encode(str(value).encode()).decode()
-    
-    def decode_cursor(self, cursor):
-        """Decode cursor value."""
-        import base64
-        from datetime import datetime
-        decoded = base64.b64decode(cursor.encode()).decode()
-        return datetime.fromisoformat(decoded)
+        })
 
 
 class PerformancePaginator(Paginator):
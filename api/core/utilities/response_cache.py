@@ -0,0 +1,179 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from core.utilities.cache_versions import bump_cache_version, get_cache_versions
+from core.utilities.caching import MISSING
+from core.utilities.single_flight import single_flight
+
+RESPONSE_CACHE_TIMEOUT = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 300)
+# Version namespace for rows without a tenant, such as system roles
+SHARED_SCOPE = 'shared'
+UNCACHED_HEADERS = {'set-cookie', 'x-cache'}
+
+
+def get_response_cache_resources():
+    """Cached path prefixes mapped to the model labels their responses read."""
+    return getattr(settings, 'RESPONSE_CACHE_RESOURCES', {})
+
+
+def get_resource_models(path):
+    """Model labels the response for path depends on, or None if it is not cached."""
+    matches = [prefix for prefix in get_response_cache_resources() if path.startswith(prefix)]
+    if not matches:
+        return None
+    return get_response_cache_resources()[max(matches, key=len)]
+
+
+def get_tracked_models():
+    return {label for labels in get_response_cache_resources().values() for label in labels}
+
+
+def bump_model_versions(tenant_id, labels):
+    for label in labels:
+        bump_cache_version('response', tenant_id or SHARED_SCOPE, label)
+
+
+def get_model_versions(tenant_id, labels):
+    """Current versions of the models for a tenant, including tenantless rows."""
+    return get_cache_versions(
+        [('response', tenant_id, label) for label in labels]
+        + [('response', SHARED_SCOPE, label) for label in labels]
+    )
+
+
+def invalidate_cached_responses(sender, instance, **kwargs):
+    """post_save/post_delete receiver bumping the versions of the written model and its parents."""
+    tracked = get_tracked_models()
+    models = [sender, *sender._meta.get_parent_list()]
+    labels = [model._meta.label for model in models if model._meta.label in tracked]
+    if labels:
+        tenant_id = getattr(instance, 'tenant_id', None)
+        # After commit, so a concurrent read cannot cache the old rows under the new version
+        transaction.on_commit(lambda: bump_model_versions(tenant_id, labels))
+
+
+class ResponseCacheMiddleware:
+    """
+    Cache GET responses of the RESPONSE_CACHE_RESOURCES endpoints.
+
+    Entries are keyed on the tenant, the caller's role, the full path and
+    the Accept header, plus the current version of every model the
+    endpoint reads. Writes bump those versions (model signals, and any
+    successful unsafe request to the endpoint for bulk writes that send
+    no signals), so stale entries are never looked up again and simply
+    expire. Only the body, status and headers are stored; a hit whose
+    stored ETag matches If-None-Match is answered with a 304.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        labels = get_resource_models(request.path)
+        if labels is None:
+            return self.get_response(request)
+
+        if request.method in ('HEAD', 'OPTIONS'):
+            return self.get_response(request)
+        if request.method != 'GET':
+            response = self.get_response(request)
+            scope = self.get_scope(request) if response.status_code < 400 else None
+            if scope is not None:
+                tenant_id = scope[0]
+                transaction.on_commit(lambda: bump_model_versions(tenant_id, labels))
+            return response
+
+        scope = self.get_scope(request)
+        if scope is None:
+            return self.get_response(request)
+
+        key = self.get_cache_key(request, scope, labels)
+        cached = cache.get(key)
+        if cached is not None:
+            return self.build_response(cached, 'HIT', request)
+
+        # Concurrent misses on the key wait for one rendering; only this
+        # request's own response object is ever returned to it
+        rendered = []
+
+        def render():
+            response = self.get_response(request)
+            rendered.append(response)
+            if not self.is_cacheable(response):
+                return None
+            cached = self.serialize_response(response)
+            cache.set(key, cached, RESPONSE_CACHE_TIMEOUT)
+            response['X-Cache'] = 'MISS'
+            return cached
+
+        cached = single_flight(key, render, lookup=lambda: cache.get(key, MISSING))
+        if rendered:
+            return rendered[0]
+        if cached is None:
+            return self.get_response(request)
+        return self.build_response(cached, 'HIT', request)
+
+    def get_scope(self, request):
+        """(tenant id, role key) of the authenticated caller, or None."""
+        authenticators = [authenticator() for authenticator in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+        try:
+            user = Request(request, authenticators=authenticators).user
+        except APIException:
+            return None
+        if not user.is_authenticated or not getattr(user, 'tenant_id', None):
+            return None
+
+        from partners.models import Partner
+
+        role_key = Partner.objects.filter(user=user).values_list('role__key', flat=True).first()
+        return str(user.tenant_id), role_key or ''
+
+    def get_cache_key(self, request, scope, labels):
+        tenant_id, role_key = scope
+        versions = get_model_versions(tenant_id, labels)
+        query = urlencode(sorted(request.GET.lists()), doseq=True)
+        key_data = '|'.join([
+            request.method, request.path, query, request.META.get('HTTP_ACCEPT', ''),
+            *map(str, versions),
+        ])
+        return f'response:{tenant_id}:{role_key}:{hashlib.md5(key_data.encode()).hexdigest()}'
+
+    def is_cacheable(self, response):
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            and 'no-store' not in response.get('Cache-Control', '')
+        )
+
+    def serialize_response(self, response):
+        return {
+            'status': response.status_code,
+            'content': response.content,
+            'headers': [
+                (header, value) for header, value in response.items()
+                if header.lower() not in UNCACHED_HEADERS
+            ],
+        }
+
+    def build_response(self, cached, state, request=None):
+        headers = dict(cached['headers'])
+        etag = headers.get('ETag')
+        if etag and request is not None and etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+        else:
+            response = HttpResponse(cached['content'], status=cached['status'])
+            for header, value in cached['headers']:
+                response[header] = value
+        response['X-Cache'] = state
+        return response
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.utilities.caching import MISSING
+
+SINGLE_FLIGHT_LOCK_TIMEOUT = getattr(settings, 'SINGLE_FLIGHT_LOCK_TIMEOUT', 60)  # Upper bound for one computation
+SINGLE_FLIGHT_WAIT_TIMEOUT = getattr(settings, 'SINGLE_FLIGHT_WAIT_TIMEOUT', 10)
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = MISSING
+
+
+# key -> flight in progress in this process
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def _wait_for_other_process(lock_key, lookup, wait_timeout):
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        value = lookup()
+        if value is not MISSING:
+            return value
+        if cache.get(lock_key) is None:
+            # Released without storing a result; compute it ourselves
+            break
+    return MISSING
+
+
+def _run(key, compute, lookup, stale, lock_timeout, wait_timeout):
+    lock_key = f'{key}:lock'
+    if not cache.add(lock_key, True, lock_timeout):
+        if stale is not MISSING:
+            return stale
+        if lookup is not None:
+            value = _wait_for_other_process(lock_key, lookup, wait_timeout)
+            if value is not MISSING:
+                return value
+        return compute()
+    try:
+        return compute()
+    finally:
+        cache.delete(lock_key)
+
+
+def single_flight(key, compute, lookup=None, stale=MISSING,
+                  lock_timeout=SINGLE_FLIGHT_LOCK_TIMEOUT, wait_timeout=SINGLE_FLIGHT_WAIT_TIMEOUT):
+    """
+    Run compute() for key once at a time, so a cache miss on a hot key does
+    not send every worker to the database.
+
+    Threads of one process wait for the first caller and share its result.
+    Across processes the first caller holds a cache lock at '<key>:lock';
+    the others return stale if one is given, or poll lookup() (returning
+    MISSING until the result is stored) for up to wait_timeout seconds.
+    compute is expected to store its result where lookup finds it. Callers
+    that give up waiting, or whose leader failed, compute themselves.
+    """
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        if stale is not MISSING:
+            return stale
+        flight.done.wait(wait_timeout)
+        if flight.result is not MISSING:
+            return flight.result
+        return compute()
+
+    try:
+        flight.result = _run(key, compute, lookup, stale, lock_timeout, wait_timeout)
+        return flight.result
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.done.set()
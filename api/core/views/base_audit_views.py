@@ -1,37 +1,169 @@
+from datetime import timedelta
+
 from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django_filters.rest_framework import DjangoFilterBackend
 
 from core.models import AuditLog
 from core.serializers.audit_serializers import AuditLogSerializer
-from users.permissions import CanViewContentOnly
+from core.utilities.audit_archive import read_archived_logs
+from core.utilities.audit_export import EXPORT_FORMATS, stream_audit_export
+from core.utilities.audit_search import AUDIT_SEARCH_FIELDS, AuditSearchFilter
+from core.utilities.pagination import CursorPagination
+from core.views.base_views import BaseView
+from users.permissions import CanExportDataOrReports, CanViewContentOnly
+
+# Longest period an archived query may span, and its default length
+AUDIT_LOG_ARCHIVE_MAX_DAYS = getattr(settings, 'AUDIT_LOG_ARCHIVE_MAX_DAYS', 366)
 
 
-class BaseAuditViewSet(ReadOnlyModelViewSet):
+class BaseAuditViewSet(BaseView, ReadOnlyModelViewSet):
     """
     Generic base class for audit viewsets.
     Provides shared functionality without app-specific knowledge.
+
+    created_after/created_before bound the period so only the matching
+    time range is scanned; archived=true reads the compressed archive of
+    that period instead of the live table. Archived periods span at most
+    AUDIT_LOG_ARCHIVE_MAX_DAYS, which is also the default length.
+
+    export streams the same filtered logs as CSV or JSON lines. It also
+    requires export_permission_classes, and every export is audited.
+
+    Results are cursor paginated on (created_at, id), newest first, so the
+    order is fixed and deep pages are as cheap as the first one.
     """
     serializer_class = AuditLogSerializer
     permission_classes = [IsAuthenticated, CanViewContentOnly]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    export_permission_classes = [CanExportDataOrReports]
+    pagination_class = CursorPagination
+    filter_backends = [DjangoFilterBackend, AuditSearchFilter]
     filterset_fields = ['activity_type', 'created_by', 'created_at', 'compliance_category', 'risk_level']
-    search_fields = ['description', 'entity_name', 'business_process']
-    ordering_fields = ['created_at', 'activity_type', 'entity_name']
-    ordering = ['-created_at']
-    
+    search_fields = AUDIT_SEARCH_FIELDS  # Served by the full text index
+    entity_types = None  # Subclasses restrict the entity types they expose
+
+    def get_permissions(self):
+        permissions = super().get_permissions()
+        if self.action == 'export':
+            permissions += [permission() for permission in self.export_permission_classes]
+        return permissions
+
+    def get_period(self):
+        """Parse the created_after/created_before query parameters."""
+        period = []
+        for param in ('created_after', 'created_before'):
+            value = self.request.query_params.get(param)
+            parsed = parse_datetime(value) if value else None
+            if value and parsed is None:
+                raise ValidationError({param: 'Enter a valid date/time.'})
+            period.append(parsed)
+        return period
+
     def get_queryset(self):
         """
-        Get audit logs filtered by tenant.
-        Subclasses should override to add entity-specific filtering.
+        Get audit logs filtered by tenant and period.
+        Subclasses should set entity_types or override to add entity-specific filtering.
+        """
+        queryset = (
+            AuditLog.objects.for_tenant(self.request.user.tenant)
+            .for_period(*self.get_period())
+            .select_related('context')
+        )
+        if self.entity_types is not None:
+            queryset = queryset.filter(entity_type__in=self.entity_types)
+        return queryset
+
+    def get_archive_period(self):
+        """The period of an archived read, bounded to AUDIT_LOG_ARCHIVE_MAX_DAYS."""
+        start, end = self.get_period()
+        end = end or timezone.now()
+        max_period = timedelta(days=AUDIT_LOG_ARCHIVE_MAX_DAYS)
+        if start is None:
+            start = end - max_period
+        elif end - start > max_period:
+            raise ValidationError({
+                'created_after': f'Archived logs can be read at most {AUDIT_LOG_ARCHIVE_MAX_DAYS} days at a time.'
+            })
+        return start, end
+
+    def get_archived_logs(self, cursor=None):
         """
-        return AuditLog.objects.filter(
-            tenant=self.request.user.tenant
-        ).select_related('created_by')
-    
+        Archived audit logs matching the period, the filterset fields and
+        the search terms, as a generator ordered newest first. With a cursor the archive
+        months before it (or after it, paging backwards) are skipped, and
+        backwards pages are read oldest first from the cursor.
+        """
+        start, end = self.get_archive_period()
+        newest_first = True
+        if cursor is not None:
+            created_at, _, direction = cursor
+            if direction == 'next':
+                end = min(end, created_at + timedelta(microseconds=1))
+            else:
+                start = max(start, created_at)
+                newest_first = False
+        filters = {
+            field: self.request.query_params.getlist(field)
+            for field in self.filterset_fields
+            if field in self.request.query_params and field != 'created_at'
+        }
+        search = ' '.join(AuditSearchFilter().get_search_terms(self.request))
+        return read_archived_logs(
+            self.request.user.tenant, start, end, newest_first=newest_first,
+            search=search, entity_type=self.entity_types, **filters
+        )
+
+    def is_archived(self):
+        return self.request.query_params.get('archived') in ('true', '1')
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_archived():
+            return super().list(request, *args, **kwargs)
+
+        if self.paginator is None:
+            return Response(self.get_serializer(list(self.get_archived_logs()), many=True).data)
+        # Only the rows of the requested page are read from the archives
+        cursor = self.paginator.decode_cursor(request)
+        page = self.paginate_queryset(self.get_archived_logs(cursor))
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    def export(self, request, *args, **kwargs):
+        """
+        Stream every log matching the list filters, unpaginated.
+        Supports export_format=csv|jsonl and compress=true for gzip.
+        """
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({'export_format': f'Choose one of: {", ".join(EXPORT_FORMATS)}.'})
+
+        compress = request.query_params.get('compress') in ('true', '1')
+        logs = self.get_archived_logs() if self.is_archived() else self.filter_queryset(self.get_queryset())
+        response = stream_audit_export(logs, export_format, compress=compress)
+        self.log_export(export_format, compress)
+        return response
+
+    def log_export(self, export_format, compress):
+        """Audit an export on the tenant, with the filters and format used."""
+        filters = {
+            param: values if len(values) > 1 else values[0]
+            for param, values in self.request.query_params.lists()
+            if param not in ('export_format', 'compress')
+        }
+        self.log_activity(
+            self.get_tenant(),
+            'exported',
+            'exported',
+            description=f'Audit logs were exported as {export_format}.',
+            new_values={'export_format': export_format, 'compress': compress, 'filters': filters},
+        )
+
     def get_serializer_context(self):
         """Add request context to serializer."""
         context = super().get_serializer_context()
         context['request'] = self.request
-        return context 
\ No newline at end of file
+        return context
@@ -1,7 +1,10 @@
 import uuid
-from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.db import transaction
+from rest_framework.permissions import IsAuthenticated, SAFE_METHODS
 from rest_framework.exceptions import PermissionDenied
 from core.models import AuditLog
+from core.utilities.audit_writer import write_audit_log, write_audit_logs
 from users.permissions import CanCreateEditDeleteContent, CanViewContentOnly
 
 
@@ -10,6 +13,20 @@ class BaseView:
     
     permission_classes = [IsAuthenticated]
 
+    def dispatch(self, request, *args, **kwargs):
+        """
+        In outbox audit mode, run unsafe requests in one transaction so the
+        change and its audit record commit or roll back together.
+        """
+        if getattr(settings, 'AUDIT_LOG_WRITE_MODE', 'sync') != 'outbox' or request.method in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+
+        with transaction.atomic():
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code >= 400:
+                transaction.set_rollback(True)
+            return response
+
     def get_user(self):
         """Get the current authenticated user."""
         return self.request.user
@@ -47,15 +64,38 @@ class BaseView:
             action_text: Human-readable description of the action
             **kwargs: Additional data for change tracking
         """
+        log = self.build_audit_log(instance, activity_type, action_text, self.get_forensic_data(), **kwargs)
+        # High risk events skip the write buffer
+        write_audit_log(log, sync=log.risk_level == 'high')
+
+    def log_activity_bulk(self, instances, activity_type, action_text, **kwargs):
+        """
+        Log the same activity on many instances with a single bulk insert.
+
+        All records share one transaction_id, so the batch can be traced as
+        one operation. Takes the same arguments as log_activity.
+        """
+        forensic_data = self.get_forensic_data()
+        logs = [
+            self.build_audit_log(instance, activity_type, action_text, forensic_data, **kwargs)
+            for instance in instances
+        ]
+        write_audit_logs(logs, sync=any(log.risk_level == 'high' for log in logs))
+        return logs
+
+    def get_forensic_data(self):
+        """Request data recorded with every audit log of the request."""
         request = self.request
-        
-        # Get forensic data
-        session_id = getattr(request, 'session', {}).get('session_key')
-        ip_address = self.get_client_ip(request)
-        user_agent = request.META.get('HTTP_USER_AGENT', '')
-        business_process = self.get_business_process(request)
-        transaction_id = request.META.get('HTTP_X_TRANSACTION_ID') or str(uuid.uuid4())
-        
+        return {
+            'session_id': getattr(request, 'session', {}).get('session_key'),
+            'ip_address': self.get_client_ip(request),
+            'user_agent': request.META.get('HTTP_USER_AGENT', ''),
+            'business_process': self.get_business_process(request),
+            'transaction_id': request.META.get('HTTP_X_TRANSACTION_ID') or str(uuid.uuid4()),
+        }
+
+    def build_audit_log(self, instance, activity_type, action_text, forensic_data, **kwargs):
+        """Build an unsaved AuditLog for an activity on instance."""
         # Determine compliance category and risk level
         compliance_category = self.get_compliance_category(instance, activity_type)
         risk_level = self.assess_risk_level(instance, activity_type)
@@ -64,35 +104,32 @@ class BaseView:
         entity_type = self.get_entity_type(instance)
         entity_name = self.get_entity_name(instance)
         
-        # Track changes for updates
-        change_summary = None
-        old_values = None
-        new_values = None
+        # Track changes for updates (callers may pass explicit change data)
+        change_summary = kwargs.pop('change_summary', None)
+        old_values = kwargs.pop('old_values', None)
+        new_values = kwargs.pop('new_values', None)
         
         if activity_type == 'updated' and hasattr(instance, '_state'):
             change_summary, old_values, new_values = self.get_change_data(instance)
         
-        # Create the professional audit log
-        AuditLog.objects.create(
-            tenant=self.get_tenant(),
-            entity_type=entity_type,
-            entity_id=instance.id,
-            entity_name=entity_name,
-            created_by=self.get_user(),
-            activity_type=activity_type,
-            description=f'{instance._meta.verbose_name.title()} "{entity_name}" was {action_text}.',
-            change_summary=change_summary,
-            old_values=old_values,
-            new_values=new_values,
-            session_id=session_id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            business_process=business_process,
-            transaction_id=transaction_id,
-            compliance_category=compliance_category,
-            risk_level=risk_level,
-            **kwargs
-        )
+        # Create the professional audit log; values passed by the caller,
+        # such as a shared transaction_id, override the defaults
+        fields = {
+            'tenant': self.get_tenant(),
+            'entity_type': entity_type,
+            'entity_id': instance.id,
+            'entity_name': entity_name,
+            'created_by': self.get_user().id,
+            'activity_type': activity_type,
+            'description': f'{instance._meta.verbose_name.title()} "{entity_name}" was {action_text}.',
+            'change_summary': change_summary,
+            'old_values': old_values,
+            'new_values': new_values,
+            'compliance_category': compliance_category,
+            'risk_level': risk_level,
+            **forensic_data,
+        }
+        return AuditLog(**{**fields, **kwargs})
     
     def get_entity_type(self, instance):
         """Determine entity type from instance."""
@@ -110,6 +147,8 @@ class BaseView:
             'attachment': 'attachment',
             'assignment': 'assignment',
             'role': 'role',
+            'user': 'user',
+            'tenant': 'tenant',
         }
         
         return entity_type_mapping.get(model_name, 'workitem')
@@ -178,27 +217,20 @@ class BaseView:
             return 'low'
     
     def get_change_data(self, instance):
-        """Get structured change data for updates."""
-        # This is a simplified version - you might want more sophisticated change tracking
+        """
+        Get structured change data for updates from the instance's last save.
+
+        Only changed tracked fields are recorded, foreign keys as ids.
+        """
         change_summary = {}
         old_values = {}
         new_values = {}
-        
-        if hasattr(instance, '_state') and hasattr(instance._state, 'fields_cache'):
-            # Track field changes
-            for field_name, old_value in instance._state.fields_cache.items():
-                if hasattr(instance, field_name):
-                    new_value = getattr(instance, field_name)
-                    
-                    # Serialize values properly for JSON storage
-                    old_values[field_name] = self._serialize_value(old_value)
-                    new_values[field_name] = self._serialize_value(new_value)
-                    
-                    change_summary[field_name] = {
-                        'old': self._serialize_value(old_value),
-                        'new': self._serialize_value(new_value)
-                    }
-        
+
+        for field_name, (old_value, new_value) in getattr(instance, 'tracked_changes', {}).items():
+            old_values[field_name] = self._serialize_value(old_value)
+            new_values[field_name] = self._serialize_value(new_value)
+            change_summary[field_name] = {'old': old_values[field_name], 'new': new_values[field_name]}
+
         return change_summary, old_values, new_values
 
     def _serialize_value(self, value):
@@ -211,13 +243,6 @@ class BaseView:
             return [self._serialize_value(item) for item in value]
         elif isinstance(value, dict):
             return {key: self._serialize_value(val) for key, val in value.items()}
-        elif hasattr(value, 'id'):
-            # For model instances, store the ID and type
-            return {
-                'id': str(value.id),
-                'type': value._meta.model_name,
-                'str': str(value)
-            }
         elif hasattr(value, 'isoformat'):
             # For datetime objects
             return value.isoformat()
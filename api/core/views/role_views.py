@@ -1,9 +1,11 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from core.mixins import CachedListMixin
 from core.models import Role
 from core.serializers.role_serializers import RoleSerializer
 
-class RoleListCreateView(generics.ListCreateAPIView):
+class RoleListCreateView(CachedListMixin, generics.ListCreateAPIView):
+    cache_region = 'role_list'
     permission_classes = [IsAuthenticated]
     serializer_class = RoleSerializer
 
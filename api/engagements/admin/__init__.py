@@ -7,6 +7,7 @@ from .comment_admin import CommentAdmin
 from .work_item_status_admin import WorkItemStatusAdmin
 from .work_item_priority_admin import WorkItemPriorityAdmin
 from .work_item_category_admin import WorkItemCategoryAdmin
+from .sla_policy_admin import SLAPolicyAdmin
 
 __all__ = [
     'WorkItemAdmin',
@@ -18,4 +19,5 @@ __all__ = [
     'WorkItemStatusAdmin',
     'WorkItemPriorityAdmin',
     'WorkItemCategoryAdmin',
+    'SLAPolicyAdmin',
 ] 
\ No newline at end of file
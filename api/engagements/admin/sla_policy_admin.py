@@ -0,0 +1,14 @@
+from django.contrib import admin
+from engagements.models import SLAPolicy
+from core.mixins import AdminAuditMixin
+
+
+@admin.register(SLAPolicy)
+class SLAPolicyAdmin(AdminAuditMixin, admin.ModelAdmin):
+    list_display = ['name', 'priority', 'category', 'resolution_time', 'tenant', 'is_active']
+    list_filter = ['is_active', 'tenant', 'priority', 'category']
+    search_fields = ['name']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('tenant', 'priority', 'category')
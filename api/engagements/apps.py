@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete
 
 
 class engagementsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "engagements"
+
+    def ready(self):
+        from engagements.statistics.rollup import record_hard_delete
+
+        post_delete.connect(record_hard_delete, dispatch_uid="statistics_rollup_delete")
@@ -0,0 +1,26 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from core.models import Tenant
+from engagements.models import WorkItem
+from engagements.statistics.sla_stats import evaluate_sla
+
+
+class Command(BaseCommand):
+    help = 'Re-evaluate the SLA state of every active work item'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenant', help='Only evaluate the tenant with this id')
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.all()
+        if options['tenant']:
+            tenants = tenants.filter(id=options['tenant'])
+
+        for tenant in tenants.iterator():
+            work_items = WorkItem.objects.filter(tenant=tenant, is_deleted=False)
+            states = Counter(row['sla_state'] for row in evaluate_sla(work_items, tenant))
+            summary = ', '.join(f'{state}: {count}' for state, count in sorted(states.items()))
+            self.stdout.write(f'{tenant}: {summary or "no work items"}')
+
+        self.stdout.write(self.style.SUCCESS('Successfully evaluated SLAs'))
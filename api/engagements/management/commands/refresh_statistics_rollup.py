@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from core.models import Tenant
+from engagements.statistics.rollup import refresh_rollup
+
+
+class Command(BaseCommand):
+    help = 'Incrementally refresh the daily work item statistics rollup for all tenants'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenant', help='Only refresh the tenant with this id')
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.all()
+        if options['tenant']:
+            tenants = tenants.filter(id=options['tenant'])
+
+        refreshed_count = 0
+        for tenant in tenants.iterator():
+            refresh_rollup(tenant)
+            refreshed_count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully refreshed statistics rollup for {refreshed_count} tenants')
+        )
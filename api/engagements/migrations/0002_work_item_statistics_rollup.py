@@ -0,0 +1,52 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('engagements', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkItemRollupState',
+            fields=[
+                ('work_item_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('work_item_type', models.CharField(choices=[('ticket', 'Ticket'), ('case', 'Case'), ('job', 'Job')], max_length=50)),
+                ('status_id', models.UUIDField()),
+                ('priority_id', models.UUIDField()),
+                ('category_id', models.UUIDField()),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='work_item_rollup_states', to='core.tenant')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WorkItemRollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('refreshed_until', models.DateTimeField(blank=True, null=True)),
+                ('tenant', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='work_item_rollup_watermark', to='core.tenant')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WorkItemDailyStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('work_item_type', models.CharField(choices=[('ticket', 'Ticket'), ('case', 'Case'), ('job', 'Job')], max_length=50)),
+                ('created_count', models.PositiveIntegerField(default=0)),
+                ('net_count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_statistics', to='engagements.workitemcategory')),
+                ('priority', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_statistics', to='engagements.workitempriority')),
+                ('status', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_statistics', to='engagements.workitemstatus')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='work_item_daily_statistics', to='core.tenant')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['tenant', 'date'], name='engagements_tenant__9f99ba_idx'), models.Index(fields=['tenant', 'work_item_type', 'date'], name='engagements_tenant__c759f2_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant', 'date', 'work_item_type', 'status', 'priority', 'category'), name='unique_work_item_daily_statistic')],
+            },
+        ),
+    ]
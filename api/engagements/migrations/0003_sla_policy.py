@@ -0,0 +1,38 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:52
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('engagements', '0002_work_item_statistics_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SLAPolicy',
+            fields=[
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_by', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('updated_by', models.UUIDField(blank=True, db_index=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('name', models.CharField(max_length=100)),
+                ('resolution_time', models.DurationField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='sla_policies', to='engagements.workitemcategory')),
+                ('priority', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='sla_policies', to='engagements.workitempriority')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sla_policies', to='core.tenant')),
+            ],
+            options={
+                'verbose_name': 'SLA policy',
+                'verbose_name_plural': 'SLA policies',
+                'indexes': [models.Index(fields=['tenant', 'is_active'], name='engagements_tenant__b09e8f_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tenant', 'priority', 'category'), name='unique_sla_policy')],
+            },
+        ),
+    ]
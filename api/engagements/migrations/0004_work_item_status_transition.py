@@ -0,0 +1,71 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_transitions(apps, schema_editor):
+    """Rebuild status history from the creation time and status_changed audit rows."""
+    WorkItem = apps.get_model('engagements', 'WorkItem')
+    WorkItemStatus = apps.get_model('engagements', 'WorkItemStatus')
+    WorkItemStatusTransition = apps.get_model('engagements', 'WorkItemStatusTransition')
+    AuditLog = apps.get_model('core', 'AuditLog')
+
+    status_ids = {str(status_id): status_id for status_id in WorkItemStatus.objects.values_list('id', flat=True)}
+    changes = {}
+    for entity_id, old_status, new_status, created_at, created_by in (
+        AuditLog.objects.filter(activity_type='status_changed', new_values__has_key='status')
+        .order_by('created_at')
+        .values_list('entity_id', 'old_values__status', 'new_values__status', 'created_at', 'created_by')
+        .iterator()
+    ):
+        if new_status in status_ids:
+            changes.setdefault(entity_id, []).append((old_status, new_status, created_at, created_by))
+
+    transitions = []
+    for item_id, tenant_id, status_id, created_at, created_by in (
+        WorkItem.objects.values_list('id', 'tenant_id', 'status_id', 'created_at', 'created_by').iterator()
+    ):
+        item_changes = changes.get(item_id, [])
+        initial_status = status_ids.get(item_changes[0][0], status_id) if item_changes else status_id
+        transitions.append(WorkItemStatusTransition(
+            tenant_id=tenant_id, work_item_id=item_id, to_status_id=initial_status,
+            at=created_at, actor=created_by,
+        ))
+        for old_status, new_status, at, actor in item_changes:
+            transitions.append(WorkItemStatusTransition(
+                tenant_id=tenant_id, work_item_id=item_id, from_status_id=status_ids.get(old_status),
+                to_status_id=status_ids[new_status], at=at, actor=actor,
+            ))
+        if len(transitions) >= 2000:
+            WorkItemStatusTransition.objects.bulk_create(transitions)
+            transitions = []
+    WorkItemStatusTransition.objects.bulk_create(transitions)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('engagements', '0003_sla_policy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkItemStatusTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('at', models.DateTimeField()),
+                ('actor', models.UUIDField(blank=True, null=True)),
+                ('from_status', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='transitions_from', to='engagements.workitemstatus')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='work_item_status_transitions', to='core.tenant')),
+                ('to_status', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='transitions_to', to='engagements.workitemstatus')),
+                ('work_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_transitions', to='engagements.workitem')),
+            ],
+            options={
+                'ordering': ['at'],
+                'indexes': [models.Index(fields=['tenant', 'at'], name='engagements_tenant__7381ec_idx'), models.Index(fields=['tenant', 'to_status', 'at'], name='engagements_tenant__36c76b_idx'), models.Index(fields=['work_item', 'at'], name='engagements_work_it_5d98b4_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_transitions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.5 on 2026-10-17 17:20
+
+from django.db import migrations, models
+
+
+def queue_missed_deletes(apps, schema_editor):
+    """Queue rollup states of items hard deleted before the deletion log existed."""
+    WorkItem = apps.get_model('engagements', 'WorkItem')
+    WorkItemRollupState = apps.get_model('engagements', 'WorkItemRollupState')
+    WorkItemRollupDeletion = apps.get_model('engagements', 'WorkItemRollupDeletion')
+
+    gone = WorkItemRollupState.objects.exclude(
+        work_item_id__in=WorkItem.objects.values('id')
+    ).values_list('work_item_id', 'tenant_id')
+    WorkItemRollupDeletion.objects.bulk_create(
+        [
+            WorkItemRollupDeletion(work_item_id=work_item_id, tenant_id=tenant_id)
+            for work_item_id, tenant_id in gone.iterator()
+        ],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('engagements', '0004_work_item_status_transition'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkItemRollupDeletion',
+            fields=[
+                ('work_item_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('tenant_id', models.UUIDField(db_index=True)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RunPython(queue_missed_deletes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.1.5 on 2026-10-17 17:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def fill_totals(apps, schema_editor):
+    """Sum the daily net counts of the rollups refreshed so far into totals."""
+    WorkItemDailyStatistic = apps.get_model('engagements', 'WorkItemDailyStatistic')
+    WorkItemRollupTotal = apps.get_model('engagements', 'WorkItemRollupTotal')
+
+    rows = (
+        WorkItemDailyStatistic.objects
+        .values('tenant_id', 'work_item_type', 'status_id', 'priority_id', 'category_id')
+        .annotate(count=Sum('net_count'))
+        .order_by()
+    )
+    WorkItemRollupTotal.objects.bulk_create(
+        [WorkItemRollupTotal(**row) for row in rows.iterator() if row['count']],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_audit_log_derived_indexes'),
+        ('engagements', '0005_work_item_rollup_deletion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkItemRollupTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('work_item_type', models.CharField(choices=[('ticket', 'Ticket'), ('case', 'Case'), ('job', 'Job')], max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rollup_totals', to='engagements.workitemcategory')),
+                ('priority', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rollup_totals', to='engagements.workitempriority')),
+                ('status', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rollup_totals', to='engagements.workitemstatus')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='work_item_rollup_totals', to='core.tenant')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tenant', 'work_item_type', 'status', 'priority', 'category'), name='unique_work_item_rollup_total')],
+            },
+        ),
+        migrations.RunPython(fill_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.5 on 2026-10-17 17:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('engagements', '0006_work_item_rollup_total'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='slapolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('category__isnull', False), ('priority__isnull', True)), fields=('tenant', 'category'), name='unique_sla_policy_any_priority'),
+        ),
+        migrations.AddConstraint(
+            model_name='slapolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('category__isnull', True), ('priority__isnull', False)), fields=('tenant', 'priority'), name='unique_sla_policy_any_category'),
+        ),
+        migrations.AddConstraint(
+            model_name='slapolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('category__isnull', True), ('priority__isnull', True)), fields=('tenant',), name='unique_sla_policy_default'),
+        ),
+    ]
@@ -7,6 +7,13 @@ from .comment import Comment
 from .workitem_status import WorkItemStatus
 from .workitem_priority import WorkItemPriority
 from .workitem_category import WorkItemCategory
+from .work_item_daily_statistic import WorkItemDailyStatistic
+from .work_item_rollup_state import WorkItemRollupState
+from .work_item_rollup_watermark import WorkItemRollupWatermark
+from .work_item_rollup_deletion import WorkItemRollupDeletion
+from .work_item_rollup_total import WorkItemRollupTotal
+from .sla_policy import SLAPolicy
+from .work_item_status_transition import WorkItemStatusTransition
 
 __all__ = [
     'WorkItem',
@@ -18,4 +25,11 @@ __all__ = [
     'WorkItemStatus',
     'WorkItemPriority',
     'WorkItemCategory',
+    'WorkItemDailyStatistic',
+    'WorkItemRollupState',
+    'WorkItemRollupWatermark',
+    'WorkItemRollupDeletion',
+    'WorkItemRollupTotal',
+    'SLAPolicy',
+    'WorkItemStatusTransition',
 ] 
\ No newline at end of file
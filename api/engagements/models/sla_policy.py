@@ -0,0 +1,66 @@
+from django.db import models
+from core.models import Tenant, AuditModel
+
+
+class SLAPolicy(AuditModel):
+    """
+    Resolution target for a tenant's work items.
+
+    A policy applies to items with its priority and category. Leaving either
+    empty makes it a fallback for all values of that dimension; the most
+    specific active policy wins, priority before category.
+    """
+
+    tenant = models.ForeignKey(
+        Tenant, on_delete=models.CASCADE, related_name="sla_policies"
+    )
+    name = models.CharField(max_length=100)
+    priority = models.ForeignKey(
+        'WorkItemPriority',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='sla_policies'
+    )
+    category = models.ForeignKey(
+        'WorkItemCategory',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='sla_policies'
+    )
+    resolution_time = models.DurationField()
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        verbose_name = "SLA policy"
+        verbose_name_plural = "SLA policies"
+        # NULLs are distinct in a unique index, so each fallback combination
+        # needs its own partial constraint
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant", "priority", "category"],
+                name="unique_sla_policy",
+            ),
+            models.UniqueConstraint(
+                fields=["tenant", "category"],
+                condition=models.Q(priority__isnull=True, category__isnull=False),
+                name="unique_sla_policy_any_priority",
+            ),
+            models.UniqueConstraint(
+                fields=["tenant", "priority"],
+                condition=models.Q(priority__isnull=False, category__isnull=True),
+                name="unique_sla_policy_any_category",
+            ),
+            models.UniqueConstraint(
+                fields=["tenant"],
+                condition=models.Q(priority__isnull=True, category__isnull=True),
+                name="unique_sla_policy_default",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["tenant", "is_active"]),
+        ]
+
+    def __str__(self):
+        return self.name
@@ -48,6 +48,29 @@ class WorkItem(AuditModel):
             models.Index(fields=["category", "status"]),
         ]
 
+    def save(self, *args, **kwargs):
+        creating = self._state.adding
+        super().save(*args, **kwargs)
+
+        # Status changes come from the change tracking snapshot, so deferred
+        # status loads and update_fields without status record nothing
+        if creating:
+            self.record_status_transition(None)
+        elif 'status' in self.tracked_changes:
+            self.record_status_transition(self.tracked_changes['status'][0])
+
+    def record_status_transition(self, from_status_id):
+        from engagements.models import WorkItemStatusTransition
+
+        WorkItemStatusTransition.objects.create(
+            tenant_id=self.tenant_id,
+            work_item_id=self.pk,
+            from_status_id=from_status_id,
+            to_status_id=self.status_id,
+            at=self.updated_at,
+            actor=self.updated_by or self.created_by,
+        )
+
     def get_real_instance(self):
         if hasattr(self, "ticket"):
             return self.ticket
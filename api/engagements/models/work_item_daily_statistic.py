@@ -0,0 +1,48 @@
+from django.db import models
+from core.choices import WorkItemType
+from core.models import Tenant
+
+
+class WorkItemDailyStatistic(models.Model):
+    """
+    Daily statistics rollup per tenant, work item type, status, priority and category.
+
+    created_count is the number of items created that day with these
+    dimensions. net_count is the change in the number of active items
+    holding these dimensions; the current counts are kept in
+    WorkItemRollupTotal.
+    Changes are booked on the day a refresh sees them, so histories such as
+    the backlog curve read WorkItemStatusTransition instead.
+    """
+
+    tenant = models.ForeignKey(
+        Tenant, on_delete=models.CASCADE, related_name="work_item_daily_statistics"
+    )
+    date = models.DateField()
+    work_item_type = models.CharField(max_length=50, choices=WorkItemType.choices)
+    status = models.ForeignKey(
+        'WorkItemStatus', on_delete=models.CASCADE, related_name='daily_statistics'
+    )
+    priority = models.ForeignKey(
+        'WorkItemPriority', on_delete=models.CASCADE, related_name='daily_statistics'
+    )
+    category = models.ForeignKey(
+        'WorkItemCategory', on_delete=models.CASCADE, related_name='daily_statistics'
+    )
+    created_count = models.PositiveIntegerField(default=0)
+    net_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant", "date", "work_item_type", "status", "priority", "category"],
+                name="unique_work_item_daily_statistic",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["tenant", "date"]),
+            models.Index(fields=["tenant", "work_item_type", "date"]),
+        ]
+
+    def __str__(self):
+        return f"{self.work_item_type} statistics for {self.date}"
@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class WorkItemRollupDeletion(models.Model):
+    """
+    Work item hard deleted since the statistics rollup last looked.
+
+    Written by a post_delete receiver and consumed by the next refresh, so
+    removing deleted items from the rollup costs as much as the number of
+    deletes rather than the size of the tenant's history. Holds plain ids
+    so the row can be written while the tenant itself is being deleted.
+    """
+
+    work_item_id = models.UUIDField(primary_key=True)
+    tenant_id = models.UUIDField(db_index=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Rollup deletion of {self.work_item_id}"
@@ -0,0 +1,28 @@
+from django.db import models
+from core.choices import WorkItemType
+from core.models import Tenant
+
+
+class WorkItemRollupState(models.Model):
+    """
+    Dimensions each work item was last counted under in WorkItemDailyStatistic.
+
+    Lets the incremental refresher move an item between rollup buckets
+    without replaying its history. Keyed by the work item id without a
+    foreign key so the row outlives a hard delete of the item.
+    """
+
+    work_item_id = models.UUIDField(primary_key=True)
+    tenant = models.ForeignKey(
+        Tenant, on_delete=models.CASCADE, related_name="work_item_rollup_states"
+    )
+    work_item_type = models.CharField(max_length=50, choices=WorkItemType.choices)
+    status_id = models.UUIDField()
+    priority_id = models.UUIDField()
+    category_id = models.UUIDField()
+
+    def get_dimensions(self):
+        return (self.work_item_type, self.status_id, self.priority_id, self.category_id)
+
+    def __str__(self):
+        return f"Rollup state for {self.work_item_id}"
@@ -0,0 +1,40 @@
+from django.db import models
+from core.choices import WorkItemType
+from core.models import Tenant
+
+
+class WorkItemRollupTotal(models.Model):
+    """
+    Current number of active work items per tenant, work item type, status,
+    priority and category, as of the tenant's rollup watermark.
+
+    Kept next to WorkItemDailyStatistic by the same refresh, so current
+    counts are read from one row per combination instead of by summing
+    every day of the tenant's history.
+    """
+
+    tenant = models.ForeignKey(
+        Tenant, on_delete=models.CASCADE, related_name="work_item_rollup_totals"
+    )
+    work_item_type = models.CharField(max_length=50, choices=WorkItemType.choices)
+    status = models.ForeignKey(
+        'WorkItemStatus', on_delete=models.CASCADE, related_name='rollup_totals'
+    )
+    priority = models.ForeignKey(
+        'WorkItemPriority', on_delete=models.CASCADE, related_name='rollup_totals'
+    )
+    category = models.ForeignKey(
+        'WorkItemCategory', on_delete=models.CASCADE, related_name='rollup_totals'
+    )
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant", "work_item_type", "status", "priority", "category"],
+                name="unique_work_item_rollup_total",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.work_item_type} total for {self.tenant_id}: {self.count}"
@@ -0,0 +1,14 @@
+from django.db import models
+from core.models import Tenant
+
+
+class WorkItemRollupWatermark(models.Model):
+    """Point in time up to which a tenant's statistics rollup is complete."""
+
+    tenant = models.OneToOneField(
+        Tenant, on_delete=models.CASCADE, related_name="work_item_rollup_watermark"
+    )
+    refreshed_until = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Rollup watermark for {self.tenant_id}: {self.refreshed_until}"
@@ -0,0 +1,48 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+from core.models import Tenant
+
+
+class WorkItemStatusTransition(models.Model):
+    """
+    Append-only record of every status a work item moved into.
+
+    Written by WorkItem.save whenever status changes; the first row of an
+    item has no from_status. Duration and flow statistics read this table
+    instead of parsing the audit log.
+    """
+
+    tenant = models.ForeignKey(
+        Tenant, on_delete=models.CASCADE, related_name="work_item_status_transitions"
+    )
+    work_item = models.ForeignKey(
+        'WorkItem', on_delete=models.CASCADE, related_name='status_transitions'
+    )
+    from_status = models.ForeignKey(
+        'WorkItemStatus',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='transitions_from'
+    )
+    to_status = models.ForeignKey(
+        'WorkItemStatus', on_delete=models.PROTECT, related_name='transitions_to'
+    )
+    at = models.DateTimeField()
+    actor = models.UUIDField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["at"]
+        indexes = [
+            models.Index(fields=["tenant", "at"]),
+            models.Index(fields=["tenant", "to_status", "at"]),
+            models.Index(fields=["work_item", "at"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.pk:
+            raise ValidationError("Status transitions are append-only and cannot be modified.")
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.work_item_id}: {self.from_status_id} -> {self.to_status_id}"
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from engagements.models import WorkItem
 from users.serializers.user_serializers import UserWithPersonSerializer
+from core.serializers.option_serializers import CachedOptionField
 
 from engagements.serializers.attachment_serializers import AttachmentSerializer
 from engagements.serializers.comment_serializers import CommentSerializer
@@ -20,9 +21,9 @@ class WorkItemListSerializer(serializers.ModelSerializer):
     tenant = serializers.PrimaryKeyRelatedField(read_only=True)
     created_by = UserWithPersonSerializer(read_only=True)
     assigned_to = AssignedUserSerializer(many=True, read_only=True)
-    status = WorkItemStatusListSerializer(read_only=True)
-    priority = WorkItemPriorityListSerializer(read_only=True)
-    category = WorkItemCategoryListSerializer(read_only=True)
+    status = CachedOptionField(WorkItemStatusListSerializer)
+    priority = CachedOptionField(WorkItemPriorityListSerializer)
+    category = CachedOptionField(WorkItemCategoryListSerializer)
 
     class Meta:
         model = WorkItem
@@ -49,9 +50,6 @@ class WorkItemListSerializer(serializers.ModelSerializer):
         return queryset.select_related(
             'created_by__partner__person',
             'tenant',
-            'status',
-            'priority',
-            'category',
         ).prefetch_related(
             'assigned_to__user__partner__person',
         )
@@ -64,9 +62,9 @@ class WorkItemSerializer(serializers.ModelSerializer):
     comments = CommentSerializer(many=True, read_only=True)
     tenant = serializers.PrimaryKeyRelatedField(read_only=True)
     assigned_to = AssignedUserSerializer(many=True, read_only=True)
-    status = WorkItemStatusListSerializer(read_only=True)
-    priority = WorkItemPriorityListSerializer(read_only=True)
-    category = WorkItemCategoryListSerializer(read_only=True)
+    status = CachedOptionField(WorkItemStatusListSerializer)
+    priority = CachedOptionField(WorkItemPriorityListSerializer)
+    category = CachedOptionField(WorkItemCategoryListSerializer)
 
     class Meta:
         model = WorkItem
@@ -97,9 +95,6 @@ class WorkItemSerializer(serializers.ModelSerializer):
         return queryset.select_related(
             'created_by__partner__person',
             'tenant',
-            'status',
-            'priority',
-            'category',
         ).prefetch_related(
             'comments__created_by__partner__person',
             'assigned_to__user__partner__person',
@@ -1 +1,2 @@
-from .main import get_work_item_statistics, get_all_work_item_statistics 
\ No newline at end of file
+from .main import get_work_item_statistics, get_all_work_item_statistics
+from .cache import get_cached_statistics, invalidate_statistics
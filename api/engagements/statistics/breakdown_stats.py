@@ -0,0 +1,79 @@
+from django.db.models import Case, CharField, Count, Value, When
+from django.utils.text import slugify
+
+from engagements.models import WorkItem
+
+
+WORK_ITEM_TYPES = ['ticket', 'case', 'job']
+OPEN_STATUS_KEY = 'open'
+CLOSED_STATUS_KEYS = {'resolved', 'closed'}
+
+
+def get_option_key(label):
+    """Normalize an option label ('In Progress') to a stable key ('in_progress')."""
+    if not label:
+        return 'none'
+    return slugify(label).replace('-', '_')
+
+
+def get_option_ids(model, tenant, keys):
+    """Return ids of the tenant's options whose normalized label is in keys."""
+    keys = set(keys)
+    return [
+        option_id
+        for option_id, label in model.objects.filter(tenant=tenant).values_list('id', 'label')
+        if get_option_key(label) in keys
+    ]
+
+
+def annotate_work_item_type(qs):
+    """Annotate each work item with the name of its concrete subtype."""
+    return qs.annotate(
+        work_item_type=Case(
+            When(ticket__isnull=False, then=Value('ticket')),
+            When(case__isnull=False, then=Value('case')),
+            When(job__isnull=False, then=Value('job')),
+            default=Value('workitem'),
+            output_field=CharField(),
+        )
+    )
+
+
+def _empty_breakdown():
+    return {'total': 0, 'status': {}, 'priority': {}, 'category': {}}
+
+
+def fold_breakdowns(rows):
+    """Fold (work_item_type, status/priority/category label, count) rows into breakdowns."""
+    breakdowns = {work_item_type: _empty_breakdown() for work_item_type in WORK_ITEM_TYPES}
+    for row in rows:
+        count = row['count']
+        if not count:
+            continue
+        breakdown = breakdowns.setdefault(row['work_item_type'], _empty_breakdown())
+        breakdown['total'] += count
+        for dimension in ('status', 'priority', 'category'):
+            key = get_option_key(row[f'{dimension}__label'])
+            breakdown[dimension][key] = breakdown[dimension].get(key, 0) + count
+
+    # Rollup rows may carry negative counts that cancel out
+    for breakdown in breakdowns.values():
+        for dimension in ('status', 'priority', 'category'):
+            breakdown[dimension] = {key: count for key, count in breakdown[dimension].items() if count}
+    return breakdowns
+
+
+def get_breakdowns(tenant):
+    """
+    Count active work items per subtype, status, priority and category.
+
+    Runs a single grouped query joined through the option tables, so the
+    cost does not depend on how many statuses or priorities a tenant defines.
+    """
+    rows = (
+        annotate_work_item_type(WorkItem.objects.filter(tenant=tenant, is_deleted=False))
+        .values('work_item_type', 'status__label', 'priority__label', 'category__label')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    return fold_breakdowns(rows)
@@ -0,0 +1,78 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from core.utilities import MISSING, get_cache_version, bump_cache_version, single_flight
+
+STATISTICS_CACHE_TIMEOUT = 60 * 60  # Hard expiry of an entry
+STATISTICS_FRESH_SECONDS = 30  # Served without recomputing for this long
+STATISTICS_LOCK_TIMEOUT = 60  # Upper bound for one recomputation
+
+
+def _tenant_id(tenant):
+    return getattr(tenant, 'id', tenant)
+
+
+def _get_cache_key(tenant_id, params):
+    params_hash = hashlib.md5(
+        json.dumps(params, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f'statistics:{tenant_id}:{params_hash}'
+
+
+def _compute_and_store(key, version, compute):
+    value = compute()
+    if isinstance(value, dict) and value.get('partial'):
+        # Results cut short by the time budget are not worth keeping
+        return value
+    cache.set(
+        key,
+        {'version': version, 'value': value, 'computed_at': timezone.now()},
+        STATISTICS_CACHE_TIMEOUT,
+    )
+    return value
+
+
+def get_cached_statistics(tenant, compute, **params):
+    """
+    Return compute() for a tenant and parameter set, cached until the tenant's
+    data changes.
+
+    Entries carry the tenant's statistics version, so invalidate_statistics()
+    makes every parameter set of that tenant stale at once. Stale entries are
+    served while a single worker recomputes them, and on a miss the other
+    workers wait for that worker's result (see single_flight).
+    """
+    tenant_id = _tenant_id(tenant)
+    key = _get_cache_key(tenant_id, params)
+    version = get_cache_version('statistics', tenant_id)
+    entry = cache.get(key)
+
+    if entry is not None:
+        age = (timezone.now() - entry['computed_at']).total_seconds()
+        if entry['version'] == version and age < STATISTICS_FRESH_SECONDS:
+            return entry['value']
+
+    def lookup():
+        current = cache.get(key)
+        if current is None or current['version'] != version:
+            return MISSING
+        return current['value']
+
+    return single_flight(
+        key,
+        lambda: _compute_and_store(key, version, compute),
+        lookup=lookup,
+        # While someone else recomputes, keep serving the previous result
+        stale=entry['value'] if entry is not None else MISSING,
+        lock_timeout=STATISTICS_LOCK_TIMEOUT,
+    )
+
+
+def invalidate_statistics(tenant):
+    """Mark all cached statistics of a tenant stale once the current transaction commits."""
+    tenant_id = _tenant_id(tenant)
+    transaction.on_commit(lambda: bump_cache_version('statistics', tenant_id))
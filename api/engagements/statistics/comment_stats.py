@@ -1,10 +1,35 @@
+from django.db.models import DurationField, ExpressionWrapper, F, OuterRef, Subquery
+from engagements.statistics.percentile_stats import get_duration_summary, to_hours
+
+
+def annotate_first_response_time(qs, Comment):
+    """Annotate each work item with the delay until its earliest comment."""
+    first_comment_at = (
+        Comment.objects.filter(work_item=OuterRef('pk'))
+        .order_by('created_at')
+        .values('created_at')[:1]
+    )
+    return (
+        qs.annotate(first_response_at=Subquery(first_comment_at))
+        .filter(first_response_at__isnull=False)
+        .annotate(
+            first_response_time=ExpressionWrapper(
+                F('first_response_at') - F('created_at'), output_field=DurationField()
+            )
+        )
+    )
+
+
+def get_first_response_stats(qs, Comment, percentiles=(50, 90, 99)):
+    """Mean and percentiles of the time to first response, in hours, in one query."""
+    summary = get_duration_summary(
+        annotate_first_response_time(qs, Comment), 'first_response_time', percentiles
+    )
+    stats = {'count': summary['count'], 'avg_hours': to_hours(summary['avg'])}
+    for percentile in percentiles:
+        stats[f'p{percentile}_hours'] = to_hours(summary[f'p{percentile}'])
+    return stats
+
+
 def get_avg_time_to_first_response(qs, Comment):
-    first_response_times = []
-    for item in qs:
-        first_comment = Comment.objects.filter(work_item=item).order_by('created_at').first()
-        if first_comment:
-            delta = first_comment.created_at - item.created_at
-            first_response_times.append(delta.total_seconds())
-    if first_response_times:
-        return round(sum(first_response_times) / len(first_response_times) / 3600, 2)
-    return None 
\ No newline at end of file
+    return get_first_response_stats(qs, Comment, percentiles=())['avg_hours']
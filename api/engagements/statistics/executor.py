@@ -0,0 +1,44 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.db import connections
+
+
+def _run_in_thread(task):
+    # Worker threads get their own connections; close them so they don't leak
+    try:
+        return task()
+    finally:
+        connections.close_all()
+
+
+def run_tasks(tasks, max_workers=1, time_budget=None):
+    """
+    Run independent statistics tasks and return (results, missing).
+
+    tasks maps a key to a callable. With max_workers > 1 the tasks run in a
+    thread pool, each on its own database connection, so the wall-clock time
+    approaches that of the slowest task. time_budget (seconds) bounds the
+    whole run; keys of tasks that did not finish in time are returned in
+    missing and their results are left out.
+    """
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+
+    if max_workers <= 1:
+        results = {}
+        for key, task in tasks.items():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            results[key] = task()
+        return results, [key for key in tasks if key not in results]
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='statistics')
+    try:
+        futures = {executor.submit(_run_in_thread, task): key for key, task in tasks.items()}
+        done, _ = wait(futures, timeout=time_budget)
+    finally:
+        # Tasks still queued are dropped; running ones finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results = {futures[future]: future.result() for future in done}
+    return results, [key for key in tasks if key not in results]
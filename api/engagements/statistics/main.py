@@ -1,75 +1,159 @@
+import time
+
+from django.conf import settings
 from django.utils import timezone
 from engagements.models import WorkItem, Ticket, Case, Job
-from core.models import AuditLog
+from engagements.statistics.breakdown_stats import get_breakdowns, CLOSED_STATUS_KEYS
+from engagements.statistics.executor import run_tasks
+from engagements.statistics.rollup import is_rollup_backfilled, get_rollup_breakdowns
+from engagements.statistics.status_time_stats import get_status_time_stats, get_status_keys
+from engagements.statistics.sla_stats import get_sla_stats
+from engagements.statistics.resolution_stats import get_resolution_stats
+from engagements.statistics.user_stats import get_by_created_user
 from django.db import models
 
-def get_work_item_statistics(model, tenant, Comment, AuditLog):
-    """Get statistics for a specific work item type."""
-    now = timezone.now()
-    qs = model.objects.filter(tenant=tenant, is_deleted=False)
-    
+# Threads used for the statistics sub-computations; 1 runs them in order
+STATISTICS_MAX_WORKERS = getattr(settings, 'STATISTICS_MAX_WORKERS', 1)
+# Seconds a statistics request may take before partial results are returned
+STATISTICS_TIME_BUDGET = getattr(settings, 'STATISTICS_TIME_BUDGET', None)
+
+
+def get_breakdown_statistics(model, breakdown):
+    """Counts that are read straight from a type's breakdown."""
+    by_status = breakdown['status']
+    by_priority = breakdown['priority']
     stats = {
-        'total': qs.count(),
-        'open': qs.filter(status='open').count(),
-        'in_progress': qs.filter(status='in_progress').count(),
-        'on_hold': qs.filter(status='on_hold').count(),
-        'resolved': qs.filter(status='resolved').count(),
-        'closed': qs.filter(status='closed').count(),
-        'high_priority': qs.filter(priority='high').count(),
-        'urgent_priority': qs.filter(priority='urgent').count(),
-        'avg_time_in_status_hours': get_avg_time_in_status(qs, AuditLog, now),
-        'reopened': get_reopened_count(qs, AuditLog),
+        'total': breakdown['total'],
+        'open': by_status.get('open', 0),
+        'in_progress': by_status.get('in_progress', 0),
+        'on_hold': by_status.get('on_hold', 0),
+        'resolved': by_status.get('resolved', 0),
+        'closed': by_status.get('closed', 0),
+        'high_priority': by_priority.get('high', 0),
+        'urgent_priority': by_priority.get('urgent', 0),
     }
-    
-    # Add model-specific stats
     if model == Ticket:
-        stats['avg_resolution_time_hours'] = get_avg_resolution_time(qs, now)
         stats['tickets_by_priority'] = {
-            'low': qs.filter(priority='low').count(),
-            'medium': qs.filter(priority='medium').count(),
-            'high': qs.filter(priority='high').count(),
+            'low': by_priority.get('low', 0),
+            'medium': by_priority.get('medium', 0),
+            'high': by_priority.get('high', 0),
         }
+    return stats
+
+
+def _get_time_in_status(qs, tenant, status_keys):
+    status_time = get_status_time_stats(qs, tenant, status_keys)
+    return {
+        # Per status, as CaseStatisticsSerializer.avg_time_in_status_hours declares
+        'avg_time_in_status_hours': status_time['avg_hours_by_status'],
+        'reopened': status_time['reopened'],
+    }
+
+
+def _get_resolution(qs, tenant, closed_status_ids):
+    resolution = get_resolution_stats(qs, tenant, closed_status_ids)
+    return {
+        'avg_resolution_time_hours': resolution['avg_hours'] or 0,
+        'median_resolution_time_hours': resolution['median_hours'],
+        'p90_resolution_time_hours': resolution['p90_hours'],
+    }
+
+
+def _get_job_estimates(qs):
+    totals = qs.aggregate(
+        total=models.Sum('estimated_hours'),
+        avg=models.Avg('estimated_hours'),
+    )
+    return {
+        'total_estimated_hours': totals['total'] or 0,
+        'avg_estimated_hours': totals['avg'] or 0,
+    }
+
+
+def get_work_item_statistic_tasks(model, tenant, status_keys=None, now=None):
+    """
+    The independent sub-computations of a type's statistics.
+
+    Each task returns a dict of statistics fields; none depends on another,
+    so they can run in any order or at the same time.
+    """
+    now = now or timezone.now()
+    qs = model.objects.filter(tenant=tenant, is_deleted=False)
+    closed_status_ids = None
+    if status_keys is not None:
+        closed_status_ids = [
+            status_id for status_id, key in status_keys.items() if key in CLOSED_STATUS_KEYS
+        ]
+
+    tasks = {
+        'time_in_status': lambda: _get_time_in_status(qs, tenant, status_keys),
+        'sla': lambda: {'sla': get_sla_stats(qs, tenant, closed_status_ids, now)},
+        'users': lambda: {'by_created_user': get_by_created_user(qs)},
+    }
+
+    # Add model-specific stats
+    if model == Ticket:
+        tasks['resolution'] = lambda: _get_resolution(qs, tenant, closed_status_ids)
     elif model == Case:
-        stats['cases_by_legal_area'] = {}
-        for case in qs.values('legal_area').distinct():
-            area = case['legal_area']
-            stats['cases_by_legal_area'][area] = qs.filter(legal_area=area).count()
+        tasks['legal_area'] = lambda: {'cases_by_legal_area': dict(
+            qs.values_list('legal_area').annotate(count=models.Count('id')).order_by()
+        )}
     elif model == Job:
-        stats['total_estimated_hours'] = sum(qs.values_list('estimated_hours', flat=True))
-        stats['avg_estimated_hours'] = qs.aggregate(avg=models.Avg('estimated_hours'))['avg'] or 0
-    
+        tasks['estimates'] = lambda: _get_job_estimates(qs)
+
+    return tasks
+
+
+def get_work_item_statistics(model, tenant, Comment, AuditLog, breakdown=None, status_keys=None):
+    """Get statistics for a specific work item type."""
+    if breakdown is None:
+        breakdown = get_breakdowns(tenant)[model.__name__.lower()]
+
+    stats = get_breakdown_statistics(model, breakdown)
+    for task in get_work_item_statistic_tasks(model, tenant, status_keys).values():
+        stats.update(task())
     return stats
 
-def get_avg_resolution_time(qs, now):
-    """Calculate average resolution time for resolved items."""
-    resolved_items = qs.filter(status__in=['resolved', 'closed'])
-    if not resolved_items.exists():
-        return 0
-    
-    total_time = 0
-    count = 0
-    
-    for item in resolved_items:
-        # Find the first status change to 'resolved' or 'closed'
-        resolution_log = AuditLog.objects.filter(
-            content_type__model='workitem',
-            object_id=item.id,
-            activity_type='status_changed',
-            description__icontains='resolved'
-        ).first()
-        
-        if resolution_log:
-            time_diff = resolution_log.created_at - item.created_at
-            total_time += time_diff.total_seconds() / 3600  # Convert to hours
-            count += 1
-    
-    return total_time / count if count > 0 else 0
-
-def get_all_work_item_statistics(tenant, Comment, AuditLog, WorkItem):
-    """Get statistics for all work item types."""
+def get_all_work_item_statistics(tenant, Comment, AuditLog, WorkItem, max_workers=None, time_budget=None):
+    """
+    Get statistics for all work item types.
+
+    The per-type sub-computations run through run_tasks, concurrently when
+    max_workers > 1. If time_budget runs out, 'partial' is set and
+    'missing' lists the sub-computations that were left out.
+    """
+    started = time.monotonic()
+    if max_workers is None:
+        max_workers = STATISTICS_MAX_WORKERS
+    if time_budget is None:
+        time_budget = STATISTICS_TIME_BUDGET
+
+    # refresh_statistics_rollup refreshes the rollup; reads add the changes
+    # made since, so the counts are live without writing anything here
+    if is_rollup_backfilled(tenant):
+        breakdowns = get_rollup_breakdowns(tenant)
+    else:
+        breakdowns = get_breakdowns(tenant)
+    status_keys = get_status_keys(tenant)
+    now = timezone.now()
+
     stats = {}
-    
+    tasks = {}
     for subclass in [Ticket, Case, Job]:
-        stats[subclass.__name__.lower()] = get_work_item_statistics(subclass, tenant, Comment, AuditLog)
-    
-    return stats 
\ No newline at end of file
+        name = subclass.__name__.lower()
+        stats[name] = get_breakdown_statistics(subclass, breakdowns[name])
+        for key, task in get_work_item_statistic_tasks(subclass, tenant, status_keys, now).items():
+            tasks[(name, key)] = task
+
+    remaining = None
+    if time_budget is not None:
+        remaining = max(time_budget - (time.monotonic() - started), 0)
+    results, missing = run_tasks(tasks, max_workers, remaining)
+
+    for (name, _), values in results.items():
+        stats[name].update(values)
+    stats['partial'] = bool(missing)
+    if missing:
+        stats['missing'] = [f'{name}.{key}' for name, key in missing]
+
+    return stats
@@ -0,0 +1,26 @@
+from django.db.models import Avg, Count, F, Min, Q, Window
+from django.db.models.functions import CumeDist
+
+
+def to_hours(delta, digits=2):
+    """Convert a timedelta to rounded hours, passing None through."""
+    if delta is None:
+        return None
+    return round(delta.total_seconds() / 3600, digits)
+
+
+def get_duration_summary(qs, field, percentiles=(50, 90, 99)):
+    """
+    Return count, mean and nearest-rank percentiles of a duration annotation.
+
+    Everything is computed in the database with one query: a CUME_DIST window
+    ranks the rows, and each percentile is the smallest value whose
+    cumulative distribution reaches it.
+    """
+    ranked = qs.annotate(
+        cume_dist=Window(expression=CumeDist(), order_by=F(field).asc())
+    )
+    aggregates = {'count': Count('pk'), 'avg': Avg(field)}
+    for percentile in percentiles:
+        aggregates[f'p{percentile}'] = Min(field, filter=Q(cume_dist__gte=percentile / 100))
+    return ranked.aggregate(**aggregates)
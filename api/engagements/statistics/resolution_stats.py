@@ -0,0 +1,49 @@
+from django.db.models import DurationField, ExpressionWrapper, F, OuterRef, Subquery
+
+from engagements.models import WorkItemStatus, WorkItemStatusTransition
+from engagements.statistics.breakdown_stats import get_option_ids, CLOSED_STATUS_KEYS
+from engagements.statistics.percentile_stats import get_duration_summary, to_hours
+
+
+def annotate_resolution_time(qs, tenant, closed_status_ids):
+    """
+    Annotate resolved work items with the delay until they were first resolved.
+
+    The resolution is the item's first status change into a closed
+    status, looked up per item through the (work_item, at) index.
+    """
+    first_resolved_at = (
+        WorkItemStatusTransition.objects.filter(
+            work_item=OuterRef('pk'),
+            from_status__isnull=False,
+            to_status__in=closed_status_ids,
+        )
+        .order_by('at')
+        .values('at')[:1]
+    )
+    return (
+        qs.filter(status__in=closed_status_ids)
+        .annotate(resolved_at=Subquery(first_resolved_at))
+        .filter(resolved_at__isnull=False)
+        .annotate(
+            resolution_time=ExpressionWrapper(
+                F('resolved_at') - F('created_at'), output_field=DurationField()
+            )
+        )
+    )
+
+
+def get_resolution_stats(qs, tenant, closed_status_ids=None):
+    """Mean, median and p90 resolution time in hours, in one query."""
+    if closed_status_ids is None:
+        closed_status_ids = get_option_ids(WorkItemStatus, tenant, CLOSED_STATUS_KEYS)
+
+    summary = get_duration_summary(
+        annotate_resolution_time(qs, tenant, closed_status_ids), 'resolution_time', (50, 90)
+    )
+    return {
+        'count': summary['count'],
+        'avg_hours': to_hours(summary['avg']),
+        'median_hours': to_hours(summary['p50']),
+        'p90_hours': to_hours(summary['p90']),
+    }
@@ -0,0 +1,252 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.utilities.option_cache import get_option
+from engagements.models import (
+    WorkItem,
+    WorkItemCategory,
+    WorkItemDailyStatistic,
+    WorkItemPriority,
+    WorkItemRollupDeletion,
+    WorkItemRollupState,
+    WorkItemRollupTotal,
+    WorkItemRollupWatermark,
+    WorkItemStatus,
+)
+from engagements.statistics.breakdown_stats import annotate_work_item_type, fold_breakdowns
+
+REFRESH_CHUNK_SIZE = 2000
+# Seconds re-scanned before the watermark, for transactions that committed
+# after a refresh with an updated_at from before it
+ROLLUP_OVERLAP = getattr(settings, 'STATISTICS_ROLLUP_OVERLAP', 600)
+
+
+def _record(deltas, when, dimensions, created=0, net=0):
+    key = (timezone.localdate(when),) + tuple(dimensions)
+    deltas[key][0] += created
+    deltas[key][1] += net
+
+
+def _collect_work_item_changes(tenant, since, until, deltas, save_states=True):
+    """
+    Move every work item changed in (since - ROLLUP_OVERLAP, until] into its
+    current bucket. Items already counted under their current dimensions
+    are skipped through WorkItemRollupState, so the overlap counts nothing
+    twice. With save_states=False the states are left as they are, for
+    reads that only need the deltas.
+    """
+    changed = annotate_work_item_type(
+        WorkItem.objects.filter(tenant=tenant, updated_at__lte=until)
+    )
+    if since is not None:
+        changed = changed.filter(updated_at__gt=since - timedelta(seconds=ROLLUP_OVERLAP))
+    rows = changed.values_list(
+        'id', 'work_item_type', 'status_id', 'priority_id', 'category_id',
+        'is_deleted', 'created_at', 'updated_at',
+    ).order_by().iterator(chunk_size=REFRESH_CHUNK_SIZE)
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= REFRESH_CHUNK_SIZE:
+            _apply_work_item_chunk(tenant, chunk, deltas, save_states)
+            chunk = []
+    if chunk:
+        _apply_work_item_chunk(tenant, chunk, deltas, save_states)
+
+
+def _apply_work_item_chunk(tenant, chunk, deltas, save_states):
+    states = WorkItemRollupState.objects.in_bulk([row[0] for row in chunk])
+    new_states = []
+    stale_ids = []
+
+    for item_id, work_item_type, status_id, priority_id, category_id, is_deleted, created_at, updated_at in chunk:
+        state = states.get(item_id)
+        old = state.get_dimensions() if state else None
+        new = None if is_deleted else (work_item_type, status_id, priority_id, category_id)
+
+        if state is None and new is not None:
+            _record(deltas, created_at, new, created=1, net=1)
+        elif old != new:
+            if old is not None:
+                _record(deltas, updated_at, old, net=-1)
+            if new is not None:
+                _record(deltas, updated_at, new, net=1)
+
+        if old == new or not save_states:
+            continue
+        if state is not None:
+            stale_ids.append(item_id)
+        if new is not None:
+            new_states.append(WorkItemRollupState(
+                work_item_id=item_id,
+                tenant=tenant,
+                work_item_type=work_item_type,
+                status_id=status_id,
+                priority_id=priority_id,
+                category_id=category_id,
+            ))
+
+    if save_states:
+        WorkItemRollupState.objects.filter(work_item_id__in=stale_ids).delete()
+        WorkItemRollupState.objects.bulk_create(new_states)
+
+
+def _collect_hard_deletes(tenant, until, deltas, consume=True):
+    """
+    Drop counted items whose row is gone; soft deletes show up as updates.
+    Reads the WorkItemRollupDeletion rows written since the last refresh,
+    so no delete is missed however late it commits. With consume=False the
+    deletions and states are kept for the next refresh.
+    """
+    deletions = WorkItemRollupDeletion.objects.filter(tenant_id=tenant.id)
+    deleted_ids = list(deletions.values_list('work_item_id', flat=True))
+    if not deleted_ids:
+        return
+    gone = WorkItemRollupState.objects.filter(work_item_id__in=deleted_ids)
+    for state in gone:
+        _record(deltas, until, state.get_dimensions(), net=-1)
+    if consume:
+        gone.delete()
+        deletions.filter(work_item_id__in=deleted_ids).delete()
+
+
+def record_hard_delete(sender, instance, **kwargs):
+    """post_delete receiver queueing a deleted work item for the next rollup refresh."""
+    if not isinstance(instance, WorkItem):
+        return
+    # Multi-table inheritance sends post_delete for the subclass and for WorkItem
+    WorkItemRollupDeletion.objects.get_or_create(
+        work_item_id=instance.pk, defaults={'tenant_id': instance.tenant_id}
+    )
+
+
+def _apply_deltas(tenant, deltas):
+    for (date, work_item_type, status_id, priority_id, category_id), (created, net) in deltas.items():
+        if not created and not net:
+            continue
+        statistic, _ = WorkItemDailyStatistic.objects.get_or_create(
+            tenant=tenant,
+            date=date,
+            work_item_type=work_item_type,
+            status_id=status_id,
+            priority_id=priority_id,
+            category_id=category_id,
+        )
+        WorkItemDailyStatistic.objects.filter(pk=statistic.pk).update(
+            created_count=F('created_count') + created,
+            net_count=F('net_count') + net,
+        )
+
+    net_per_dimensions = defaultdict(int)
+    for (_, *dimensions), (_, net) in deltas.items():
+        net_per_dimensions[tuple(dimensions)] += net
+    for (work_item_type, status_id, priority_id, category_id), net in net_per_dimensions.items():
+        if not net:
+            continue
+        total, _ = WorkItemRollupTotal.objects.get_or_create(
+            tenant=tenant,
+            work_item_type=work_item_type,
+            status_id=status_id,
+            priority_id=priority_id,
+            category_id=category_id,
+        )
+        WorkItemRollupTotal.objects.filter(pk=total.pk).update(count=F('count') + net)
+
+
+def is_rollup_backfilled(tenant):
+    return WorkItemRollupWatermark.objects.filter(tenant=tenant, refreshed_until__isnull=False).exists()
+
+
+def refresh_rollup(tenant, now=None, backfill=True):
+    """
+    Bring a tenant's daily statistics rollup up to date.
+
+    Only work items updated since the tenant's watermark (minus
+    ROLLUP_OVERLAP) are processed, so the cost follows the amount of recent
+    activity rather than the size of the tenant's history. The first
+    refresh reads the whole history; with backfill=False a tenant that was
+    never refreshed is left alone. Runs from refresh_statistics_rollup, never
+    inside a request; reads add the changes made since the watermark
+    (see get_pending_deltas). Returns whether the rollup is current.
+    """
+    if not backfill and not is_rollup_backfilled(tenant):
+        return False
+
+    until = now or timezone.now()
+    with transaction.atomic():
+        watermark, _ = WorkItemRollupWatermark.objects.select_for_update().get_or_create(tenant=tenant)
+        since = watermark.refreshed_until
+        if since is not None and since >= until:
+            return True
+
+        deltas = defaultdict(lambda: [0, 0])
+        _collect_work_item_changes(tenant, since, until, deltas)
+        _collect_hard_deletes(tenant, until, deltas)
+        _apply_deltas(tenant, deltas)
+
+        watermark.refreshed_until = until
+        watermark.save(update_fields=['refreshed_until'])
+    return True
+
+
+def get_pending_deltas(tenant, now=None):
+    """
+    Rollup deltas of the changes made since the tenant's watermark, without
+    writing anything, keyed like WorkItemDailyStatistic rows:
+    (date, work_item_type, status_id, priority_id, category_id) -> [created, net].
+
+    Lets reads between two refreshes see the live counts at a cost that
+    follows the recent activity, like the refresh itself.
+    """
+    since = WorkItemRollupWatermark.objects.filter(tenant=tenant).values_list('refreshed_until', flat=True).first()
+    until = now or timezone.now()
+    deltas = defaultdict(lambda: [0, 0])
+    if since is None or since >= until:
+        return deltas
+    _collect_work_item_changes(tenant, since, until, deltas, save_states=False)
+    _collect_hard_deletes(tenant, until, deltas, consume=False)
+    return deltas
+
+
+def _get_label(model, tenant, option_id):
+    option = get_option(model, tenant.id, option_id)
+    return option.label if option is not None else None
+
+
+def get_rollup_breakdowns(tenant):
+    """
+    Same shape as breakdown_stats.get_breakdowns, read from the rollup
+    totals plus the changes made since the last refresh.
+    """
+    counts = defaultdict(int)
+    rows = WorkItemRollupTotal.objects.filter(tenant=tenant).values_list(
+        'work_item_type', 'status__label', 'priority__label', 'category__label', 'count'
+    )
+    for *labels, count in rows:
+        counts[tuple(labels)] += count
+    for (_, work_item_type, status_id, priority_id, category_id), (_, net) in get_pending_deltas(tenant).items():
+        labels = (
+            work_item_type,
+            _get_label(WorkItemStatus, tenant, status_id),
+            _get_label(WorkItemPriority, tenant, priority_id),
+            _get_label(WorkItemCategory, tenant, category_id),
+        )
+        counts[labels] += net
+
+    rows = [
+        {
+            'work_item_type': work_item_type,
+            'status__label': status_label,
+            'priority__label': priority_label,
+            'category__label': category_label,
+            'count': count,
+        }
+        for (work_item_type, status_label, priority_label, category_label), count in counts.items()
+    ]
+    return fold_breakdowns(rows)
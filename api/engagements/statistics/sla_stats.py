@@ -1,19 +1,146 @@
-from django.db.models import F, ExpressionWrapper, DurationField, Avg
 from datetime import timedelta
 
-def get_sla_compliance(qs):
-    sla_days = 3
-    resolved = qs.filter(status='resolved', updated_at__isnull=False)
-    if resolved.exists():
-        within_sla = resolved.filter(updated_at__lte=F('created_at') + timedelta(days=sla_days)).count()
-        return round(100 * within_sla / resolved.count(), 2)
-    return None
-
-def get_avg_resolution_time(qs):
-    resolved = qs.filter(status='resolved', updated_at__isnull=False)
-    if resolved.exists():
-        avg_resolution = resolved.annotate(
-            resolution_time=ExpressionWrapper(F('updated_at') - F('created_at'), output_field=DurationField())
-        ).aggregate(avg=Avg('resolution_time'))
-        return round(avg_resolution['avg'].total_seconds() / 86400, 2) if avg_resolution['avg'] else None
-    return None 
\ No newline at end of file
+from django.conf import settings
+from django.db.models import (
+    Case, CharField, Count, DateTimeField, DurationField, ExpressionWrapper,
+    F, Min, OuterRef, Q, Subquery, Value, When, Avg,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from engagements.models import SLAPolicy, WorkItemStatus, WorkItemStatusTransition
+from engagements.statistics.breakdown_stats import get_option_ids, CLOSED_STATUS_KEYS
+from engagements.statistics.percentile_stats import to_hours
+from engagements.statistics.resolution_stats import get_resolution_stats
+
+# Used for items no active policy applies to
+DEFAULT_SLA_RESOLUTION_TIME = getattr(settings, 'SLA_DEFAULT_RESOLUTION_TIME', timedelta(days=3))
+SLA_EVALUATION_CHUNK_SIZE = 2000
+
+SLA_MET = 'met'
+SLA_BREACHED = 'breached'
+SLA_PENDING = 'pending'
+
+
+def _policy_resolution_time(tenant):
+    policies = (
+        SLAPolicy.objects.filter(tenant=tenant, is_active=True)
+        .filter(Q(priority=OuterRef('priority')) | Q(priority__isnull=True))
+        .filter(Q(category=OuterRef('category')) | Q(category__isnull=True))
+        # Policies naming a priority/category sort before the fallbacks
+        .order_by(F('priority').asc(nulls_last=True), F('category').asc(nulls_last=True))
+        .values('resolution_time')[:1]
+    )
+    return Coalesce(
+        Subquery(policies, output_field=DurationField()),
+        Value(DEFAULT_SLA_RESOLUTION_TIME, output_field=DurationField()),
+    )
+
+
+def _resolved_at(closed_status_ids):
+    """When the item last moved into its current closed status."""
+    closing_changes = (
+        WorkItemStatusTransition.objects.filter(
+            work_item=OuterRef('id'),
+            to_status__in=closed_status_ids,
+        )
+        .order_by('-at')
+        .values('at')[:1]
+    )
+    return Case(
+        When(
+            status__in=closed_status_ids,
+            # Items closed without a recorded transition fall back to their last update
+            then=Coalesce(Subquery(closing_changes), F('updated_at')),
+        ),
+        default=None,
+        output_field=DateTimeField(),
+    )
+
+
+def annotate_sla(qs, tenant, closed_status_ids=None, now=None):
+    """
+    Annotate work items with their SLA evaluation.
+
+    Adds sla_resolution_time (from the most specific policy), sla_due_at,
+    sla_resolved_at, sla_state (met/breached/pending) and
+    sla_time_to_breach, which is negative once an open item is overdue and
+    null for resolved items. Everything is computed in the database.
+    """
+    now = now or timezone.now()
+    if closed_status_ids is None:
+        closed_status_ids = get_option_ids(WorkItemStatus, tenant, CLOSED_STATUS_KEYS)
+
+    return qs.annotate(
+        sla_resolution_time=_policy_resolution_time(tenant),
+    ).annotate(
+        sla_due_at=ExpressionWrapper(
+            F('created_at') + F('sla_resolution_time'), output_field=DateTimeField()
+        ),
+        sla_resolved_at=_resolved_at(closed_status_ids),
+    ).annotate(
+        sla_state=Case(
+            When(sla_resolved_at__isnull=False, sla_resolved_at__lte=F('sla_due_at'), then=Value(SLA_MET)),
+            When(sla_resolved_at__isnull=False, then=Value(SLA_BREACHED)),
+            When(sla_due_at__lt=now, then=Value(SLA_BREACHED)),
+            default=Value(SLA_PENDING),
+            output_field=CharField(),
+        ),
+        sla_time_to_breach=Case(
+            When(
+                sla_resolved_at__isnull=True,
+                then=ExpressionWrapper(
+                    F('sla_due_at') - Value(now, output_field=DateTimeField()),
+                    output_field=DurationField(),
+                ),
+            ),
+            default=None,
+            output_field=DurationField(),
+        ),
+    )
+
+
+def get_sla_stats(qs, tenant, closed_status_ids=None, now=None):
+    """Compliance, breach counts and time-to-breach for qs in a single query."""
+    totals = annotate_sla(qs, tenant, closed_status_ids, now).aggregate(
+        met=Count('id', filter=Q(sla_state=SLA_MET)),
+        breached_resolved=Count('id', filter=Q(sla_state=SLA_BREACHED, sla_resolved_at__isnull=False)),
+        breached_open=Count('id', filter=Q(sla_state=SLA_BREACHED, sla_resolved_at__isnull=True)),
+        pending=Count('id', filter=Q(sla_state=SLA_PENDING)),
+        min_time_to_breach=Min('sla_time_to_breach', filter=Q(sla_state=SLA_PENDING)),
+        avg_time_to_breach=Avg('sla_time_to_breach', filter=Q(sla_state=SLA_PENDING)),
+    )
+
+    resolved = totals['met'] + totals['breached_resolved']
+    return {
+        'compliance_percent': round(100 * totals['met'] / resolved, 2) if resolved else None,
+        'met': totals['met'],
+        'breached': totals['breached_resolved'] + totals['breached_open'],
+        'breached_open': totals['breached_open'],
+        'pending': totals['pending'],
+        'min_hours_to_breach': to_hours(totals['min_time_to_breach']),
+        'avg_hours_to_breach': to_hours(totals['avg_time_to_breach']),
+    }
+
+
+def get_sla_compliance(qs, tenant):
+    """Percentage of resolved items that were resolved within their SLA."""
+    return get_sla_stats(qs, tenant)['compliance_percent']
+
+
+def evaluate_sla(qs, tenant, now=None, chunk_size=SLA_EVALUATION_CHUNK_SIZE):
+    """
+    Bulk mode: stream the SLA evaluation of every item in qs as plain dicts.
+
+    No model instances are built and rows are fetched in chunks, so a whole
+    tenant backlog can be re-evaluated with flat memory use.
+    """
+    return annotate_sla(qs.order_by(), tenant, now=now).values(
+        'id', 'sla_due_at', 'sla_resolved_at', 'sla_state', 'sla_time_to_breach',
+    ).iterator(chunk_size=chunk_size)
+
+
+def get_avg_resolution_time(qs, tenant):
+    """Average resolution time in days."""
+    avg_hours = get_resolution_stats(qs, tenant)['avg_hours']
+    return round(avg_hours / 24, 2) if avg_hours is not None else None
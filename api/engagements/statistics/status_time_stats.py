@@ -1,40 +1,68 @@
-from django.utils import timezone
-from core.models import AuditLog
-
-def get_avg_time_in_status(qs, AuditLog, now):
-    """Calculate average time items spend in each status."""
-    total_time = 0
-    count = 0
-    
-    for item in qs:
-        logs = list(AuditLog.objects.filter(
-            content_type__model='workitem',
-            object_id=item.id, 
-            activity_type='status_changed'
-        ).order_by('created_at'))
-        
-        if len(logs) >= 2:
-            for i in range(len(logs) - 1):
-                time_diff = logs[i + 1].created_at - logs[i].created_at
-                total_time += time_diff.total_seconds() / 3600  # Convert to hours
-                count += 1
-    
-    return total_time / count if count > 0 else 0
-
-def get_reopened_count(qs, AuditLog):
-    """Count how many times items were reopened (status changed back to open)."""
-    reopened_count = 0
-    
-    for item in qs:
-        logs = AuditLog.objects.filter(
-            content_type__model='workitem',
-            object_id=item.id, 
-            activity_type='status_changed'
-        ).order_by('created_at')
-        
-        # Count transitions back to 'open' status
-        for log in logs:
-            if 'open' in log.description.lower():
-                reopened_count += 1
-    
-    return reopened_count 
\ No newline at end of file
+from django.db.models import F, Window
+from django.db.models.functions import Lag
+from engagements.models import WorkItemStatus, WorkItemStatusTransition
+from engagements.statistics.breakdown_stats import get_option_key, OPEN_STATUS_KEY, CLOSED_STATUS_KEYS
+
+
+def get_status_keys(tenant):
+    """Map the tenant's status ids to option keys."""
+    return {
+        status_id: get_option_key(label)
+        for status_id, label in WorkItemStatus.objects.filter(tenant=tenant).values_list('id', 'label')
+    }
+
+
+def get_status_time_stats(qs, tenant, status_keys=None):
+    """
+    Compute dwell times per status and reopen counts for the work items in qs.
+
+    Reads the items' status transitions in one scan. A LAG window partitioned
+    by work item pairs every transition with the previous one of the same
+    item, which closes the dwell of the status the item is leaving.
+    """
+    if status_keys is None:
+        status_keys = get_status_keys(tenant)
+
+    transitions = (
+        WorkItemStatusTransition.objects.filter(
+            tenant=tenant,
+            work_item__in=qs.values('id'),
+        )
+        .annotate(
+            previous_at=Window(
+                expression=Lag('at'),
+                partition_by=[F('work_item_id')],
+                order_by=F('at').asc(),
+            )
+        )
+        .values_list('from_status_id', 'to_status_id', 'at', 'previous_at')
+        .order_by()
+    )
+
+    total_hours = {}
+    dwell_counts = {}
+    reopened = 0
+
+    for from_status_id, to_status_id, at, previous_at in transitions:
+        if from_status_id is None:
+            continue
+
+        old_key = status_keys.get(from_status_id, 'unknown')
+        new_key = status_keys.get(to_status_id, 'unknown')
+
+        if previous_at is not None:
+            hours = (at - previous_at).total_seconds() / 3600
+            total_hours[old_key] = total_hours.get(old_key, 0) + hours
+            dwell_counts[old_key] = dwell_counts.get(old_key, 0) + 1
+
+        if new_key == OPEN_STATUS_KEY and old_key in CLOSED_STATUS_KEYS:
+            reopened += 1
+
+    dwell_count = sum(dwell_counts.values())
+    return {
+        'avg_hours': sum(total_hours.values()) / dwell_count if dwell_count else 0,
+        'avg_hours_by_status': {
+            key: round(total_hours[key] / dwell_counts[key], 2) for key in total_hours
+        },
+        'reopened': reopened,
+    }
@@ -20,8 +20,8 @@ def get_by_assigned_user(qs):
 
 def get_by_created_user(qs):
     created = (
-        qs.values('created_by__username')
+        qs.values('created_by')
         .annotate(count=Count('id'))
         .order_by('-count')
     )
-    return {item['created_by__username']: item['count'] for item in created} 
\ No newline at end of file
+    return {str(item['created_by'] or 'unknown'): item['count'] for item in created} 
\ No newline at end of file
@@ -1,6 +1,9 @@
-from django.db.models import Count
+from django.db.models import Count, DateField, Sum
 from django.db.models.functions import TruncMonth, TruncWeek
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from engagements.models import WorkItem, WorkItemDailyStatistic, WorkItemStatusTransition
+from engagements.statistics.breakdown_stats import annotate_work_item_type, get_option_key, CLOSED_STATUS_KEYS
+from engagements.statistics.rollup import get_pending_deltas, is_rollup_backfilled
 
 def get_total(qs):
     return qs.count()
@@ -8,30 +11,132 @@ def get_total(qs):
 def get_by_field(qs, field):
     return dict(qs.values_list(field).annotate(count=Count('id')))
 
-def get_created_per_period(qs, period='month'):
+def get_created_per_period(tenant, period='month', work_item_type=None):
+    """
+    Items created per month or week, read from the daily statistics rollup
+    plus the items created since its last refresh. Tenants whose rollup was
+    never backfilled are counted from the work items themselves.
+    """
+    if not is_rollup_backfilled(tenant):
+        return _get_live_created_per_period(tenant, period, work_item_type)
+
     if period == 'month':
-        trunc = TruncMonth('created_at')
-        key = 'month'
+        trunc = TruncMonth('date')
     else:
-        trunc = TruncWeek('created_at')
-        key = 'week'
+        trunc = TruncWeek('date')
+    rows = (
+        _get_rollup(tenant, work_item_type)
+          .annotate(period=trunc)
+          .values('period')
+          .annotate(count=Sum('created_count'))
+          .order_by()
+    )
+    per_period = {row['period']: row['count'] for row in rows}
+    for (day, item_type, *_), (created, _) in get_pending_deltas(tenant).items():
+        if created and (not work_item_type or item_type == work_item_type):
+            period_start = get_period_start(day, period)
+            per_period[period_start] = per_period.get(period_start, 0) + created
+    return {str(period_start): count for period_start, count in sorted(per_period.items()) if count > 0}
+
+def _get_live_created_per_period(tenant, period, work_item_type):
+    trunc = TruncMonth if period == 'month' else TruncWeek
+    items = annotate_work_item_type(WorkItem.objects.filter(tenant=tenant, is_deleted=False))
+    if work_item_type:
+        items = items.filter(work_item_type=work_item_type)
     per_period = (
-        qs.annotate(period=trunc)
+        items
+          .annotate(period=trunc('created_at', output_field=DateField()))
           .values('period')
           .annotate(count=Count('id'))
           .order_by('period')
     )
     return {str(item['period']): item['count'] for item in per_period}
 
-def get_open_at_month_end(qs, months):
-    open_cases_month = {}
-    for month in months:
-        year, m = map(int, month.split('-'))
-        last_day = datetime(year, m, 28) + timedelta(days=4)
-        last_day = last_day - timedelta(days=last_day.day)
-        count = qs.filter(created_at__lte=last_day, status__in=['open', 'in-progress']).count()
-        open_cases_month[month] = count
-    return open_cases_month
+def get_period_start(day, period='month'):
+    """First day of the month or ISO week holding day."""
+    if period == 'month':
+        return day.replace(day=1)
+    return day - timedelta(days=day.weekday())
+
+def get_period_starts(start, end, period='month'):
+    """First day of every month or ISO week overlapping [start, end]."""
+    current = get_period_start(start, period)
+    period_starts = []
+    while current <= end:
+        period_starts.append(current)
+        if period == 'month':
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=7)
+    return period_starts
+
+def get_open_backlog(tenant, start, end, period='month', work_item_type=None):
+    """
+    Open backlog at the end of every month or week between start and end.
+
+    Replays WorkItemStatusTransition: a transition into an open status from
+    a closed one (or from nothing, on creation) adds an item, one into a
+    closed status from an open one removes it. The net change per period
+    comes from one grouped query, so the curve costs the same however many
+    periods are requested. Deleted items are left out. Periods are keyed by
+    their first day; the last period is cut off at end.
+    """
+    period_starts = get_period_starts(start, end, period)
+    trunc = TruncMonth('at') if period == 'month' else TruncWeek('at')
+
+    transitions = WorkItemStatusTransition.objects.filter(
+        tenant=tenant, at__date__lte=end, work_item__is_deleted=False,
+    )
+    if work_item_type:
+        transitions = _filter_work_item_type(transitions, work_item_type)
+    rows = (
+        transitions
+          .annotate(period=trunc)
+          .values('period', 'from_status__label', 'to_status__label')
+          .annotate(count=Count('id'))
+          .order_by()
+    )
+    net_per_period = {}
+    for row in rows:
+        was_open = row['from_status__label'] is not None and _is_open(row['from_status__label'])
+        delta = _is_open(row['to_status__label']) - was_open
+        if delta:
+            period_start = row['period'].date()
+            net_per_period[period_start] = net_per_period.get(period_start, 0) + delta * row['count']
+
+    backlog = {}
+    running_total = 0
+    history = sorted(net_per_period.items())
+    for period_start in period_starts:
+        while history and history[0][0] <= period_start:
+            running_total += history.pop(0)[1]
+        backlog[str(period_start)] = running_total
+    return backlog
+
+def _is_open(status_label):
+    return get_option_key(status_label) not in CLOSED_STATUS_KEYS
+
+def _filter_work_item_type(transitions, work_item_type):
+    subtypes = ['ticket', 'case', 'job']
+    if work_item_type in subtypes:
+        return transitions.filter(**{f'work_item__{work_item_type}__isnull': False})
+    return transitions.filter(**{f'work_item__{subtype}__isnull': True for subtype in subtypes})
+
+def get_open_at_month_end(tenant, months, work_item_type=None):
+    """Open backlog at the end of each 'YYYY-MM' month."""
+    if not months:
+        return {}
+    month_starts = {month: date(*map(int, month.split('-')), 1) for month in months}
+    first_month = min(month_starts.values())
+    last_day = (max(month_starts.values()) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    backlog = get_open_backlog(tenant, first_month, last_day, 'month', work_item_type)
+    return {month: backlog[str(month_start)] for month, month_start in month_starts.items()}
+
+def _get_rollup(tenant, work_item_type=None):
+    rollup = WorkItemDailyStatistic.objects.filter(tenant=tenant)
+    if work_item_type:
+        rollup = rollup.filter(work_item_type=work_item_type)
+    return rollup
 
 def get_unassigned(qs):
     return qs.filter(assigned_user__isnull=True).count()
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.enums import SystemRole
+from core.tests.factory import RoleFactory, TenantFactory
+from engagements.tests.factory import WorkItemStatusFactory
+from relations.tests.factory import PersonFactory
+from users.tests.factory import UserFactory
+
+
+class ConditionalGetTestCase(TestCase):
+    url = '/api/statuses/'
+
+    def setUp(self):
+        cache.clear()
+        self.tenant = TenantFactory.create()
+        self.user = UserFactory.create(self.tenant, username='owner', email='owner@example.com')
+        role = RoleFactory.create(self.tenant, self.user.id, key=SystemRole.TENANT_EMPLOYEE.value, label='Employee')
+        PersonFactory.create(self.tenant, role=role, user=self.user)
+        self.status = WorkItemStatusFactory.create(self.tenant, self.user.id, label='Open')
+        self.client.cookies['access_token'] = str(AccessToken.for_user(self.user))
+
+    def test_list_and_detail_have_etags(self):
+        listed = self.client.get(self.url)
+        detail = self.client.get(f'{self.url}{self.status.id}/')
+
+        self.assertEqual(listed.status_code, 200)
+        self.assertTrue(listed['ETag'].startswith('"'))
+        self.assertEqual(detail.status_code, 200)
+        self.assertNotEqual(detail['ETag'], listed['ETag'])
+
+    def test_matching_etag_returns_304_without_serializing(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with mock.patch('rest_framework.generics.GenericAPIView.get_serializer') as get_serializer:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        get_serializer.assert_not_called()
+
+    def test_write_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkItemStatusFactory.create(self.tenant, self.user.id, label='Closed')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_detail_checks_permissions_before_304(self):
+        url = f'{self.url}{self.status.id}/'
+        etag = self.client.get(url)['ETag']
+
+        with mock.patch('core.views.base_views.CanViewContentOnly.has_permission', return_value=False):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_query_parameters_change_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, {'search': 'Open'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
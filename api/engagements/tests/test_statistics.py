@@ -0,0 +1,646 @@
+import time
+import uuid
+from datetime import date, timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import AuditLog
+from core.tests.factory import TenantFactory
+from engagements.models import (
+    Ticket,
+    Comment,
+    SLAPolicy,
+    WorkItem,
+    WorkItemDailyStatistic,
+    WorkItemRollupDeletion,
+    WorkItemRollupState,
+    WorkItemStatusTransition,
+)
+from engagements.statistics.cache import get_cached_statistics, invalidate_statistics, _get_cache_key
+from engagements.statistics.breakdown_stats import get_breakdowns, get_option_key
+from engagements.statistics.executor import run_tasks
+from engagements.statistics.comment_stats import get_first_response_stats, get_avg_time_to_first_response
+from engagements.statistics.sla_stats import get_sla_stats, evaluate_sla
+from engagements.statistics.resolution_stats import get_resolution_stats
+from engagements.statistics.main import get_all_work_item_statistics
+from engagements.statistics.rollup import refresh_rollup, get_rollup_breakdowns
+from engagements.statistics.work_item_stats import (
+    get_created_per_period,
+    get_open_at_month_end,
+    get_open_backlog,
+)
+from engagements.statistics.status_time_stats import get_status_time_stats, get_status_keys
+from engagements.tests.factory import (
+    TicketFactory,
+    CaseFactory,
+    JobFactory,
+    CommentFactory,
+    WorkItemStatusFactory,
+    WorkItemPriorityFactory,
+    WorkItemCategoryFactory,
+)
+
+
+class StatisticsTestCase(TestCase):
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        self.statuses = {
+            label: WorkItemStatusFactory.create(self.tenant, None, label=label)
+            for label in ['Open', 'In Progress', 'Resolved', 'Closed']
+        }
+        self.priorities = {
+            label: WorkItemPriorityFactory.create(self.tenant, None, label=label)
+            for label in ['Low', 'High', 'Urgent']
+        }
+        self.category = WorkItemCategoryFactory.create(self.tenant, None, label='Support')
+
+    def create_ticket(self, status='Open', priority='Low', **kwargs):
+        return TicketFactory.create(
+            self.tenant,
+            None,
+            status=self.statuses[status],
+            priority=self.priorities[priority],
+            category=self.category,
+            **kwargs
+        )
+
+    def set_created_at(self, item, at):
+        """Backdate an item together with its initial status transition."""
+        WorkItem.objects.filter(pk=item.pk).update(created_at=at)
+        WorkItemStatusTransition.objects.filter(work_item=item, from_status__isnull=True).update(at=at)
+        item.created_at = at
+
+    def add_transition(self, item, old, new, at):
+        return WorkItemStatusTransition.objects.create(
+            tenant=self.tenant,
+            work_item=item,
+            from_status=self.statuses[old],
+            to_status=self.statuses[new],
+            at=at,
+        )
+
+
+class TestBreakdownStats(StatisticsTestCase):
+    def test_option_key_normalizes_labels(self):
+        self.assertEqual(get_option_key('In Progress'), 'in_progress')
+        self.assertEqual(get_option_key('on-hold'), 'on_hold')
+        self.assertEqual(get_option_key(None), 'none')
+
+    def test_breakdowns_group_by_type_and_option(self):
+        self.create_ticket(status='Open', priority='High')
+        self.create_ticket(status='Open', priority='Urgent')
+        self.create_ticket(status='In Progress', priority='High')
+        CaseFactory.create(
+            self.tenant, None,
+            status=self.statuses['Resolved'],
+            priority=self.priorities['Low'],
+            category=self.category,
+        )
+        JobFactory.create(
+            self.tenant, None,
+            status=self.statuses['Closed'],
+            priority=self.priorities['Low'],
+            category=self.category,
+        )
+
+        breakdowns = get_breakdowns(self.tenant)
+
+        self.assertEqual(breakdowns['ticket']['total'], 3)
+        self.assertEqual(breakdowns['ticket']['status'], {'open': 2, 'in_progress': 1})
+        self.assertEqual(breakdowns['ticket']['priority'], {'high': 2, 'urgent': 1})
+        self.assertEqual(breakdowns['ticket']['category'], {'support': 3})
+        self.assertEqual(breakdowns['case']['status'], {'resolved': 1})
+        self.assertEqual(breakdowns['job']['status'], {'closed': 1})
+
+    def test_breakdowns_exclude_deleted_and_other_tenants(self):
+        self.create_ticket().delete()
+        other_tenant = TenantFactory.create()
+        TicketFactory.create(other_tenant, None)
+
+        breakdowns = get_breakdowns(self.tenant)
+
+        self.assertEqual(breakdowns['ticket']['total'], 0)
+
+    def test_breakdowns_use_single_query(self):
+        for _ in range(3):
+            self.create_ticket()
+        for label in ['Extra 1', 'Extra 2', 'Extra 3']:
+            WorkItemStatusFactory.create(self.tenant, None, label=label)
+
+        with self.assertNumQueries(1):
+            get_breakdowns(self.tenant)
+
+
+class TestStatusTimeStats(StatisticsTestCase):
+    def test_dwell_times_and_reopens_per_status(self):
+        start = timezone.now() - timedelta(days=10)
+        ticket = self.create_ticket()
+        self.set_created_at(ticket, start)
+        self.add_transition(ticket, 'Open', 'In Progress', start + timedelta(hours=2))
+        self.add_transition(ticket, 'In Progress', 'Resolved', start + timedelta(hours=6))
+        self.add_transition(ticket, 'Resolved', 'Open', start + timedelta(hours=7))
+
+        stats = get_status_time_stats(Ticket.objects.all(), self.tenant)
+
+        self.assertEqual(stats['avg_hours_by_status'], {'open': 2.0, 'in_progress': 4.0, 'resolved': 1.0})
+        self.assertAlmostEqual(stats['avg_hours'], 7 / 3)
+        self.assertEqual(stats['reopened'], 1)
+
+    def test_scan_cost_is_independent_of_item_count(self):
+        start = timezone.now() - timedelta(days=1)
+        for _ in range(5):
+            ticket = self.create_ticket()
+            self.set_created_at(ticket, start)
+            self.add_transition(ticket, 'Open', 'Closed', start + timedelta(hours=1))
+        status_keys = get_status_keys(self.tenant)
+
+        with self.assertNumQueries(1):
+            stats = get_status_time_stats(Ticket.objects.all(), self.tenant, status_keys)
+
+        self.assertEqual(stats['avg_hours_by_status'], {'open': 1.0})
+        self.assertEqual(stats['reopened'], 0)
+
+    def test_statistics_report_time_in_status_per_status(self):
+        start = timezone.now() - timedelta(days=1)
+        ticket = self.create_ticket()
+        self.set_created_at(ticket, start)
+        self.add_transition(ticket, 'Open', 'Closed', start + timedelta(hours=3))
+
+        stats = get_all_work_item_statistics(self.tenant, Comment, AuditLog, WorkItem)
+
+        self.assertEqual(stats['ticket']['avg_time_in_status_hours'], {'open': 3.0})
+        self.assertNotIn('avg_time_in_status_by_status_hours', stats['ticket'])
+
+
+class TestStatusTransitions(StatisticsTestCase):
+    def test_creation_records_initial_status(self):
+        ticket = self.create_ticket(status='In Progress')
+
+        transition = WorkItemStatusTransition.objects.get(work_item=ticket)
+        self.assertIsNone(transition.from_status)
+        self.assertEqual(transition.to_status, self.statuses['In Progress'])
+
+    def test_status_change_records_transition_with_actor(self):
+        ticket = Ticket.objects.get(pk=self.create_ticket().pk)
+        actor = uuid.uuid4()
+
+        ticket.title = 'Renamed'
+        ticket.save()
+        ticket.status = self.statuses['Resolved']
+        ticket.updated_by = actor
+        ticket.save()
+
+        transition = WorkItemStatusTransition.objects.filter(work_item=ticket).last()
+        self.assertEqual(WorkItemStatusTransition.objects.filter(work_item=ticket).count(), 2)
+        self.assertEqual(transition.from_status, self.statuses['Open'])
+        self.assertEqual(transition.to_status, self.statuses['Resolved'])
+        self.assertEqual(transition.actor, actor)
+
+    def test_transitions_are_append_only(self):
+        transition = WorkItemStatusTransition.objects.get(work_item=self.create_ticket())
+
+        with self.assertRaises(ValidationError):
+            transition.save()
+
+
+class TestCommentStats(StatisticsTestCase):
+    def test_first_response_stats_in_one_query(self):
+        for hours in range(1, 11):
+            ticket = self.create_ticket()
+            for delay in (hours, hours + 5):
+                comment = CommentFactory.create(self.tenant, None, ticket)
+                Comment.objects.filter(pk=comment.pk).update(
+                    created_at=ticket.created_at + timedelta(hours=delay)
+                )
+        self.create_ticket()  # never answered
+
+        with self.assertNumQueries(1):
+            stats = get_first_response_stats(Ticket.objects.all(), Comment)
+
+        self.assertEqual(stats['count'], 10)
+        self.assertEqual(stats['avg_hours'], 5.5)
+        self.assertEqual(stats['p50_hours'], 5.0)
+        self.assertEqual(stats['p90_hours'], 9.0)
+        self.assertEqual(stats['p99_hours'], 10.0)
+
+    def test_avg_time_to_first_response_without_comments(self):
+        self.create_ticket()
+
+        self.assertIsNone(get_avg_time_to_first_response(Ticket.objects.all(), Comment))
+
+
+class TestStatisticsRollup(StatisticsTestCase):
+    def test_rollup_matches_live_breakdowns(self):
+        self.create_ticket(status='Open', priority='High')
+        self.create_ticket(status='In Progress', priority='Low')
+        CaseFactory.create(
+            self.tenant, None,
+            status=self.statuses['Resolved'],
+            priority=self.priorities['Low'],
+            category=self.category,
+        )
+
+        refresh_rollup(self.tenant)
+
+        self.assertEqual(get_rollup_breakdowns(self.tenant), get_breakdowns(self.tenant))
+
+    def test_refresh_moves_changed_items_between_buckets(self):
+        ticket = self.create_ticket(status='Open')
+        deleted = self.create_ticket(status='Open')
+        refresh_rollup(self.tenant)
+
+        ticket.status = self.statuses['Closed']
+        ticket.save()
+        deleted.delete()
+        refresh_rollup(self.tenant)
+
+        breakdown = get_rollup_breakdowns(self.tenant)['ticket']
+        self.assertEqual(breakdown['total'], 1)
+        self.assertEqual(breakdown['status'], {'closed': 1})
+        self.assertEqual(WorkItemRollupState.objects.filter(tenant=self.tenant).count(), 1)
+
+    def test_late_commit_before_watermark_is_picked_up(self):
+        self.create_ticket()
+        refreshed_until = timezone.now()
+        refresh_rollup(self.tenant, now=refreshed_until)
+
+        late = self.create_ticket()
+        WorkItem.objects.filter(pk=late.pk).update(updated_at=refreshed_until - timedelta(seconds=30))
+        refresh_rollup(self.tenant)
+
+        self.assertEqual(get_rollup_breakdowns(self.tenant)['ticket']['total'], 2)
+
+    def test_hard_delete_is_subtracted_without_audit_log(self):
+        self.create_ticket()
+        deleted = self.create_ticket()
+        refresh_rollup(self.tenant)
+
+        deleted.hard_delete()
+        refresh_rollup(self.tenant)
+
+        self.assertEqual(get_rollup_breakdowns(self.tenant)['ticket']['total'], 1)
+        self.assertFalse(WorkItemRollupState.objects.filter(work_item_id=deleted.pk).exists())
+        self.assertFalse(WorkItemRollupDeletion.objects.exists())
+
+    def test_refresh_only_reads_queued_deletes(self):
+        for _ in range(3):
+            self.create_ticket()
+        refresh_rollup(self.tenant)
+        self.create_ticket().hard_delete()
+
+        self.assertEqual(WorkItemRollupDeletion.objects.get().tenant_id, self.tenant.id)
+        refresh_rollup(self.tenant)
+
+        self.assertEqual(get_rollup_breakdowns(self.tenant)['ticket']['total'], 3)
+        self.assertFalse(WorkItemRollupDeletion.objects.exists())
+
+    def test_statistics_request_does_not_backfill(self):
+        self.create_ticket()
+
+        stats = get_all_work_item_statistics(self.tenant, Comment, AuditLog, WorkItem)
+
+        self.assertEqual(stats['ticket']['total'], 1)
+        self.assertFalse(WorkItemDailyStatistic.objects.filter(tenant=self.tenant).exists())
+
+    def test_statistics_request_does_not_refresh(self):
+        self.create_ticket()
+        refresh_rollup(self.tenant)
+        self.create_ticket()
+
+        stats = get_all_work_item_statistics(self.tenant, Comment, AuditLog, WorkItem)
+
+        self.assertEqual(stats['ticket']['total'], 2)
+        self.assertEqual(WorkItemRollupState.objects.filter(tenant=self.tenant).count(), 1)
+
+    def test_reads_between_refreshes_are_live(self):
+        moved = self.create_ticket(status='Open')
+        deleted = self.create_ticket(status='Open')
+        refresh_rollup(self.tenant)
+
+        moved.status = self.statuses['Closed']
+        moved.save()
+        deleted.hard_delete()
+        self.create_ticket(status='In Progress')
+
+        self.assertEqual(get_rollup_breakdowns(self.tenant), get_breakdowns(self.tenant))
+        month = str(timezone.localdate().replace(day=1))
+        self.assertEqual(get_created_per_period(self.tenant, work_item_type='ticket'), {month: 3})
+
+    def test_current_counts_do_not_sum_history(self):
+        self.create_ticket()
+        refresh_rollup(self.tenant)
+        WorkItemDailyStatistic.objects.filter(tenant=self.tenant).delete()
+
+        self.assertEqual(get_rollup_breakdowns(self.tenant)['ticket']['total'], 1)
+
+    def test_created_per_period_without_backfill_is_live(self):
+        self.create_ticket()
+        self.create_ticket()
+
+        created = get_created_per_period(self.tenant, period='week', work_item_type='ticket')
+
+        today = timezone.localdate()
+        self.assertEqual(created, {str(today - timedelta(days=today.weekday())): 2})
+
+    def test_repeated_refresh_does_not_double_count(self):
+        self.create_ticket()
+        refresh_rollup(self.tenant)
+
+        refresh_rollup(self.tenant)
+
+        self.assertEqual(WorkItemDailyStatistic.objects.get(tenant=self.tenant).created_count, 1)
+
+    def test_created_per_period_and_open_at_month_end(self):
+        self.create_ticket(status='Open')
+        self.create_ticket(status='Closed')
+        CaseFactory.create(
+            self.tenant, None,
+            status=self.statuses['Open'],
+            priority=self.priorities['Low'],
+            category=self.category,
+        )
+        refresh_rollup(self.tenant)
+        today = timezone.localdate()
+        month = today.strftime('%Y-%m')
+
+        created = get_created_per_period(self.tenant, work_item_type='ticket')
+        self.assertEqual(created, {str(today.replace(day=1)): 2})
+
+        with self.assertNumQueries(1):
+            open_at_month_end = get_open_at_month_end(self.tenant, ['2000-01', month])
+        self.assertEqual(open_at_month_end, {'2000-01': 0, month: 2})
+
+
+class TestOpenBacklog(StatisticsTestCase):
+    def at(self, *args):
+        return timezone.make_aware(timezone.datetime(*args, 12))
+
+    def create_ticket_at(self, at, status='Open'):
+        ticket = self.create_ticket(status=status)
+        self.set_created_at(ticket, at)
+        return ticket
+
+    def move(self, item, status, at):
+        """Change the status through WorkItem.save, as if on the given day."""
+        item.status = self.statuses[status]
+        with mock.patch('django.utils.timezone.now', return_value=at):
+            item.save()
+
+    def test_items_count_until_they_are_closed(self):
+        ticket = self.create_ticket_at(self.at(2024, 1, 10))
+        self.move(ticket, 'Closed', self.at(2024, 3, 10))
+
+        backlog = get_open_backlog(self.tenant, date(2024, 1, 1), date(2024, 4, 30))
+
+        self.assertEqual(backlog, {
+            '2024-01-01': 1,
+            '2024-02-01': 1,
+            '2024-03-01': 0,
+            '2024-04-01': 0,
+        })
+
+    def test_monthly_backlog_curve_in_one_query(self):
+        self.create_ticket_at(self.at(2023, 12, 1))
+        closed, reopened, _ = [self.create_ticket_at(self.at(2024, 1, 10)) for _ in range(3)]
+        self.move(closed, 'Closed', self.at(2024, 2, 5))
+        self.move(reopened, 'Resolved', self.at(2024, 2, 10))
+        self.move(reopened, 'Open', self.at(2024, 3, 1))
+        moved = self.create_ticket_at(self.at(2024, 3, 20), status='In Progress')
+        self.move(moved, 'Open', self.at(2024, 3, 21))
+        self.create_ticket_at(self.at(2024, 5, 1))
+        self.create_ticket_at(self.at(2024, 1, 15), status='Closed')
+
+        with self.assertNumQueries(1):
+            backlog = get_open_backlog(self.tenant, date(2024, 1, 1), date(2024, 4, 30))
+
+        self.assertEqual(backlog, {
+            '2024-01-01': 4,
+            '2024-02-01': 2,
+            '2024-03-01': 4,
+            '2024-04-01': 4,
+        })
+
+    def test_weekly_backlog_curve(self):
+        tickets = [self.create_ticket_at(self.at(2024, 1, 10)) for _ in range(3)]
+        for ticket in tickets[:2]:
+            self.move(ticket, 'Closed', self.at(2024, 1, 16))
+
+        backlog = get_open_backlog(self.tenant, date(2024, 1, 9), date(2024, 1, 21), period='week')
+
+        self.assertEqual(backlog, {'2024-01-08': 3, '2024-01-15': 1})
+
+    def test_deleted_items_and_other_types_are_left_out(self):
+        self.create_ticket_at(self.at(2024, 1, 10))
+        self.create_ticket_at(self.at(2024, 1, 10)).delete()
+        case = CaseFactory.create(
+            self.tenant, None,
+            status=self.statuses['Open'],
+            priority=self.priorities['Low'],
+            category=self.category,
+        )
+        self.set_created_at(case, self.at(2024, 1, 10))
+
+        self.assertEqual(get_open_backlog(self.tenant, date(2024, 1, 1), date(2024, 1, 31)), {'2024-01-01': 2})
+        self.assertEqual(
+            get_open_backlog(self.tenant, date(2024, 1, 1), date(2024, 1, 31), work_item_type='ticket'),
+            {'2024-01-01': 1},
+        )
+
+    def test_open_at_month_end_keeps_month_keys(self):
+        for _ in range(3):
+            self.create_ticket_at(self.at(2024, 1, 10))
+
+        self.assertEqual(
+            get_open_at_month_end(self.tenant, ['2024-02', '2023-12']),
+            {'2024-02': 3, '2023-12': 0},
+        )
+
+
+class TestStatisticsCache(StatisticsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return {'calls': self.calls}
+
+    def test_repeated_reads_are_served_from_cache(self):
+        get_cached_statistics(self.tenant, self.compute)
+
+        self.assertEqual(get_cached_statistics(self.tenant, self.compute), {'calls': 1})
+        self.assertEqual(get_cached_statistics(self.tenant, self.compute, period='week'), {'calls': 2})
+
+    def test_invalidation_applies_after_commit(self):
+        get_cached_statistics(self.tenant, self.compute)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_statistics(self.tenant)
+
+        self.assertEqual(get_cached_statistics(self.tenant, self.compute), {'calls': 2})
+
+    def test_other_tenants_stay_cached(self):
+        other_tenant = TenantFactory.create()
+        get_cached_statistics(other_tenant, self.compute)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_statistics(self.tenant)
+
+        self.assertEqual(get_cached_statistics(other_tenant, self.compute), {'calls': 1})
+
+    @mock.patch('engagements.statistics.cache.STATISTICS_FRESH_SECONDS', 0)
+    def test_stale_entry_is_served_while_another_worker_recomputes(self):
+        get_cached_statistics(self.tenant, self.compute)
+        lock_key = _get_cache_key(self.tenant.id, {}) + ':lock'
+        cache.add(lock_key, True)
+
+        self.assertEqual(get_cached_statistics(self.tenant, self.compute), {'calls': 1})
+
+        cache.delete(lock_key)
+        self.assertEqual(get_cached_statistics(self.tenant, self.compute), {'calls': 2})
+
+    def test_partial_results_are_not_cached(self):
+        get_cached_statistics(self.tenant, lambda: {'partial': True})
+
+        self.assertEqual(get_cached_statistics(self.tenant, self.compute), {'calls': 1})
+
+
+class TestStatisticsExecutor(TestCase):
+    def sleeper(self, seconds, value):
+        def task():
+            time.sleep(seconds)
+            return value
+        return task
+
+    def test_sequential_run_returns_all_results(self):
+        results, missing = run_tasks({'a': lambda: 1, 'b': lambda: 2})
+
+        self.assertEqual(results, {'a': 1, 'b': 2})
+        self.assertEqual(missing, [])
+
+    def test_concurrent_run_takes_about_the_slowest_task(self):
+        tasks = {key: self.sleeper(0.2, key) for key in ['a', 'b', 'c', 'd']}
+
+        started = time.monotonic()
+        results, missing = run_tasks(tasks, max_workers=4)
+
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(results, {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'})
+
+    def test_time_budget_returns_partial_results(self):
+        tasks = {'fast': self.sleeper(0, 'fast'), 'slow': self.sleeper(1, 'slow')}
+
+        results, missing = run_tasks(tasks, max_workers=2, time_budget=0.3)
+
+        self.assertEqual(results, {'fast': 'fast'})
+        self.assertEqual(missing, ['slow'])
+
+    def test_sequential_run_stops_when_budget_is_spent(self):
+        tasks = {'slow': self.sleeper(0.2, 'slow'), 'next': lambda: 'next'}
+
+        results, missing = run_tasks(tasks, time_budget=0.1)
+
+        self.assertEqual(results, {'slow': 'slow'})
+        self.assertEqual(missing, ['next'])
+
+
+
+class TestSLAStats(StatisticsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = timezone.now()
+        SLAPolicy.objects.create(tenant=self.tenant, name='Default', resolution_time=timedelta(days=5))
+        SLAPolicy.objects.create(
+            tenant=self.tenant,
+            name='Urgent',
+            priority=self.priorities['Urgent'],
+            resolution_time=timedelta(hours=4),
+        )
+
+    def create_aged_ticket(self, hours_ago, status='Open', priority='Low', resolved_after=None):
+        ticket = self.create_ticket(status=status, priority=priority)
+        self.set_created_at(ticket, self.now - timedelta(hours=hours_ago))
+        if resolved_after is not None:
+            self.add_transition(ticket, 'Open', status, ticket.created_at + timedelta(hours=resolved_after))
+        return ticket
+
+    def test_most_specific_policy_applies(self):
+        urgent = self.create_aged_ticket(10, priority='Urgent')
+        low = self.create_aged_ticket(10, priority='Low')
+
+        rows = {row['id']: row for row in evaluate_sla(Ticket.objects.all(), self.tenant, now=self.now)}
+
+        self.assertEqual(rows[urgent.id]['sla_state'], 'breached')
+        self.assertEqual(rows[low.id]['sla_state'], 'pending')
+        self.assertEqual(rows[low.id]['sla_time_to_breach'], timedelta(days=5) - timedelta(hours=10))
+
+    def test_sla_stats_in_one_query(self):
+        self.create_aged_ticket(2, priority='Urgent')  # pending, 2h left
+        self.create_aged_ticket(6, priority='Urgent')  # open and breached
+        self.create_aged_ticket(48, status='Resolved', resolved_after=24)  # met
+        self.create_aged_ticket(48, status='Closed', priority='Urgent', resolved_after=5)  # breached
+
+        with self.assertNumQueries(2):  # closed status ids + the evaluation
+            stats = get_sla_stats(Ticket.objects.all(), self.tenant, now=self.now)
+
+        self.assertEqual(stats['compliance_percent'], 50.0)
+        self.assertEqual(stats['met'], 1)
+        self.assertEqual(stats['breached'], 2)
+        self.assertEqual(stats['breached_open'], 1)
+        self.assertEqual(stats['pending'], 1)
+        self.assertEqual(stats['min_hours_to_breach'], 2.0)
+
+    def test_fallback_policies_are_unique(self):
+        for fields in ({}, {'priority': self.priorities['Urgent']}):
+            with self.subTest(fields=fields), self.assertRaises(IntegrityError), transaction.atomic():
+                SLAPolicy.objects.create(
+                    tenant=self.tenant, name='Duplicate', resolution_time=timedelta(days=1), **fields
+                )
+
+    def test_default_applies_without_policies(self):
+        SLAPolicy.objects.filter(tenant=self.tenant).delete()
+        self.create_aged_ticket(80)
+
+        stats = get_sla_stats(Ticket.objects.all(), self.tenant, now=self.now)
+
+        self.assertEqual(stats['breached_open'], 1)
+
+
+class TestResolutionStats(StatisticsTestCase):
+    def resolve(self, ticket, hours, status='Resolved'):
+        self.add_transition(ticket, 'Open', status, ticket.created_at + timedelta(hours=hours))
+
+    def test_resolution_stats_from_structured_transitions(self):
+        for hours in range(1, 11):
+            self.resolve(self.create_ticket(status='Resolved'), hours)
+        reopened = self.create_ticket(status='Open')
+        self.resolve(reopened, 100)
+
+        with self.assertNumQueries(2):  # closed status ids + the summary
+            stats = get_resolution_stats(Ticket.objects.all(), self.tenant)
+
+        self.assertEqual(stats, {'count': 10, 'avg_hours': 5.5, 'median_hours': 5.0, 'p90_hours': 9.0})
+
+    def test_first_resolution_counts(self):
+        ticket = self.create_ticket(status='Closed')
+        self.resolve(ticket, 2)
+        self.resolve(ticket, 8, status='Closed')
+
+        stats = get_resolution_stats(Ticket.objects.all(), self.tenant)
+
+        self.assertEqual(stats['avg_hours'], 2.0)
+
+    def test_all_statistics_include_resolution_times(self):
+        self.resolve(self.create_ticket(status='Resolved'), 3)
+
+        stats = get_all_work_item_statistics(self.tenant, Comment, AuditLog, None)
+
+        self.assertFalse(stats['partial'])
+        self.assertEqual(stats['ticket']['resolved'], 1)
+        self.assertEqual(stats['ticket']['avg_resolution_time_hours'], 3.0)
+        self.assertEqual(stats['ticket']['p90_resolution_time_hours'], 3.0)
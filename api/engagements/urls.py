@@ -42,5 +42,6 @@ urlpatterns = [
     
     # Audit logs for work items
     path('audit-logs/', WorkItemAuditViewSet.as_view({'get': 'list'}), name='workitem-audit-list'),
+    path('audit-logs/export/', WorkItemAuditViewSet.as_view({'get': 'export'}), name='workitem-audit-export'),
     path('audit-logs/<uuid:pk>/', WorkItemAuditViewSet.as_view({'get': 'retrieve'}), name='workitem-audit-detail'),
 ]
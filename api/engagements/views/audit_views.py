@@ -7,14 +7,7 @@ class WorkItemAuditViewSet(BaseAuditViewSet):
     Owned by the engagements app.
     """
     
-    def get_queryset(self):
-        """
-        Get audit logs for work items only.
-        Filters by work item entity types.
-        """
-        return super().get_queryset().filter(
-            entity_type__in=['workitem', 'ticket', 'case', 'job']
-        )
+    entity_types = ['workitem', 'ticket', 'case', 'job']
     
     def get_serializer_context(self):
         """Add work item specific context."""
@@ -12,6 +12,7 @@ from engagements.serializers.comment_serializers import (
     CommentSerializer,
     CommentListSerializer,
 )
+from engagements.statistics.cache import invalidate_statistics
 from core.views.base_views import BaseView
 
 
@@ -36,6 +37,7 @@ class CommentListView(BaseView, ListCreateAPIView):
             tenant=self.get_tenant(), created_by=self.get_user()
         )
         self.log_activity(instance, "created", "created")
+        invalidate_statistics(instance.tenant)
 
 
 class CommentDetailView(BaseView, RetrieveUpdateDestroyAPIView):
@@ -55,3 +57,4 @@ class CommentDetailView(BaseView, RetrieveUpdateDestroyAPIView):
     def perform_destroy(self, instance):
         self.log_activity(instance, "deleted", "deleted")
         instance.delete()
+        invalidate_statistics(instance.tenant_id)
@@ -1,6 +1,7 @@
 from rest_framework import generics, permissions
 from rest_framework.response import Response
 from engagements.statistics.main import get_all_work_item_statistics
+from engagements.statistics.cache import get_cached_statistics
 from engagements.models import WorkItem, Comment
 from core.models import AuditLog
 from core.views.base_views import BaseView
@@ -11,5 +12,8 @@ class WorkItemStatisticsView(BaseView, generics.RetrieveAPIView):
 
     def get(self, request, *args, **kwargs):
         tenant = self.get_tenant()
-        stats = get_all_work_item_statistics(tenant, Comment, AuditLog, WorkItem)
+        stats = get_cached_statistics(
+            tenant,
+            lambda: get_all_work_item_statistics(tenant, Comment, AuditLog, WorkItem),
+        )
         return Response(stats) 
\ No newline at end of file
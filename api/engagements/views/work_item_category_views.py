@@ -7,11 +7,12 @@ from engagements.serializers.work_item_category_serializers import (
     WorkItemCategoryCreateSerializer,
     WorkItemCategoryUpdateSerializer,
 )
+from core.mixins import ConditionalGetMixin
 from core.views.base_views import BaseView
 from rest_framework.permissions import IsAuthenticated
 
 
-class WorkItemCategoryViewSet(BaseView, viewsets.ModelViewSet):
+class WorkItemCategoryViewSet(ConditionalGetMixin, BaseView, viewsets.ModelViewSet):
     """ViewSet for managing work item category options."""
     
     model = WorkItemCategory
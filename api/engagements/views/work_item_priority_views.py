@@ -7,11 +7,12 @@ from engagements.serializers.work_item_priority_serializers import (
     WorkItemPriorityCreateSerializer,
     WorkItemPriorityUpdateSerializer,
 )
+from core.mixins import ConditionalGetMixin
 from core.views.base_views import BaseView
 from rest_framework.permissions import IsAuthenticated
 
 
-class WorkItemPriorityViewSet(BaseView, viewsets.ModelViewSet):
+class WorkItemPriorityViewSet(ConditionalGetMixin, BaseView, viewsets.ModelViewSet):
     """ViewSet for managing work item priority options."""
     
     model = WorkItemPriority
@@ -7,11 +7,12 @@ from engagements.serializers.work_item_status_serializers import (
     WorkItemStatusCreateSerializer,
     WorkItemStatusUpdateSerializer,
 )
+from core.mixins import ConditionalGetMixin
 from core.views.base_views import BaseView
 from rest_framework.permissions import IsAuthenticated
 
 
-class WorkItemStatusViewSet(BaseView, viewsets.ModelViewSet):
+class WorkItemStatusViewSet(ConditionalGetMixin, BaseView, viewsets.ModelViewSet):
     """ViewSet for managing work item status options."""
     
     model = WorkItemStatus
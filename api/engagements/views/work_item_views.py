@@ -4,6 +4,8 @@ from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from engagements.models import WorkItem
+from engagements.statistics.cache import invalidate_statistics
+from core.mixins import ConditionalGetMixin
 from core.views.base_views import BaseView
 
 
@@ -18,12 +20,22 @@ class BaseWorkItemView(BaseView):
     def _check_tenant_type(self):
         return self._get_tenant_type() == self.allowed_type
 
-    def _log_activity(self, instance, activity_type, action_text):
+    def _log_activity(self, instance, activity_type, action_text, **kwargs):
         """Log activity for work items."""
-        self.log_activity(instance, activity_type, action_text)
+        self.log_activity(instance, activity_type, action_text, **kwargs)
+
+    def _log_status_change(self, instance, old_status):
+        """Log a structured status transition for time-in-status statistics."""
+        self._log_activity(
+            instance,
+            "status_changed",
+            f'moved from "{old_status}" to "{instance.status}"',
+            old_values={"status": str(old_status.id)},
+            new_values={"status": str(instance.status_id)},
+        )
 
 
-class BaseWorkItemListView(BaseWorkItemView, ListCreateAPIView):
+class BaseWorkItemListView(ConditionalGetMixin, BaseWorkItemView, ListCreateAPIView):
     model = None
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -47,9 +59,10 @@ class BaseWorkItemListView(BaseWorkItemView, ListCreateAPIView):
             tenant=self.get_tenant(), created_by=self.get_user()
         )
         self._log_activity(instance, "created", "created")
+        invalidate_statistics(instance.tenant)
 
 
-class BaseWorkItemDetailView(BaseWorkItemView, RetrieveUpdateDestroyAPIView):
+class BaseWorkItemDetailView(ConditionalGetMixin, BaseWorkItemView, RetrieveUpdateDestroyAPIView):
     model = None
     permission_classes = [IsAuthenticated]
 
@@ -65,9 +78,15 @@ class BaseWorkItemDetailView(BaseWorkItemView, RetrieveUpdateDestroyAPIView):
         if not self._check_tenant_type():
             return  # Optionally raise PermissionDenied
 
-        instance = serializer.save(tenant=self.get_tenant())
+        old_status = serializer.instance.status
+        # updated_by becomes the actor of any status transition this save records
+        instance = serializer.save(tenant=self.get_tenant(), updated_by=self.get_user().id)
         self._log_activity(instance, "updated", "updated")
+        if instance.status_id != old_status.id:
+            self._log_status_change(instance, old_status)
+        invalidate_statistics(instance.tenant)
 
     def perform_destroy(self, instance):
         self._log_activity(instance, "deleted", "deleted")
         instance.delete()
+        invalidate_statistics(instance.tenant_id)
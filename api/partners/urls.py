@@ -25,6 +25,11 @@ urlpatterns = [
         PartnerAuditViewSet.as_view({"get": "list"}),
         name="partner-audit-list",
     ),
+    path(
+        "audit-logs/partners/export/",
+        PartnerAuditViewSet.as_view({"get": "export"}),
+        name="partner-audit-export",
+    ),
     path(
         "audit-logs/partners/<uuid:pk>/",
         PartnerAuditViewSet.as_view({"get": "retrieve"}),
@@ -7,14 +7,7 @@ class PartnerAuditViewSet(BaseAuditViewSet):
     Owned by the relations app.
     """
     
-    def get_queryset(self):
-        """
-        Get audit logs for partners only.
-        Filters by partner entity types.
-        """
-        return super().get_queryset().filter(
-            entity_type__in=['person', 'organization']
-        )
+    entity_types = ['person', 'organization']
     
     def get_serializer_context(self):
         """Add partner specific context."""
@@ -6,9 +6,11 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from partners.models import Partner
 
+from core.mixins import CachedListMixin, ConditionalGetMixin
 from core.views.base_views import BaseView
 
-class PartnerListView(BaseView, ListCreateAPIView):
+class PartnerListView(ConditionalGetMixin, CachedListMixin, BaseView, ListCreateAPIView):
+    cache_region = 'partner_list'
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     
@@ -24,7 +26,7 @@ class PartnerListView(BaseView, ListCreateAPIView):
         self.log_activity(instance, activity_type, action_text)
 
 
-class PartnerDetailView(BaseView, RetrieveUpdateDestroyAPIView):
+class PartnerDetailView(ConditionalGetMixin, BaseView, RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
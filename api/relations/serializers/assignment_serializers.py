@@ -2,7 +2,7 @@ from rest_framework import serializers
 from django.core.exceptions import ObjectDoesNotExist
 from relations.models import Assignment, Relation
 from relations.choices import RelationType, RelationObjectType
-from relations.utilities.assignment_utilities import create_or_get_assignment_relation
+from relations.utilities.assignment_utilities import create_or_get_assignment_relation, add_work_item_assignments
 from users.serializers.user_serializers import UserWithPersonSerializer
 
 
@@ -92,4 +92,27 @@ class AssignmentCreateSerializer(serializers.ModelSerializer):
         validated_data['relation'] = relation
         validated_data['tenant'] = tenant
         validated_data['created_by'] = created_by
-        return super().create(validated_data) 
\ No newline at end of file
+        return super().create(validated_data)
+
+
+class AssignmentBulkCreateSerializer(serializers.Serializer):
+    """Assigns several users to one work item; save() returns the assignments created."""
+    work_item = serializers.UUIDField()
+    users = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+
+    def create(self, validated_data):
+        tenant = self.context.get('tenant')
+        created_by = self.context.get('created_by')
+
+        if not tenant or not created_by:
+            raise serializers.ValidationError('Tenant and created_by must be provided.')
+
+        from engagements.models import WorkItem
+
+        work_item_id = validated_data['work_item']
+        try:
+            work_item = WorkItem.objects.get(id=work_item_id, tenant=tenant)
+        except WorkItem.DoesNotExist:
+            raise serializers.ValidationError(f"Work item with ID {work_item_id} does not exist.")
+
+        return add_work_item_assignments(work_item, validated_data['users'], created_by)
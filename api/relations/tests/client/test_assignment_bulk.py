@@ -0,0 +1,62 @@
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.enums import SystemRole
+from core.models import AuditLog
+from core.tests.factory import RoleFactory, TenantFactory
+from engagements.tests.factory import TicketFactory
+from relations.models import Assignment
+from relations.tests.factory import PersonFactory
+from users.tests.factory import UserFactory
+
+
+class AssignmentBulkCreateTestCase(TestCase):
+    url = '/api/assignments/bulk/'
+
+    def setUp(self):
+        self.tenant = TenantFactory.create()
+        role = RoleFactory.create(self.tenant, None, key=SystemRole.TENANT_EMPLOYEE.value, label='Employee')
+        self.users = []
+        for position in range(3):
+            user = UserFactory.create(self.tenant, username=f'user{position}', email=f'user{position}@example.com')
+            PersonFactory.create(self.tenant, role=role, user=user)
+            self.users.append(user)
+        self.ticket = TicketFactory.create(self.tenant, self.users[0].id)
+        self.client.cookies['access_token'] = str(AccessToken.for_user(self.users[0]))
+
+    def post(self, user_ids):
+        return self.client.post(
+            self.url,
+            {'work_item': str(self.ticket.id), 'users': [str(user_id) for user_id in user_ids]},
+            content_type='application/json',
+        )
+
+    def test_assignments_are_audited_in_one_batch(self):
+        response = self.post([user.id for user in self.users])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()), 3)
+        assignments = Assignment.objects.filter(tenant=self.tenant)
+        logs = AuditLog.objects.filter(activity_type='assigned', entity_type='assignment')
+        self.assertEqual(set(logs.values_list('entity_id', flat=True)), set(assignments.values_list('id', flat=True)))
+        self.assertEqual(logs.count(), 3)
+        self.assertEqual(len(set(logs.values_list('transaction_id', flat=True))), 1)
+
+    def test_already_assigned_users_are_skipped(self):
+        self.post([self.users[0].id])
+
+        response = self.post([user.id for user in self.users])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(Assignment.objects.filter(tenant=self.tenant).count(), 3)
+        self.assertEqual(AuditLog.objects.filter(activity_type='assigned').count(), 3)
+
+    def test_unknown_user_is_rejected(self):
+        other_tenant = TenantFactory.create()
+        outsider = UserFactory.create(other_tenant, username='outsider', email='outsider@example.com')
+
+        response = self.post([self.users[1].id, outsider.id])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(AuditLog.objects.filter(activity_type='assigned').exists())
@@ -3,7 +3,7 @@ from django.urls import path
 
 from relations.views.relation_views import RelationListCreateView, RelationDetailView
 from relations.views.audit_views import RelationAuditViewSet
-from relations.views.assignment_views import AssignmentCreateView
+from relations.views.assignment_views import AssignmentCreateView, AssignmentBulkCreateView
 
 app_name = "relations"
 
@@ -12,7 +12,9 @@ urlpatterns = [
     path("relations/<uuid:pk>/", RelationDetailView.as_view(), name="relation-detail"),
 
     path('assignments/', AssignmentCreateView.as_view(), name='assignment-create'),
+    path('assignments/bulk/', AssignmentBulkCreateView.as_view(), name='assignment-bulk-create'),
 
     path("audit-logs/relations/", RelationAuditViewSet.as_view({'get': 'list'}), name="relation-audit-list"),
+    path("audit-logs/relations/export/", RelationAuditViewSet.as_view({'get': 'export'}), name="relation-audit-export"),
     path("audit-logs/relations/<uuid:pk>/", RelationAuditViewSet.as_view({'get': 'retrieve'}), name="relation-audit-detail"),
 ]
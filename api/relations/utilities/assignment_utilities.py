@@ -1,8 +1,10 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from rest_framework.exceptions import ValidationError
 from relations.models import Assignment, Relation
 from relations.choices import RelationType, RelationObjectType
 from users.models import User
+from core.utilities.response_cache import bump_model_versions
 
 def create_or_get_assignment_relation(person, work_item, tenant, created_by):
     """
@@ -37,8 +39,8 @@ def create_or_get_assignment_relation(person, work_item, tenant, created_by):
         target_type=RelationObjectType.WORKITEM,
         role=role,
         defaults={
-            'created_by': created_by,
-            'updated_by': created_by,
+            'created_by': created_by.id,
+            'updated_by': created_by.id,
         }
     )
     return relation
@@ -57,6 +59,24 @@ def update_work_item_assignments(work_item, new_user_ids, created_by_user):
     if users_to_add:
         _add_assignments(work_item, users_to_add, created_by_user)
 
+def add_work_item_assignments(work_item, user_ids, created_by_user):
+    """
+    Assign the users in user_ids that are not assigned to the work item yet.
+
+    Returns the assignments created.
+    """
+    assigned_user_ids = set(
+        Assignment.objects.filter(
+            relation__target_workitem=work_item,
+            relation__role__key=RelationType.ASSIGNED_TO,
+        ).values_list('relation__source_partner__user__id', flat=True)
+    )
+    users_to_add = set(user_ids) - assigned_user_ids
+
+    if users_to_add:
+        return _add_assignments(work_item, users_to_add, created_by_user)
+    return []
+
 def _remove_assignments(work_item, user_ids):
     from core.models import Role
     
@@ -111,9 +131,12 @@ def _add_assignments(work_item, user_ids, created_by_user):
         assignment = Assignment(
             tenant=tenant,
             relation=relation,
-            created_by=created_by_user,
-            updated_by=created_by_user
+            created_by=created_by_user.id,
+            updated_by=created_by_user.id
         )
         assignments.append(assignment)
     
-    Assignment.objects.bulk_create(assignments)
+    created = Assignment.objects.bulk_create(assignments)
+    # bulk_create sends no post_save, so cached work item responses are invalidated here
+    transaction.on_commit(lambda: bump_model_versions(tenant.id, [Assignment._meta.label]))
+    return created
@@ -1,10 +1,10 @@
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.generics import CreateAPIView
-from rest_framework import serializers
+from rest_framework import serializers, status
 from rest_framework.response import Response
 
 from relations.models import Assignment
-from relations.serializers.assignment_serializers import AssignmentSerializer, AssignmentCreateSerializer
+from relations.serializers.assignment_serializers import AssignmentSerializer, AssignmentCreateSerializer, AssignmentBulkCreateSerializer
 from core.views.base_views import BaseView
 
 
@@ -27,4 +27,29 @@ class AssignmentCreateView(BaseView, CreateAPIView):
     def perform_create(self, serializer):
         """Create the assignment and log the activity."""
         instance = serializer.save()
-        self.log_activity(instance, 'assigned', 'assigned')
\ No newline at end of file
+        self.log_activity(instance, 'assigned', 'assigned')
+
+
+class AssignmentBulkCreateView(BaseView, CreateAPIView):
+    """Assign several users to a work item and audit them in one batch."""
+    serializer_class = AssignmentBulkCreateSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_serializer_context(self):
+        """Add tenant and created_by to serializer context."""
+        context = super().get_serializer_context()
+        context['tenant'] = self.get_tenant()
+        context['created_by'] = self.get_user()
+        return context
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        assignments = self.perform_create(serializer)
+        return Response(AssignmentSerializer(assignments, many=True).data, status=status.HTTP_201_CREATED)
+
+    def perform_create(self, serializer):
+        """Create the assignments and log them with one bulk insert."""
+        assignments = serializer.save()
+        self.log_activity_bulk(assignments, 'assigned', 'assigned')
+        return assignments
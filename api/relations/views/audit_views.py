@@ -6,13 +6,7 @@ class RelationAuditViewSet(BaseAuditViewSet):
     Owned by the relations app.
     """
     
-    def get_queryset(self):
-        """
-        Get audit logs for relations only.
-        """
-        return super().get_queryset().filter(
-            entity_type='relation'
-        )
+    entity_types = ['relation']
     
     def get_serializer_context(self):
         """Add relation specific context."""
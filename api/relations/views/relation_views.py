@@ -2,10 +2,12 @@ from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
 from relations.models import Relation
 from relations.serializers.relation_serializers import RelationSerializer
+from core.mixins import CachedListMixin
 from core.views.base_views import BaseView
 
 
-class RelationListCreateView(BaseView, generics.ListCreateAPIView):
+class RelationListCreateView(CachedListMixin, BaseView, generics.ListCreateAPIView):
+    cache_region = 'relation_list'
     serializer_class = RelationSerializer
     permission_classes = [IsAuthenticated]
 
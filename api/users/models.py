@@ -19,6 +19,9 @@ class User(AbstractUser, AuditModel):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    # Credentials and login bookkeeping stay out of audit diffs
+    untracked_fields = ("password", "last_login")
+
     objects = UserManager()
 
     def __str__(self):